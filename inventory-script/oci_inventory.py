@@ -26,12 +26,15 @@ usage: oci_inventory.py [-h] [--list] [--host HOST] [-config CONFIG_FILE]
                         [--debug] [--auth {api_key,instance_principal}]
                         [--enable-parallel-processing]
                         [--max-thread-count MAX_THREAD_COUNT]
+                        [--max-thread-count-per-region MAX_THREAD_COUNT_PER_REGION]
                         [--freeform-tags FREEFORM_TAGS]
                         [--defined-tags DEFINED_TAGS] [--regions REGIONS]
                         [--exclude-regions EXCLUDE_REGIONS]
                         [--hostname-format {fqdn,private_ip,public_ip}]
                         [--strict-hostname-checking {yes,no}]
                         [--primary-vnic-only {yes,no}]
+                        [--incremental-refresh {yes,no}]
+                        [--compact-output {yes,no}]
 
 Produce an Ansible Inventory file based on OCI
 
@@ -87,6 +90,13 @@ optional arguments:
                         specifies the maximum number of threads to use.
                         Defaults to 50. This value can also be provided in the
                         settings config file.
+  --max-thread-count-per-region MAX_THREAD_COUNT_PER_REGION
+                        Only valid when --enable-parallel-processing is set.
+                        The threads are shared by all the regions. This option
+                        specifies the maximum number of threads making
+                        requests to any one region. Defaults to the value of
+                        max-thread-count. This value can also be provided in
+                        the settings config file.
   --freeform-tags FREEFORM_TAGS
                         Freeform tags provided as a string in valid JSON
                         format. Example: { "stage": "dev", "app": "demo"} Use
@@ -118,6 +128,15 @@ optional arguments:
                         The default behavior of this script is to list all VNIC's
                         attached to a host as separate inventory items. When set
                         to yes, the script will only report each instance once.
+  --incremental-refresh {yes,no}
+                        When set to yes and the cache is outdated, only the
+                        instances which were added, removed or changed since
+                        the cache was written are looked up again, instead of
+                        rebuilding the whole inventory.
+  --compact-output {yes,no}
+                        When set to yes, the inventory is printed as compact
+                        JSON, without indentation and without sorting the
+                        keys. This is much faster for large inventories.
 
 The script reads following environment variables:
 OCI_CONFIG_FILE,
@@ -138,6 +157,8 @@ OCI_INVENTORY_EXCLUDE_REGIONS
 OCI_COMPARTMENT_OCID
 OCI_STRICT_HOSTNAME_CHECKING
 OCI_PRIMARY_VNIC_ONLY
+OCI_INVENTORY_INCREMENTAL_REFRESH
+OCI_INVENTORY_COMPACT_OUTPUT
 
 The inventory generated is by default grouped by each of the following:
 region
@@ -215,9 +236,16 @@ from collections import deque, defaultdict
 from multiprocessing.pool import ThreadPool
 from contextlib import contextmanager
 import hashlib
-from functools import partial
+import threading
 import traceback
 
+try:
+    import sqlite3
+
+    HAS_SQLITE3 = True
+except ImportError:
+    HAS_SQLITE3 = False
+
 try:
     import oci
     from oci.retry import RetryStrategyBuilder
@@ -294,6 +322,25 @@ class OCIInventory:
         self._regions = None
         self._region_short_names = None
         self._region_long_names = None
+        # Clients are only created when needed, so that an inventory read from the cache makes no API call.
+        self._identity_client = None
+        self._compute_clients = {}
+        self._virtual_nw_clients = {}
+        self._client_lock = threading.Lock()
+        # Subnets and VCNs are shared by many hosts, so they are listed once per compartment and memoised per region.
+        self._network_resources = {}
+        self._network_resource_compartments = set()
+        # Locks keyed by (region, resource type, compartment or resource id). See _get_network_resource_lock.
+        self._network_resource_locks = {}
+        self._network_resource_locks_lock = threading.Lock()
+        # VNICs resolved in bulk, keyed by instance id. See resolve_vnics.
+        self._instance_vnics = {}
+        # Per-instance inventories read from the cache for an incremental refresh. See get_changed_instances.
+        self.instance_records = None
+        self.new_instance_records = {}
+        # Time of the last full build of the inventory, kept in the instance records cache across incremental
+        # refreshes. See read_instance_records_from_cache.
+        self.full_build_time = None
         self.params = {
             "ini_file": os.path.join(
                 to_bytes(os.path.dirname(os.path.realpath(__file__))),
@@ -321,12 +368,16 @@ class OCIInventory:
             "auth": "api_key",
             "enable_parallel_processing": False,
             "max_thread_count": 50,
+            "max_thread_count_per_region": None,
             "freeform_tags": None,
             "defined_tags": None,
             "regions": None,
             "exclude_regions": None,
             "strict_hostname_checking": "no",
             "primary_vnic_only": "no",
+            "incremental_refresh": "no",
+            "incremental_refresh_max_age": 7200,
+            "compact_output": "no",
         }
         boolean_options = [
             "sanitize_names",
@@ -378,7 +429,6 @@ class OCIInventory:
             self.read_env_vars()
             self.read_cli_args(dict_options)
 
-            self.identity_client = self.create_service_client(IdentityClient)
             # For the case, when auth="instance_principal", tenancy_id & region name are not available.
             if self.params["auth"] == "instance_principal":
                 # self.params.update(self.get_instance_details_from_metadata())
@@ -390,41 +440,45 @@ class OCIInventory:
             self.log("Using following parameters for OCI dynamic inventory:")
             self.log(self.params)
 
-            self._compute_clients = dict(
-                (region, self.create_service_client(ComputeClient, region=region))
-                for region in self.regions
-            )
-
-            self._virtual_nw_clients = dict(
-                (
-                    region,
-                    self.create_service_client(VirtualNetworkClient, region=region),
-                )
-                for region in self.regions
-            )
-
             self.params["cache_file"] = self._get_cache_file()
 
             if not self.args.refresh_cache and self.is_cache_valid():
-                self.log(
-                    "Reading inventory from cache {0}.".format(
-                        self.params["cache_file"]
+                if self.args.host and self.is_hostvars_cache_valid():
+                    # Only the variables of the given host are needed, so look them up in the host index instead
+                    # of reading the whole inventory.
+                    self.log(
+                        "Reading host {0} from cache {1}.".format(
+                            self.args.host, self._get_hostvars_cache_file()
+                        )
                     )
-                )
-                self.inventory = self.read_from_cache()
+                    self.inventory = None
+                else:
+                    self.log(
+                        "Reading inventory from cache {0}.".format(
+                            self.params["cache_file"]
+                        )
+                    )
+                    self.inventory = self.read_from_cache()
             else:
+                self.validate_regions()
+                if (
+                    not self.args.refresh_cache
+                    and self.params["incremental_refresh"] == "yes"
+                ):
+                    self.instance_records = self.read_instance_records_from_cache()
                 self.build_inventory()
                 self.write_to_cache(self.inventory)
+                # The inventory built for --host only has the hosts matching the given host name.
+                if self.params["incremental_refresh"] == "yes" and not self.args.host:
+                    self.write_instance_records_to_cache(self.new_instance_records)
 
             if self.args.host:
-                if self.args.host in self.inventory["_meta"]["hostvars"]:
-                    print(
-                        json.dumps(
-                            self.inventory["_meta"]["hostvars"][self.args.host],
-                            sort_keys=True,
-                            indent=2,
-                        )
-                    )
+                if self.inventory is None:
+                    host_vars = self.read_hostvars_from_cache(self.args.host)
+                else:
+                    host_vars = self.inventory["_meta"]["hostvars"].get(self.args.host)
+                if host_vars is not None:
+                    print(self.to_json(host_vars))
                 else:
                     self.log(
                         "Either the specified host does not exist or its facts cannot be retrieved."
@@ -432,7 +486,7 @@ class OCIInventory:
                     print({})
 
             else:
-                print(json.dumps(self.inventory, sort_keys=True, indent=2))
+                print(self.to_json(self.inventory))
 
         except Exception as ex:
             stacktrace = traceback.format_exc()
@@ -514,19 +568,36 @@ class OCIInventory:
             )
         return self._region_long_names
 
+    @property
+    def identity_client(self):
+        with self._client_lock:
+            if self._identity_client is None:
+                self._identity_client = self.create_service_client(IdentityClient)
+            return self._identity_client
+
+    def _get_client_for_region(self, clients, service_client_class, region):
+        with self._client_lock:
+            if region not in clients:
+                clients[region] = self.create_service_client(
+                    service_client_class, region=region
+                )
+            return clients[region]
+
     def get_compute_client_for_region(self, region):
-        if region not in self._compute_clients:
+        if region not in self.regions:
             raise ValueError(
                 "Could not fetch the compute client for region {0}.".format(region)
             )
-        return self._compute_clients[region]
+        return self._get_client_for_region(self._compute_clients, ComputeClient, region)
 
     def get_virtual_nw_client_for_region(self, region):
-        if region not in self._compute_clients:
+        if region not in self.regions:
             raise ValueError(
                 "Could not fetch the virtual network for region {0}.".format(region)
             )
-        return self._virtual_nw_clients[region]
+        return self._get_client_for_region(
+            self._virtual_nw_clients, VirtualNetworkClient, region
+        )
 
     def log(self, *args, **kwargs):
         if self.params["debug"]:
@@ -593,6 +664,9 @@ class OCIInventory:
             OCI_COMPARTMENT_OCID="compartment_ocid",
             OCI_STRICT_HOSTNAME_CHECKING="strict_hostname_checking",
             OCI_PRIMARY_VNIC_ONLY="primary_vnic_only",
+            OCI_INVENTORY_INCREMENTAL_REFRESH="incremental_refresh",
+            OCI_INVENTORY_INCREMENTAL_REFRESH_MAX_AGE="incremental_refresh_max_age",
+            OCI_INVENTORY_COMPACT_OUTPUT="compact_output",
         )
 
         for env_var in os.environ:
@@ -613,6 +687,10 @@ class OCIInventory:
         """Validate the parameters passed."""
         if not self.params["tenancy"] and self.params["auth"] != "instance_principal":
             self.fail("Tenany OCID required.")
+
+    def validate_regions(self):
+        """Validate the regions passed. This needs the region subscriptions, so it is only done before building the
+        inventory, not when it is read from the cache."""
         if self.params["regions"]:
             # Check if the regions passed are valid
             subscribed_regions = [
@@ -630,7 +708,7 @@ class OCIInventory:
         params_str = u""
         if self.params["tenancy"]:
             params_str += u"@{0}:{1}@".format("tenancy", self.params["tenancy"])
-        params_str += u"@{0}:{1}@".format("regions", ",".join(sorted(self.regions)))
+        params_str += u"@{0}:{1}@".format("regions", self._get_regions_cache_key())
         if self.params["compartment_ocid"]:
             params_str += u"@{0}:{1}@".format(
                 "compartment", self.params["compartment_ocid"]
@@ -677,6 +755,18 @@ class OCIInventory:
             to_bytes("ansible-oci-{0}.cache".format(hashed_params_str)),
         )
 
+    def _get_regions_cache_key(self):
+        # Listing the regions for regions=all needs the region subscriptions of the tenancy, so use the settings in the
+        # cache key instead. A cached inventory can then be found without any API call.
+        if self.params["regions"] != "all":
+            return ",".join(sorted(self.regions))
+        regions_key = u"all"
+        if self.params["exclude_regions"]:
+            regions_key += u"-" + ",".join(
+                sorted(self.params["exclude_regions"].split(","))
+            )
+        return regions_key
+
     def is_cache_valid(self):
         if os.path.isfile(to_bytes(self.params["cache_file"])):
             mod_time = os.path.getmtime(to_bytes(self.params["cache_file"]))
@@ -694,9 +784,124 @@ class OCIInventory:
             return json.loads(cache.read())
 
     def write_to_cache(self, data):
-        json_data = json.dumps(data, sort_keys=True, indent=2)
+        json_data = json.dumps(data, separators=(",", ":"))
         with open(to_bytes(self.params["cache_file"]), "w") as f:
             f.write(json_data)
+        self.write_hostvars_to_cache(data["_meta"]["hostvars"])
+
+    def to_json(self, data):
+        if self.params["compact_output"] == "yes":
+            return json.dumps(data, separators=(",", ":"))
+        return json.dumps(data, sort_keys=True, indent=2)
+
+    def _get_hostvars_cache_file(self):
+        return to_bytes(self.params["cache_file"]) + to_bytes(".hostvars")
+
+    def is_hostvars_cache_valid(self):
+        # The host index is written right after the cache file. An older index belongs to a previous inventory.
+        hostvars_cache_file = self._get_hostvars_cache_file()
+        if not HAS_SQLITE3 or not os.path.isfile(hostvars_cache_file):
+            self.log("Host index cache file is invalid.")
+            return False
+        if os.path.getmtime(hostvars_cache_file) < os.path.getmtime(
+            to_bytes(self.params["cache_file"])
+        ):
+            self.log("Host index cache is outdated.")
+            return False
+        return True
+
+    def read_hostvars_from_cache(self, host):
+        """Return the variables of host from the host index, or None if the host is not in the inventory."""
+        try:
+            connection = sqlite3.connect(to_text(self._get_hostvars_cache_file()))
+            try:
+                row = connection.execute(
+                    "SELECT hostvars FROM hostvars WHERE host = ?", (to_text(host),)
+                ).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error as ex:
+            self.log("Could not read the host index cache: {0}".format(ex))
+            return self.read_from_cache()["_meta"]["hostvars"].get(host)
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def write_hostvars_to_cache(self, hostvars):
+        """Write an index of the variables of each host, so that --host does not have to read the whole cache."""
+        if not HAS_SQLITE3:
+            return
+        hostvars_cache_file = self._get_hostvars_cache_file()
+        # Build the index in a temporary file and move it into place, so that concurrent --host invocations never
+        # see a partially written index.
+        tmp_hostvars_cache_file = hostvars_cache_file + to_bytes(
+            ".{0}.tmp".format(os.getpid())
+        )
+        try:
+            connection = sqlite3.connect(to_text(tmp_hostvars_cache_file))
+            try:
+                connection.execute(
+                    "CREATE TABLE hostvars (host TEXT PRIMARY KEY, hostvars TEXT)"
+                )
+                connection.executemany(
+                    "INSERT INTO hostvars VALUES (?, ?)",
+                    (
+                        (to_text(host), json.dumps(host_vars, separators=(",", ":")))
+                        for host, host_vars in six.iteritems(hostvars)
+                    ),
+                )
+                connection.commit()
+            finally:
+                connection.close()
+            os.rename(tmp_hostvars_cache_file, hostvars_cache_file)
+        except (sqlite3.Error, OSError) as ex:
+            self.log("Could not write the host index cache: {0}".format(ex))
+            if os.path.isfile(tmp_hostvars_cache_file):
+                os.remove(tmp_hostvars_cache_file)
+
+    def _get_instance_records_cache_file(self):
+        return to_bytes(self.params["cache_file"]) + to_bytes(".instances")
+
+    def read_instance_records_from_cache(self):
+        """Return the per-instance records written by the last inventory build, or None if there are none or if the
+        inventory was last built in full more than incremental_refresh_max_age seconds ago. Each incremental refresh
+        rewrites the records, so the time of the last full build is kept along with them.
+        """
+        instance_records_cache_file = self._get_instance_records_cache_file()
+        if not os.path.isfile(instance_records_cache_file):
+            self.log("Instance records cache file is invalid.")
+            return None
+        try:
+            with open(instance_records_cache_file, "r") as cache:
+                cached_records = json.loads(cache.read())
+        except ValueError as ex:
+            self.log("Could not read the instance records cache: {0}".format(ex))
+            return None
+        if (
+            "full_build_time" not in cached_records
+            or (
+                cached_records["full_build_time"]
+                + float(self.params["incremental_refresh_max_age"])
+            )
+            <= time()
+        ):
+            self.log("Instance records cache is outdated, rebuilding the inventory.")
+            return None
+        self.full_build_time = cached_records["full_build_time"]
+        return cached_records["instance_records"]
+
+    def write_instance_records_to_cache(self, instance_records):
+        if self.instance_records is None:
+            self.full_build_time = time()
+        with open(self._get_instance_records_cache_file(), "w") as f:
+            f.write(
+                json.dumps(
+                    dict(
+                        full_build_time=self.full_build_time,
+                        instance_records=instance_records,
+                    )
+                )
+            )
 
     @property
     def region_subscriptions(self):
@@ -840,29 +1045,98 @@ class OCIInventory:
         if not fetch_hosts_from_subcompartments:
             return [compartment_with_name]
 
-        return self.get_sub_compartments(compartment_with_name)
+        return self.get_sub_compartments(
+            compartment_with_name, compartments_in_tenancy=all_compartments[1:]
+        )
 
-    def get_sub_compartments(self, root):
-        # OCI SDK does not support fetching sub-compartments for non root compartments
-        # So traverse the compartment tree to fetch all the sub compartments
-        compartments = []
-        queue = deque()
-        queue.append(root)
-        while len(queue) > 0:
-            parent_compartment = queue.popleft()
-            compartments.append(parent_compartment)
-            child_compartments = [
+    def get_sub_compartments(self, root, compartments_in_tenancy=None):
+        """Return the given compartment and all its ACTIVE sub-compartments.
+
+        :param root: The compartment whose hierarchy is to be returned
+        :param compartments_in_tenancy: (optional) ACTIVE compartments of the tenancy, listed with
+            compartment_id_in_subtree. When available, or when root is the tenancy and they can be listed with a
+            single call, the hierarchy is built from this listing instead of traversing the tree.
+        :return: list of :class:`~oci.identity.models.Compartment`
+        """
+        if compartments_in_tenancy is None and self.is_root_compartment(root):
+            compartments_in_tenancy = [
                 compartment
                 for compartment in list_all_resources(
                     target_fn=self.identity_client.list_compartments,
-                    compartment_id=parent_compartment.id,
+                    compartment_id=root.id,
+                    compartment_id_in_subtree=True,
                 )
                 if self.filter_resource(
                     compartment, lifecycle_state=self.LIFECYCLE_ACTIVE_STATE
                 )
             ]
-            for child_compartment in child_compartments:
-                queue.append(child_compartment)
+        if compartments_in_tenancy is not None:
+            return self.get_sub_compartments_from_listing(root, compartments_in_tenancy)
+        # OCI SDK does not support fetching sub-compartments for non root compartments
+        # So traverse the compartment tree to fetch all the sub compartments. The compartments of each level of the
+        # tree are expanded concurrently when parallel processing is enabled.
+        compartments = []
+        level = [root]
+        while level:
+            compartments.extend(level)
+            if self.params["enable_parallel_processing"]:
+                num_threads = min(len(level), int(self.params["max_thread_count"]))
+                self.log(
+                    "Parallel processing enabled. Getting sub-compartments of {0} compartments in {1} threads.".format(
+                        len(level), num_threads
+                    )
+                )
+                with self.pool(processes=num_threads) as pool:
+                    lists_of_child_compartments = pool.map(
+                        self.get_child_compartments, level
+                    )
+            else:
+                lists_of_child_compartments = [
+                    self.get_child_compartments(parent_compartment)
+                    for parent_compartment in level
+                ]
+            level = [
+                child_compartment
+                for child_compartments in lists_of_child_compartments
+                for child_compartment in child_compartments
+            ]
+        return compartments
+
+    def is_root_compartment(self, compartment):
+        return compartment.id == self.params["tenancy"] or compartment.id.startswith(
+            "ocid1.tenancy."
+        )
+
+    def get_child_compartments(self, parent_compartment):
+        return [
+            compartment
+            for compartment in list_all_resources(
+                target_fn=self.identity_client.list_compartments,
+                compartment_id=parent_compartment.id,
+            )
+            if self.filter_resource(
+                compartment, lifecycle_state=self.LIFECYCLE_ACTIVE_STATE
+            )
+        ]
+
+    @staticmethod
+    def get_sub_compartments_from_listing(root, compartments_in_tenancy):
+        """Return root and its sub-compartments from a listing of the compartments of the tenancy.
+
+        The compartments are indexed by their parent and the tree is walked breadth first, so the sub-compartments of
+        a compartment which is not in the listing are left out, in the same way as when the tree is traversed level by
+        level.
+        """
+        child_compartments_by_parent = defaultdict(list)
+        for compartment in compartments_in_tenancy:
+            child_compartments_by_parent[compartment.compartment_id].append(compartment)
+        compartments = []
+        queue = deque()
+        queue.append(root)
+        while len(queue) > 0:
+            parent_compartment = queue.popleft()
+            compartments.append(parent_compartment)
+            queue.extend(child_compartments_by_parent[parent_compartment.id])
         return compartments
 
     @staticmethod
@@ -880,33 +1154,14 @@ class OCIInventory:
         """
         instances = defaultdict(list)
 
-        if self.params["enable_parallel_processing"]:
-            for region in self.regions:
-                num_threads = min(
-                    len(compartment_ocids), self.params["max_thread_count"]
-                )
-                self.log(
-                    "Parallel processing enabled. Getting instances from {0} in {1} threads.".format(
-                        region, num_threads
-                    )
-                )
-
-                with self.pool(processes=num_threads) as pool:
-                    get_filtered_instances_for_region = partial(
-                        self.get_filtered_instances, region=region
-                    )
-                    lists_of_instances = pool.map(
-                        get_filtered_instances_for_region, compartment_ocids
-                    )
-                for sublist in lists_of_instances:
-                    instances[region].extend(sublist)
-
-        else:
-            for region in self.regions:
-                for compartment_ocid in compartment_ocids:
-                    instances[region].extend(
-                        self.get_filtered_instances(compartment_ocid, region)
-                    )
+        lists_of_instances_by_region = self.map_by_region(
+            self.get_filtered_instances,
+            dict((region, list(compartment_ocids)) for region in self.regions),
+            description="Getting instances",
+        )
+        for region in self.regions:
+            for sublist in lists_of_instances_by_region[region]:
+                instances[region].extend(sublist)
 
         return instances
 
@@ -967,15 +1222,216 @@ class OCIInventory:
             self.log(ex)
             return []
 
-    def get_host_name(self, vnic, region):
+    def _get_network_resource(self, resource_type, resource_id, compartment_id, region):
+        """Return the subnet or vcn with the given id from the per-region cache.
+
+        On a cache miss, all the resources of that type in the compartment are listed and cached, so that the number
+        of network API calls depends on the number of subnets and vcns rather than on the number of hosts. Resources
+        which live in a different compartment are fetched once and their compartment is then cached as well.
+        """
+        key = (region, resource_type, resource_id)
+        if key in self._network_resources:
+            return self._network_resources[key]
+        self._cache_network_resources(resource_type, compartment_id, region)
+        if key not in self._network_resources:
+            with self._get_network_resource_lock(key):
+                if key not in self._network_resources:
+                    virtual_nw_client = self.get_virtual_nw_client_for_region(region)
+                    resource = call_with_backoff(
+                        getattr(virtual_nw_client, "get_" + resource_type),
+                        **{resource_type + "_id": resource_id}
+                    ).data
+                    self._network_resources[key] = resource
+            self._cache_network_resources(
+                resource_type, self._network_resources[key].compartment_id, region
+            )
+        return self._network_resources[key]
+
+    def _get_network_resource_lock(self, key):
+        """Return the lock serialising the lookups of key, so that the threads which need the same resources wait for
+        a single listing while the lookups of other regions, resource types and compartments run in parallel.
+        """
+        with self._network_resource_locks_lock:
+            return self._network_resource_locks.setdefault(key, threading.Lock())
+
+    def _cache_network_resources(self, resource_type, compartment_id, region):
+        """List all the subnets or vcns of a compartment into the per-region cache, once."""
+        key = (region, resource_type, compartment_id)
+        if key in self._network_resource_compartments:
+            return
+        with self._get_network_resource_lock(key):
+            if key in self._network_resource_compartments:
+                return
+            self._list_network_resources(resource_type, compartment_id, region)
+            self._network_resource_compartments.add(key)
+
+    def _list_network_resources(self, resource_type, compartment_id, region):
+        """List all the subnets or vcns of a compartment into the per-region cache. Callers must hold the lock of the
+        compartment."""
         virtual_nw_client = self.get_virtual_nw_client_for_region(region)
-        if self.params["hostname_format"] == "fqdn":
-            subnet = call_with_backoff(
-                virtual_nw_client.get_subnet, subnet_id=vnic.subnet_id
-            ).data
-            vcn = call_with_backoff(
-                virtual_nw_client.get_vcn, vcn_id=subnet.vcn_id
+        self.log(
+            "Caching all {0}s from compartment: {1} and region: {2}".format(
+                resource_type, compartment_id, region
+            )
+        )
+        try:
+            resources = list_all_resources(
+                target_fn=getattr(virtual_nw_client, "list_" + resource_type + "s"),
+                compartment_id=compartment_id,
+            )
+        except ServiceError as ex:
+            if ex.status == 401:
+                raise
+            self.log(ex)
+            return
+        for resource in resources:
+            self._network_resources[(region, resource_type, resource.id)] = resource
+
+    def get_subnet(self, subnet_id, compartment_id, region):
+        return self._get_network_resource("subnet", subnet_id, compartment_id, region)
+
+    def get_vcn(self, vcn_id, compartment_id, region):
+        return self._get_network_resource("vcn", vcn_id, compartment_id, region)
+
+    def get_vnic_attachments_by_instance(self, compartment_ocid, region):
+        """Return the ATTACHED vnic attachments of a compartment indexed by instance id, using a single listing.
+        None is returned when the vnic attachments of the compartment could not be listed.
+        """
+        try:
+            compute_client = self.get_compute_client_for_region(region)
+            self.log(
+                "Listing all vnic attachments from compartment: {0} and region: {1}".format(
+                    compartment_ocid, region
+                )
+            )
+            vnic_attachments_by_instance = defaultdict(list)
+            for vnic_attachment in list_all_resources(
+                target_fn=compute_client.list_vnic_attachments,
+                compartment_id=compartment_ocid,
+            ):
+                if self.filter_resource(
+                    vnic_attachment, lifecycle_state=self.LIFECYCLE_ATTACHED_STATE
+                ):
+                    vnic_attachments_by_instance[vnic_attachment.instance_id].append(
+                        vnic_attachment
+                    )
+            return vnic_attachments_by_instance
+        except ServiceError as ex:
+            if ex.status == 401:
+                self.log(ex)
+                raise
+            self.log(ex)
+            return None
+
+    def get_attached_vnic(self, vnic_attachment, region):
+        try:
+            virtual_nw_client = self.get_virtual_nw_client_for_region(region)
+            return call_with_backoff(
+                virtual_nw_client.get_vnic, vnic_id=vnic_attachment.vnic_id
             ).data
+        except ServiceError as ex:
+            if ex.status == 401:
+                self.log(ex)
+                raise
+            self.log(ex)
+            return None
+
+    def resolve_vnics(self, instances_by_region):
+        """Resolve the VNICs of all the instances in bulk.
+
+        The vnic attachments are listed once per compartment and region and indexed by instance id, instead of
+        listing the attachments of every instance separately. The VNICs are then fetched concurrently when parallel
+        processing is enabled. Instances whose VNICs could not all be resolved are left out, so that
+        build_inventory_for_instance looks them up individually.
+        """
+        self._instance_vnics = {}
+        compartment_ocids_by_region = dict(
+            (
+                region,
+                sorted(set(instance.compartment_id for instance in instances)),
+            )
+            for region, instances in six.iteritems(instances_by_region)
+        )
+        indexes_by_region = self.map_by_region(
+            self.get_vnic_attachments_by_instance,
+            compartment_ocids_by_region,
+            description="Listing vnic attachments",
+        )
+
+        vnic_attachments_by_region = {}
+        for region, instances in six.iteritems(instances_by_region):
+            instance_ids = set(instance.id for instance in instances)
+            indexes = indexes_by_region[region]
+            listed_compartment_ocids = set(
+                compartment_ocid
+                for compartment_ocid, index in zip(
+                    compartment_ocids_by_region[region], indexes
+                )
+                if index is not None
+            )
+            for instance in instances:
+                if instance.compartment_id in listed_compartment_ocids:
+                    self._instance_vnics[instance.id] = []
+
+            vnic_attachments_by_region[region] = [
+                vnic_attachment
+                for index in indexes
+                if index
+                for instance_id in index
+                if instance_id in instance_ids
+                for vnic_attachment in index[instance_id]
+            ]
+
+        vnics_by_region = self.map_by_region(
+            self.get_attached_vnic,
+            vnic_attachments_by_region,
+            description="Getting VNICs",
+        )
+
+        unresolved_instance_ids = set()
+        for region in vnic_attachments_by_region:
+            for vnic_attachment, vnic in zip(
+                vnic_attachments_by_region[region], vnics_by_region[region]
+            ):
+                if vnic is None:
+                    unresolved_instance_ids.add(vnic_attachment.instance_id)
+                self._instance_vnics[vnic_attachment.instance_id].append(
+                    (vnic_attachment, vnic)
+                )
+        for instance_id in unresolved_instance_ids:
+            del self._instance_vnics[instance_id]
+
+    def get_instance_vnics(self, instance, region):
+        """Return (vnic_attachment, vnic) pairs of the VNICs attached to the instance."""
+        if instance.id in self._instance_vnics:
+            return self._instance_vnics[instance.id]
+        compute_client = self.get_compute_client_for_region(region)
+        virtual_nw_client = self.get_virtual_nw_client_for_region(region)
+        vnic_attachments = [
+            vnic_attachment
+            for vnic_attachment in list_all_resources(
+                target_fn=compute_client.list_vnic_attachments,
+                compartment_id=instance.compartment_id,
+                instance_id=instance.id,
+            )
+            if self.filter_resource(
+                vnic_attachment, lifecycle_state=self.LIFECYCLE_ATTACHED_STATE
+            )
+        ]
+        return [
+            (
+                vnic_attachment,
+                call_with_backoff(
+                    virtual_nw_client.get_vnic, vnic_id=vnic_attachment.vnic_id
+                ).data,
+            )
+            for vnic_attachment in vnic_attachments
+        ]
+
+    def get_host_name(self, vnic, region):
+        if self.params["hostname_format"] == "fqdn":
+            subnet = self.get_subnet(vnic.subnet_id, vnic.compartment_id, region)
+            vcn = self.get_vcn(subnet.vcn_id, subnet.compartment_id, region)
 
             values = [
                 vnic.hostname_label,
@@ -996,13 +1452,58 @@ class OCIInventory:
         self.log("Public IP for VNIC: {0} is {1}.".format(vnic.id, vnic.public_ip))
         return vnic.public_ip
 
+    @staticmethod
+    def get_instance_fingerprint(instance):
+        """Return a digest of an instance as returned by list_instances. The digest changes whenever any attribute
+        of the instance, including its lifecycle state and tags, changes."""
+        return hashlib.md5(
+            to_bytes(json.dumps(to_dict(instance), sort_keys=True, default=str))
+        ).hexdigest()
+
+    def get_changed_instances(self, instances_by_region):
+        """Split the instances into the ones which need to be looked up again and the ones whose inventory can be
+        reused from the cached instance records.
+
+        Instances which are no longer returned by list_instances are dropped along with their records.
+
+        :param instances_by_region: dict with region as key and list of instances of the region as value
+        :return: tuple of the dict of added or changed instances by region, and the dict of the reused instance
+            records by instance id
+        """
+        changed_instances_by_region = defaultdict(list)
+        unchanged_instance_records = {}
+        for region in instances_by_region:
+            for instance in instances_by_region[region]:
+                instance_record = self.instance_records.get(instance.id)
+                if (
+                    instance_record
+                    and instance_record["region"] == region
+                    and instance_record["fingerprint"]
+                    == self.get_instance_fingerprint(instance)
+                ):
+                    unchanged_instance_records[instance.id] = instance_record
+                else:
+                    changed_instances_by_region[region].append(instance)
+        instance_ids = set(
+            instance.id
+            for region in instances_by_region
+            for instance in instances_by_region[region]
+        )
+        self.log(
+            "Incremental refresh: reusing {0} cached instances, looking up {1} added or changed instances and "
+            "dropping {2} removed instances.".format(
+                len(unchanged_instance_records),
+                len(instance_ids) - len(unchanged_instance_records),
+                len(set(self.instance_records) - instance_ids),
+            )
+        )
+        return changed_instances_by_region, unchanged_instance_records
+
     def build_inventory_for_instance(self, instance, region):
         """Build and return inventory for an instance"""
         try:
             self.log("Building inventory for instance {0}".format(instance.id))
             instance_inventory = {}
-            compute_client = self.get_compute_client_for_region(region)
-            virtual_nw_client = self.get_virtual_nw_client_for_region(region)
             compartment = self.compartments[instance.compartment_id]
 
             instance_vars = to_dict(instance)
@@ -1062,23 +1563,7 @@ class OCIInventory:
                     )
                     common_groups.add(ext_metadata_grp_name)
 
-            vnic_attachments = [
-                vnic_attachment
-                for vnic_attachment in list_all_resources(
-                    target_fn=compute_client.list_vnic_attachments,
-                    compartment_id=compartment.id,
-                    instance_id=instance.id,
-                )
-                if self.filter_resource(
-                    vnic_attachment, lifecycle_state=self.LIFECYCLE_ATTACHED_STATE
-                )
-            ]
-
-            for vnic_attachment in vnic_attachments:
-
-                vnic = call_with_backoff(
-                    virtual_nw_client.get_vnic, vnic_id=vnic_attachment.vnic_id
-                ).data
+            for vnic_attachment, vnic in self.get_instance_vnics(instance, region):
                 self.log(
                     "VNIC {0} is attached to instance {1}.".format(
                         vnic.id, vnic_attachment.instance_id
@@ -1108,9 +1593,7 @@ class OCIInventory:
 
                 groups = set(common_groups)
 
-                subnet = call_with_backoff(
-                    virtual_nw_client.get_subnet, subnet_id=vnic.subnet_id
-                ).data
+                subnet = self.get_subnet(vnic.subnet_id, vnic.compartment_id, region)
                 groups.add(subnet.id)
                 groups.add(subnet.vcn_id)
 
@@ -1172,6 +1655,58 @@ class OCIInventory:
             # terminate the pool
             pool.terminate()
 
+    def map_by_region(self, fn, items_by_region, description="Processing"):
+        """Call fn(item, region) for the items of every region and return the results by region, in the order of the
+        items.
+
+        When parallel processing is enabled, the calls for all the regions are scheduled on a single thread pool of
+        max_thread_count threads, and at most max_thread_count_per_region calls run concurrently against any one
+        region. The items are interleaved across the regions so that the threads are spread over the regions.
+
+        :param fn: function to call with an item and its region
+        :param items_by_region: dict with region as key and list of items of the region as value
+        :param description: description of the calls used in the debug messages
+        :return: dict with region as key and list of results of the region as value
+        """
+        tasks = []
+        for index in range(
+            max([len(items) for items in items_by_region.values()] + [0])
+        ):
+            for region in items_by_region:
+                if index < len(items_by_region[region]):
+                    tasks.append((region, items_by_region[region][index]))
+
+        if self.params["enable_parallel_processing"] and tasks:
+            max_thread_count = int(self.params["max_thread_count"])
+            max_thread_count_per_region = int(
+                self.params["max_thread_count_per_region"] or max_thread_count
+            )
+            region_semaphores = dict(
+                (region, threading.BoundedSemaphore(max_thread_count_per_region))
+                for region in items_by_region
+            )
+
+            def call_fn_with_region_limit(task):
+                region, item = task
+                with region_semaphores[region]:
+                    return fn(item, region)
+
+            num_threads = min(len(tasks), max_thread_count)
+            self.log(
+                "Parallel processing enabled. {0} for {1} items from {2} regions in {3} threads.".format(
+                    description, len(tasks), len(items_by_region), num_threads
+                )
+            )
+            with self.pool(processes=num_threads) as pool:
+                results = pool.map(call_fn_with_region_limit, tasks)
+        else:
+            results = [fn(item, region) for region, item in tasks]
+
+        results_by_region = dict((region, []) for region in items_by_region)
+        for (region, item), result in zip(tasks, results):
+            results_by_region[region].append(result)
+        return results_by_region
+
     def build_inventory(self):
         self.log("Building inventory.")
 
@@ -1196,42 +1731,58 @@ class OCIInventory:
 
         instances_by_region = self.get_instances(self.compartments)
 
-        self.log("Building inventory for instances {0}".format(instances_by_region))
+        instance_ids = [
+            instance.id
+            for region in instances_by_region
+            for instance in instances_by_region[region]
+        ]
+        instance_records = {}
+        if self.instance_records is not None:
+            instances_by_region, instance_records = self.get_changed_instances(
+                instances_by_region
+            )
 
-        instance_inventories = []
+        self.resolve_vnics(instances_by_region)
 
-        if self.params["enable_parallel_processing"]:
-            instance_inventories = []
-            for region in instances_by_region:
-                instances = instances_by_region[region]
-                if instances:
-                    num_threads = min(len(instances), self.params["max_thread_count"])
-                    self.log(
-                        "Parallel processing enabled. Building individual instance inventories in {0} threads.".format(
-                            num_threads
-                        )
-                    )
-                    with self.pool(processes=num_threads) as pool:
-                        instance_inventories.extend(
-                            pool.map(
-                                partial(
-                                    self.build_inventory_for_instance, region=region
-                                ),
-                                instances,
-                            )
-                        )
+        self.log("Building inventory for instances {0}".format(instances_by_region))
 
-        else:
-            instance_inventories = [
-                self.build_inventory_for_instance(instance, region)
-                for region in instances_by_region
-                for instance in instances_by_region[region]
-            ]
+        instance_inventories_by_region = self.map_by_region(
+            self.build_inventory_for_instance,
+            instances_by_region,
+            description="Building individual instance inventories",
+        )
+        instance_inventories = [
+            instance_inventory
+            for region in instances_by_region
+            for instance_inventory in instance_inventories_by_region[region]
+        ]
+
+        built_instances = [
+            (instance, region)
+            for region in instances_by_region
+            for instance in instances_by_region[region]
+        ]
+        for (instance, region), instance_inventory in zip(
+            built_instances, instance_inventories
+        ):
+            if instance_inventory:
+                instance_records[instance.id] = dict(
+                    region=region,
+                    fingerprint=self.get_instance_fingerprint(instance),
+                    inventory=instance_inventory,
+                )
+        self.new_instance_records = instance_records
 
         self.log("Instance inventories: {0}".format(instance_inventories))
         self.log("Merging instance inventories.")
 
-        self.merge_instance_inventories(instance_inventories)
+        self.merge_instance_inventories(
+            [
+                instance_records[instance_id]["inventory"]
+                for instance_id in instance_ids
+                if instance_id in instance_records
+            ]
+        )
 
     def fail(self, message=None, exit_code=1, stacktrace=None):
         if stacktrace:
@@ -1353,6 +1904,15 @@ class OCIInventory:
             "threads to use. Defaults to 50. This value can also be provided in the settings config file.",
         )
 
+        parser.add_argument(
+            "--max-thread-count-per-region",
+            action="store",
+            type=int,
+            help="Only valid when --enable-parallel-processing is set. The threads are shared by all the regions. "
+            "This option specifies the maximum number of threads making requests to any one region. Defaults to "
+            "the value of max-thread-count. This value can also be provided in the settings config file.",
+        )
+
         parser.add_argument(
             "--freeform-tags",
             action="store",
@@ -1410,6 +1970,22 @@ class OCIInventory:
             "items. When set to yes, the script will only report each instance once.",
         )
 
+        parser.add_argument(
+            "--incremental-refresh",
+            action="store",
+            choices=["yes", "no"],
+            help="When set to yes and the cache is outdated, only the instances which were added, removed or changed "
+            "since the cache was written are looked up again, instead of rebuilding the whole inventory.",
+        )
+
+        parser.add_argument(
+            "--compact-output",
+            action="store",
+            choices=["yes", "no"],
+            help="When set to yes, the inventory is printed as compact JSON, without indentation and without sorting "
+            "the keys. This is much faster for large inventories.",
+        )
+
         self.args = parser.parse_args()
 
     def read_settings_config(self, boolean_options, dict_options):
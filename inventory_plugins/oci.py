@@ -35,6 +35,29 @@ DOCUMENTATION = """
                - name: OCI_ANSIBLE_AUTH_TYPE
         enable_parallel_processing:
               description: Use multiple threads to speedup lookup.
+        max_thread_count:
+              description: Only valid when enable_parallel_processing is set. The maximum number of threads to use
+                  while building the inventory.
+              type: int
+              default: 50
+        max_thread_count_per_region:
+              description: Only valid when enable_parallel_processing is set. The threads are shared by all the
+                  regions. This option specifies the maximum number of threads making requests to any one region.
+                  Defaults to the value of max_thread_count.
+              type: int
+        incremental_refresh:
+              description: Only valid when cache is enabled. When set, the cached inventory is used for
+                  incremental_refresh_interval seconds. After that, only the instances which were added, removed or
+                  changed since the cache was written are looked up again, instead of rebuilding the whole inventory.
+                  The whole inventory is rebuilt once it was last built in full more than cache_timeout seconds
+                  ago, so set cache_timeout to a value larger than incremental_refresh_interval.
+              type: bool
+              default: False
+        incremental_refresh_interval:
+              description: Only valid when incremental_refresh is set. The number of seconds after which the cached
+                  inventory is refreshed incrementally.
+              type: int
+              default: 300
         regions:
              description: A list of regions to search. If not specified, the region is read from config file.
         hostnames:
@@ -94,10 +117,16 @@ cache_plugin: jsonfile
 cache_timeout: 7200
 cache_connection: /tmp/oci-cache
 cache_prefix: oci_
+
+# Refresh the cache incrementally every 5 minutes and fully every 2 hours
+incremental_refresh: yes
+incremental_refresh_interval: 300
 """
 import os
 import re
 import json
+import hashlib
+from time import time
 
 
 from ansible.errors import AnsibleError, AnsibleParserError
@@ -110,8 +139,8 @@ from ansible.module_utils import six
 from ansible.module_utils.oracle import oci_utils, oci_config_utils, oci_common_utils
 from collections import deque, defaultdict
 from multiprocessing.pool import ThreadPool
-from functools import partial
 from contextlib import contextmanager
+import threading
 
 try:
     import oci
@@ -141,6 +170,17 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         self.compartments = None
         self._region_subscriptions = None
         self.regions = {}
+        # Subnets and VCNs are shared by many hosts, so they are listed once per compartment and memoised per region.
+        self._network_resources = {}
+        self._network_resource_compartments = set()
+        # Locks keyed by (region, resource type, compartment or resource id). See _get_network_resource_lock.
+        self._network_resource_locks = {}
+        self._network_resource_locks_lock = threading.Lock()
+        # VNICs resolved in bulk, keyed by instance id. See resolve_vnics.
+        self._instance_vnics = {}
+        # Per-instance inventories read from the cache for an incremental refresh. See get_changed_instances.
+        self.instance_records = None
+        self.new_instance_records = []
         self.params = {
             "config_file": os.path.join(os.path.expanduser("~"), ".oci", "config"),
             "profile": "DEFAULT",
@@ -160,6 +200,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             "sanitize_names": True,
             "replace_dash_in_names": False,
             "max_thread_count": 50,
+            "max_thread_count_per_region": None,
             "freeform_tags": None,
             "defined_tags": None,
             "regions": None,
@@ -285,6 +326,58 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             # terminate the pool
             pool.terminate()
 
+    def map_by_region(self, fn, items_by_region, description="Processing"):
+        """Call fn(item, region) for the items of every region and return the results by region, in the order of the
+        items.
+
+        When parallel processing is enabled, the calls for all the regions are scheduled on a single thread pool of
+        max_thread_count threads, and at most max_thread_count_per_region calls run concurrently against any one
+        region. The items are interleaved across the regions so that the threads are spread over the regions.
+
+        :param fn: function to call with an item and its region
+        :param items_by_region: dict with region as key and list of items of the region as value
+        :param description: description of the calls used in the debug messages
+        :return: dict with region as key and list of results of the region as value
+        """
+        tasks = []
+        for index in range(
+            max([len(items) for items in items_by_region.values()] + [0])
+        ):
+            for region in items_by_region:
+                if index < len(items_by_region[region]):
+                    tasks.append((region, items_by_region[region][index]))
+
+        if self.get_option("enable_parallel_processing") and tasks:
+            max_thread_count = int(self.params["max_thread_count"])
+            max_thread_count_per_region = int(
+                self.params["max_thread_count_per_region"] or max_thread_count
+            )
+            region_semaphores = dict(
+                (region, threading.BoundedSemaphore(max_thread_count_per_region))
+                for region in items_by_region
+            )
+
+            def call_fn_with_region_limit(task):
+                region, item = task
+                with region_semaphores[region]:
+                    return fn(item, region)
+
+            num_threads = min(len(tasks), max_thread_count)
+            self.display.warning(
+                "Parallel processing enabled. {0} for {1} items from {2} regions in {3} threads.".format(
+                    description, len(tasks), len(items_by_region), num_threads
+                )
+            )
+            with self.pool(processes=num_threads) as pool:
+                results = pool.map(call_fn_with_region_limit, tasks)
+        else:
+            results = [fn(item, region) for region, item in tasks]
+
+        results_by_region = dict((region, []) for region in items_by_region)
+        for (region, item), result in zip(tasks, results):
+            results_by_region[region].append(result)
+        return results_by_region
+
     def _get_instances_by_region(self, regions):
         """
            :param regions: a list of regions in which to describe instances
@@ -310,13 +403,53 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         all_instances = self.get_instances(self.compartments)
 
-        instance_inventories = [
-            self.build_inventory_for_instance(instance, region)
+        instance_ids = [
+            instance.id
             for region in all_instances
             for instance in all_instances[region]
         ]
+        instance_records = {}
+        if self.instance_records is not None:
+            all_instances, instance_records = self.get_changed_instances(all_instances)
 
-        return instance_inventories
+        self.resolve_vnics(all_instances)
+
+        instance_inventories_by_region = self.map_by_region(
+            self.build_inventory_for_instance,
+            all_instances,
+            description="Building individual instance inventories",
+        )
+        instances = [
+            (instance, region)
+            for region in all_instances
+            for instance in all_instances[region]
+        ]
+        instance_inventories = [
+            instance_inventory
+            for region in all_instances
+            for instance_inventory in instance_inventories_by_region[region]
+        ]
+
+        for (instance, region), instance_inventory in zip(
+            instances, instance_inventories
+        ):
+            if instance_inventory:
+                instance_records[instance.id] = dict(
+                    id=instance.id,
+                    region=region,
+                    fingerprint=self.get_instance_fingerprint(instance),
+                    inventory=instance_inventory,
+                )
+        self.new_instance_records = [
+            instance_records[instance_id]
+            for instance_id in instance_ids
+            if instance_id in instance_records
+        ]
+
+        return [
+            instance_record["inventory"]
+            for instance_record in self.new_instance_records
+        ]
 
     def get_instances(self, compartment_ocids):
         """Get and return instances from all the specified compartments and regions.
@@ -326,33 +459,14 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         """
         instances = defaultdict(list)
 
-        if self.get_option("enable_parallel_processing"):
-            for region in self.regions:
-                num_threads = min(
-                    len(compartment_ocids), self.params["max_thread_count"]
-                )
-                self.display.warning(
-                    "Parallel processing enabled. Getting instances from {0} in {1} threads.".format(
-                        region, num_threads
-                    )
-                )
-
-                with self.pool(processes=num_threads) as pool:
-                    get_filtered_instances_for_region = partial(
-                        self.get_filtered_instances, region=region
-                    )
-                    lists_of_instances = pool.map(
-                        get_filtered_instances_for_region, compartment_ocids
-                    )
-                for sublist in lists_of_instances:
-                    instances[region].extend(sublist)
-
-        else:
-            for region in self.regions:
-                for compartment_ocid in compartment_ocids:
-                    instances[region].extend(
-                        self.get_filtered_instances(compartment_ocid, region)
-                    )
+        lists_of_instances_by_region = self.map_by_region(
+            self.get_filtered_instances,
+            dict((region, list(compartment_ocids)) for region in self.regions),
+            description="Getting instances",
+        )
+        for region in self.regions:
+            for sublist in lists_of_instances_by_region[region]:
+                instances[region].extend(sublist)
 
         return instances
 
@@ -465,7 +579,9 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         if not fetch_hosts_from_subcompartments:
             return [compartment_with_name]
 
-        return self.get_sub_compartments(compartment_with_name)
+        return self.get_sub_compartments(
+            compartment_with_name, compartments_in_tenancy=all_compartments[1:]
+        )
 
     @staticmethod
     def filter_resource(resource, **kwargs):
@@ -474,35 +590,147 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                 return False
         return True
 
-    def get_sub_compartments(self, root):
-        # OCI SDK does not support fetching sub-compartments for non root compartments
-        # So traverse the compartment tree to fetch all the sub compartments
-        compartments = []
-        queue = deque()
-        queue.append(root)
-        while len(queue) > 0:
-            parent_compartment = queue.popleft()
-            compartments.append(parent_compartment)
-            child_compartments = [
+    def get_sub_compartments(self, root, compartments_in_tenancy=None):
+        """Return the given compartment and all its ACTIVE sub-compartments.
+
+        :param root: The compartment whose hierarchy is to be returned
+        :param compartments_in_tenancy: (optional) ACTIVE compartments of the tenancy, listed with
+            compartment_id_in_subtree. When available, or when root is the tenancy and they can be listed with a
+            single call, the hierarchy is built from this listing instead of traversing the tree.
+        :return: list of :class:`~oci.identity.models.Compartment`
+        """
+        if compartments_in_tenancy is None and self.is_root_compartment(root):
+            compartments_in_tenancy = [
                 compartment
                 for compartment in oci_utils.list_all_resources(
                     target_fn=self.identity_client.list_compartments,
-                    compartment_id=parent_compartment.id,
+                    compartment_id=root.id,
+                    compartment_id_in_subtree=True,
                 )
                 if self.filter_resource(
                     compartment, lifecycle_state=self.LIFECYCLE_ACTIVE_STATE
                 )
             ]
-            for child_compartment in child_compartments:
-                queue.append(child_compartment)
+        if compartments_in_tenancy is not None:
+            return self.get_sub_compartments_from_listing(root, compartments_in_tenancy)
+        # OCI SDK does not support fetching sub-compartments for non root compartments
+        # So traverse the compartment tree to fetch all the sub compartments. The compartments of each level of the
+        # tree are expanded concurrently when parallel processing is enabled.
+        compartments = []
+        level = [root]
+        while level:
+            compartments.extend(level)
+            if self.get_option("enable_parallel_processing"):
+                num_threads = min(len(level), int(self.params["max_thread_count"]))
+                self.display.warning(
+                    "Parallel processing enabled. Getting sub-compartments of {0} compartments in {1} threads.".format(
+                        len(level), num_threads
+                    )
+                )
+                with self.pool(processes=num_threads) as pool:
+                    lists_of_child_compartments = pool.map(
+                        self.get_child_compartments, level
+                    )
+            else:
+                lists_of_child_compartments = [
+                    self.get_child_compartments(parent_compartment)
+                    for parent_compartment in level
+                ]
+            level = [
+                child_compartment
+                for child_compartments in lists_of_child_compartments
+                for child_compartment in child_compartments
+            ]
+        return compartments
+
+    def is_root_compartment(self, compartment):
+        return compartment.id == self.params["tenancy"] or compartment.id.startswith(
+            "ocid1.tenancy."
+        )
+
+    def get_child_compartments(self, parent_compartment):
+        return [
+            compartment
+            for compartment in oci_utils.list_all_resources(
+                target_fn=self.identity_client.list_compartments,
+                compartment_id=parent_compartment.id,
+            )
+            if self.filter_resource(
+                compartment, lifecycle_state=self.LIFECYCLE_ACTIVE_STATE
+            )
+        ]
+
+    @staticmethod
+    def get_sub_compartments_from_listing(root, compartments_in_tenancy):
+        """Return root and its sub-compartments from a listing of the compartments of the tenancy.
+
+        The compartments are indexed by their parent and the tree is walked breadth first, so the sub-compartments of
+        a compartment which is not in the listing are left out, in the same way as when the tree is traversed level by
+        level.
+        """
+        child_compartments_by_parent = defaultdict(list)
+        for compartment in compartments_in_tenancy:
+            child_compartments_by_parent[compartment.compartment_id].append(compartment)
+        compartments = []
+        queue = deque()
+        queue.append(root)
+        while len(queue) > 0:
+            parent_compartment = queue.popleft()
+            compartments.append(parent_compartment)
+            queue.extend(child_compartments_by_parent[parent_compartment.id])
         return compartments
 
+    @staticmethod
+    def get_instance_fingerprint(instance):
+        """Return a digest of an instance as returned by list_instances. The digest changes whenever any attribute
+        of the instance, including its lifecycle state and tags, changes."""
+        return hashlib.md5(
+            to_bytes(json.dumps(to_dict(instance), sort_keys=True, default=str))
+        ).hexdigest()
+
+    def get_changed_instances(self, instances_by_region):
+        """Split the instances into the ones which need to be looked up again and the ones whose inventory can be
+        reused from the cached instance records.
+
+        Instances which are no longer returned by list_instances are dropped along with their records.
+
+        :param instances_by_region: dict with region as key and list of instances of the region as value
+        :return: tuple of the dict of added or changed instances by region, and the dict of the reused instance
+            records by instance id
+        """
+        changed_instances_by_region = defaultdict(list)
+        unchanged_instance_records = {}
+        for region in instances_by_region:
+            for instance in instances_by_region[region]:
+                instance_record = self.instance_records.get(instance.id)
+                if (
+                    instance_record
+                    and instance_record["region"] == region
+                    and instance_record["fingerprint"]
+                    == self.get_instance_fingerprint(instance)
+                ):
+                    unchanged_instance_records[instance.id] = instance_record
+                else:
+                    changed_instances_by_region[region].append(instance)
+        instance_ids = set(
+            instance.id
+            for region in instances_by_region
+            for instance in instances_by_region[region]
+        )
+        self.display.warning(
+            "Incremental refresh: reusing {0} cached instances, looking up {1} added or changed instances and "
+            "dropping {2} removed instances.".format(
+                len(unchanged_instance_records),
+                len(instance_ids) - len(unchanged_instance_records),
+                len(set(self.instance_records) - instance_ids),
+            )
+        )
+        return changed_instances_by_region, unchanged_instance_records
+
     def build_inventory_for_instance(self, instance, region):
         """Build and return inventory for an instance"""
         try:
             instance_inventory = {}
-            compute_client = self.get_compute_client_for_region(region)
-            virtual_nw_client = self.get_virtual_nw_client_for_region(region)
             compartment = self.compartments[instance.compartment_id]
 
             instance_vars = to_dict(instance)
@@ -539,32 +767,14 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                     )
                     common_groups.add(defined_tag_group_name)
 
-            vnic_attachments = [
-                vnic_attachment
-                for vnic_attachment in oci_utils.list_all_resources(
-                    target_fn=compute_client.list_vnic_attachments,
-                    compartment_id=compartment.id,
-                    instance_id=instance.id,
-                )
-                if self.filter_resource(
-                    vnic_attachment, lifecycle_state=self.LIFECYCLE_ATTACHED_STATE
-                )
-            ]
-
-            for vnic_attachment in vnic_attachments:
-
-                vnic = oci_utils.call_with_backoff(
-                    virtual_nw_client.get_vnic, vnic_id=vnic_attachment.vnic_id
-                ).data
+            for vnic_attachment, vnic in self.get_instance_vnics(instance, region):
                 self.log(
                     "VNIC {0} is attached to instance {1}.".format(
                         vnic.id, vnic_attachment.instance_id
                     )
                 )
 
-                subnet = oci_utils.call_with_backoff(
-                    virtual_nw_client.get_subnet, subnet_id=vnic.subnet_id
-                ).data
+                subnet = self.get_subnet(vnic.subnet_id, vnic.compartment_id, region)
 
                 if instance_vars.get("id") == vnic_attachment.instance_id:
                     instance_vars.update({"vcn_id": subnet.vcn_id})
@@ -725,15 +935,216 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             )
         return self._virtual_nw_clients[region]
 
-    def get_host_name(self, vnic, region):
+    def _get_network_resource(self, resource_type, resource_id, compartment_id, region):
+        """Return the subnet or vcn with the given id from the per-region cache.
+
+        On a cache miss, all the resources of that type in the compartment are listed and cached, so that the number
+        of network API calls depends on the number of subnets and vcns rather than on the number of hosts. Resources
+        which live in a different compartment are fetched once and their compartment is then cached as well.
+        """
+        key = (region, resource_type, resource_id)
+        if key in self._network_resources:
+            return self._network_resources[key]
+        self._cache_network_resources(resource_type, compartment_id, region)
+        if key not in self._network_resources:
+            with self._get_network_resource_lock(key):
+                if key not in self._network_resources:
+                    virtual_nw_client = self.get_virtual_nw_client_for_region(region)
+                    resource = oci_utils.call_with_backoff(
+                        getattr(virtual_nw_client, "get_" + resource_type),
+                        **{resource_type + "_id": resource_id}
+                    ).data
+                    self._network_resources[key] = resource
+            self._cache_network_resources(
+                resource_type, self._network_resources[key].compartment_id, region
+            )
+        return self._network_resources[key]
+
+    def _get_network_resource_lock(self, key):
+        """Return the lock serialising the lookups of key, so that the threads which need the same resources wait for
+        a single listing while the lookups of other regions, resource types and compartments run in parallel.
+        """
+        with self._network_resource_locks_lock:
+            return self._network_resource_locks.setdefault(key, threading.Lock())
+
+    def _cache_network_resources(self, resource_type, compartment_id, region):
+        """List all the subnets or vcns of a compartment into the per-region cache, once."""
+        key = (region, resource_type, compartment_id)
+        if key in self._network_resource_compartments:
+            return
+        with self._get_network_resource_lock(key):
+            if key in self._network_resource_compartments:
+                return
+            self._list_network_resources(resource_type, compartment_id, region)
+            self._network_resource_compartments.add(key)
+
+    def _list_network_resources(self, resource_type, compartment_id, region):
+        """List all the subnets or vcns of a compartment into the per-region cache. Callers must hold the lock of the
+        compartment."""
         virtual_nw_client = self.get_virtual_nw_client_for_region(region)
-        if self.params["hostname_format"] == "fqdn":
-            subnet = oci_utils.call_with_backoff(
-                virtual_nw_client.get_subnet, subnet_id=vnic.subnet_id
-            ).data
-            vcn = oci_utils.call_with_backoff(
-                virtual_nw_client.get_vcn, vcn_id=subnet.vcn_id
+        self.log(
+            "Caching all {0}s from compartment: {1} and region: {2}".format(
+                resource_type, compartment_id, region
+            )
+        )
+        try:
+            resources = oci_utils.list_all_resources(
+                target_fn=getattr(virtual_nw_client, "list_" + resource_type + "s"),
+                compartment_id=compartment_id,
+            )
+        except ServiceError as ex:
+            if ex.status == 401:
+                raise
+            self.log(ex)
+            return
+        for resource in resources:
+            self._network_resources[(region, resource_type, resource.id)] = resource
+
+    def get_subnet(self, subnet_id, compartment_id, region):
+        return self._get_network_resource("subnet", subnet_id, compartment_id, region)
+
+    def get_vcn(self, vcn_id, compartment_id, region):
+        return self._get_network_resource("vcn", vcn_id, compartment_id, region)
+
+    def get_vnic_attachments_by_instance(self, compartment_ocid, region):
+        """Return the ATTACHED vnic attachments of a compartment indexed by instance id, using a single listing.
+        None is returned when the vnic attachments of the compartment could not be listed.
+        """
+        try:
+            compute_client = self.get_compute_client_for_region(region)
+            self.log(
+                "Listing all vnic attachments from compartment: {0} and region: {1}".format(
+                    compartment_ocid, region
+                )
+            )
+            vnic_attachments_by_instance = defaultdict(list)
+            for vnic_attachment in oci_utils.list_all_resources(
+                target_fn=compute_client.list_vnic_attachments,
+                compartment_id=compartment_ocid,
+            ):
+                if self.filter_resource(
+                    vnic_attachment, lifecycle_state=self.LIFECYCLE_ATTACHED_STATE
+                ):
+                    vnic_attachments_by_instance[vnic_attachment.instance_id].append(
+                        vnic_attachment
+                    )
+            return vnic_attachments_by_instance
+        except ServiceError as ex:
+            if ex.status == 401:
+                self.log(ex)
+                raise
+            self.log(ex)
+            return None
+
+    def get_attached_vnic(self, vnic_attachment, region):
+        try:
+            virtual_nw_client = self.get_virtual_nw_client_for_region(region)
+            return oci_utils.call_with_backoff(
+                virtual_nw_client.get_vnic, vnic_id=vnic_attachment.vnic_id
             ).data
+        except ServiceError as ex:
+            if ex.status == 401:
+                self.log(ex)
+                raise
+            self.log(ex)
+            return None
+
+    def resolve_vnics(self, instances_by_region):
+        """Resolve the VNICs of all the instances in bulk.
+
+        The vnic attachments are listed once per compartment and region and indexed by instance id, instead of
+        listing the attachments of every instance separately. The VNICs are then fetched concurrently when parallel
+        processing is enabled. Instances whose VNICs could not all be resolved are left out, so that
+        build_inventory_for_instance looks them up individually.
+        """
+        self._instance_vnics = {}
+        compartment_ocids_by_region = dict(
+            (
+                region,
+                sorted(set(instance.compartment_id for instance in instances)),
+            )
+            for region, instances in six.iteritems(instances_by_region)
+        )
+        indexes_by_region = self.map_by_region(
+            self.get_vnic_attachments_by_instance,
+            compartment_ocids_by_region,
+            description="Listing vnic attachments",
+        )
+
+        vnic_attachments_by_region = {}
+        for region, instances in six.iteritems(instances_by_region):
+            instance_ids = set(instance.id for instance in instances)
+            indexes = indexes_by_region[region]
+            listed_compartment_ocids = set(
+                compartment_ocid
+                for compartment_ocid, index in zip(
+                    compartment_ocids_by_region[region], indexes
+                )
+                if index is not None
+            )
+            for instance in instances:
+                if instance.compartment_id in listed_compartment_ocids:
+                    self._instance_vnics[instance.id] = []
+
+            vnic_attachments_by_region[region] = [
+                vnic_attachment
+                for index in indexes
+                if index
+                for instance_id in index
+                if instance_id in instance_ids
+                for vnic_attachment in index[instance_id]
+            ]
+
+        vnics_by_region = self.map_by_region(
+            self.get_attached_vnic,
+            vnic_attachments_by_region,
+            description="Getting VNICs",
+        )
+
+        unresolved_instance_ids = set()
+        for region in vnic_attachments_by_region:
+            for vnic_attachment, vnic in zip(
+                vnic_attachments_by_region[region], vnics_by_region[region]
+            ):
+                if vnic is None:
+                    unresolved_instance_ids.add(vnic_attachment.instance_id)
+                self._instance_vnics[vnic_attachment.instance_id].append(
+                    (vnic_attachment, vnic)
+                )
+        for instance_id in unresolved_instance_ids:
+            del self._instance_vnics[instance_id]
+
+    def get_instance_vnics(self, instance, region):
+        """Return (vnic_attachment, vnic) pairs of the VNICs attached to the instance."""
+        if instance.id in self._instance_vnics:
+            return self._instance_vnics[instance.id]
+        compute_client = self.get_compute_client_for_region(region)
+        virtual_nw_client = self.get_virtual_nw_client_for_region(region)
+        vnic_attachments = [
+            vnic_attachment
+            for vnic_attachment in oci_utils.list_all_resources(
+                target_fn=compute_client.list_vnic_attachments,
+                compartment_id=instance.compartment_id,
+                instance_id=instance.id,
+            )
+            if self.filter_resource(
+                vnic_attachment, lifecycle_state=self.LIFECYCLE_ATTACHED_STATE
+            )
+        ]
+        return [
+            (
+                vnic_attachment,
+                oci_utils.call_with_backoff(
+                    virtual_nw_client.get_vnic, vnic_id=vnic_attachment.vnic_id
+                ).data,
+            )
+            for vnic_attachment in vnic_attachments
+        ]
+
+    def get_host_name(self, vnic, region):
+        if self.params["hostname_format"] == "fqdn":
+            subnet = self.get_subnet(vnic.subnet_id, vnic.compartment_id, region)
+            vcn = self.get_vcn(subnet.vcn_id, subnet.compartment_id, region)
 
             oraclevcn_domain_name = ".oraclevcn.com"
             if not (vnic.hostname_label or subnet.dns_label or vcn.dns_label):
@@ -872,6 +1283,10 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         config_data = self._read_config_data(path)
         # read oci config
         self.read_config()
+        self.params["max_thread_count"] = self.get_option("max_thread_count")
+        self.params["max_thread_count_per_region"] = self.get_option(
+            "max_thread_count_per_region"
+        )
 
         regions, filters, hostnames = self._get_query_options(config_data)
 
@@ -884,8 +1299,11 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         if cache:
             cache = self.get_option("cache")
 
+        incremental_refresh = self.get_option("incremental_refresh")
+
         # Generate inventory
         cache_needs_update = False
+        full_build_time = None
         if cache:
             try:
                 cached_results = self._cache[cache_key]
@@ -893,8 +1311,41 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                 # cache expired or cache file doesn't exist
                 cache_needs_update = True
             else:
-                self.display.warning("Using cached results")
-                self._populate(cached_results, hostnames)
+                # The cache holds the instance inventories, or the per-instance records with the time they were
+                # written when incremental_refresh is set. Each incremental refresh rewrites the cache, which resets
+                # its expiry, so the time of the last full build is kept in the records as well and the inventory is
+                # rebuilt in full once that is older than cache_timeout.
+                if not incremental_refresh and isinstance(cached_results, list):
+                    self.display.warning("Using cached results")
+                    self._populate(cached_results, hostnames)
+                elif (
+                    incremental_refresh
+                    and isinstance(cached_results, dict)
+                    and time() - cached_results.get("full_build_time", 0)
+                    < self.get_option("cache_timeout")
+                ):
+                    full_build_time = cached_results["full_build_time"]
+                    if time() - cached_results["time"] < self.get_option(
+                        "incremental_refresh_interval"
+                    ):
+                        self.display.warning("Using cached results")
+                        self._populate(
+                            [
+                                instance_record["inventory"]
+                                for instance_record in cached_results[
+                                    "instance_records"
+                                ]
+                            ],
+                            hostnames,
+                        )
+                    else:
+                        self.instance_records = dict(
+                            (instance_record["id"], instance_record)
+                            for instance_record in cached_results["instance_records"]
+                        )
+                        cache_needs_update = True
+                else:
+                    cache_needs_update = True
 
         results = None
         if not cache or cache_needs_update:
@@ -903,4 +1354,13 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         # update the cached inventory
         if cache_needs_update or (not cache and self.get_option("cache")):
-            self._cache[cache_key] = results
+            if incremental_refresh:
+                self._cache[cache_key] = dict(
+                    time=time(),
+                    full_build_time=(
+                        full_build_time if self.instance_records is not None else time()
+                    ),
+                    instance_records=self.new_instance_records,
+                )
+            else:
+                self._cache[cache_key] = results
@@ -113,7 +113,7 @@ class ApiKeyHelperGen(OCIResourceHelperBase):
         return CreateApiKeyDetails
 
     def list_resources(self):
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_api_keys, user_id=self.module.params.get("user_id")
         )
 
@@ -47,6 +47,23 @@ options:
               between January 1, 2017 and January 31, 2017.
               You can specify a value with granularity to the minute. Seconds (and milliseconds, if included) must be set to `0`.
         required: true
+    time_slice_in_minutes:
+        description:
+            - The time range from I(start_time) to I(end_time) is split into slices of this many minutes, which are listed concurrently and
+              returned in time order.
+        type: int
+        default: 60
+    parallel_fetch_count:
+        description:
+            - The maximum number of time slices listed concurrently.
+        type: int
+        default: 8
+    dest:
+        description:
+            - The path of a file to write the audit events to, one JSON document per line, instead of returning them in I(audit_events).
+              Use this for time ranges with many events, the events are then not held in memory. The file is replaced only once all the
+              events are listed.
+        type: path
 author:
     - Manoj Meda (@manojmeda)
     - Mike Ross (@mross22)
@@ -61,13 +78,21 @@ EXAMPLES = """
     start_time: 2013-10-20T19:20:30+01:00
     end_time: 2013-10-20T19:20:30+01:00
 
+- name: Write a day of audit_events to a file, listing up to 24 hours concurrently
+  oci_audit_event_facts:
+    compartment_id: ocid1.compartment.oc1..xxxxxxEXAMPLExxxxxx
+    start_time: 2013-10-20T00:00:00Z
+    end_time: 2013-10-21T00:00:00Z
+    parallel_fetch_count: 24
+    dest: /tmp/audit_events.json
+
 """
 
 RETURN = """
 audit_events:
     description:
         - List of AuditEvent resources
-    returned: on success
+    returned: on success, when I(dest) is not specified
     type: complex
     contains:
         tenant_id:
@@ -229,6 +254,18 @@ audit_events:
         "response_payload": {},
         "user_name": "user_name_example"
     }]
+audit_events_count:
+    description:
+        - The number of AuditEvent resources written to I(dest)
+    returned: when I(dest) is specified
+    type: int
+    sample: 1024
+dest:
+    description:
+        - The path of the file the AuditEvent resources were written to
+    returned: when I(dest) is specified
+    type: string
+    sample: /tmp/audit_events.json
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -259,7 +296,7 @@ class AuditEventFactsHelperGen(OCIResourceFactsHelperBase):
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_events,
             compartment_id=self.module.params.get("compartment_id"),
             start_time=self.module.params.get("start_time"),
@@ -282,6 +319,9 @@ def main():
             compartment_id=dict(type="str", required=True),
             start_time=dict(type="str", required=True),
             end_time=dict(type="str", required=True),
+            time_slice_in_minutes=dict(type="int", default=60),
+            parallel_fetch_count=dict(type="int", default=8),
+            dest=dict(type="path"),
         )
     )
 
@@ -290,6 +330,10 @@ def main():
     if not HAS_OCI_PY_SDK:
         module.fail_json(msg="oci python sdk required for this module.")
 
+    for option in ["time_slice_in_minutes", "parallel_fetch_count"]:
+        if module.params.get(option) < 1:
+            module.fail_json(msg="{0} must be a positive integer.".format(option))
+
     resource_facts_helper = ResourceFactsHelper(
         module=module,
         resource_type="audit_event",
@@ -302,6 +346,12 @@ def main():
     if resource_facts_helper.is_get():
         result = [resource_facts_helper.get()]
     elif resource_facts_helper.is_list():
+        dest = module.params.get("dest")
+        if dest:
+            module.exit_json(
+                audit_events_count=resource_facts_helper.write_list_to_file(dest),
+                dest=dest,
+            )
         result = resource_facts_helper.list()
     else:
         resource_facts_helper.fail()
@@ -145,7 +145,7 @@ class AuthTokenFactsHelperGen(OCIResourceFactsHelperBase):
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_auth_tokens,
             user_id=self.module.params.get("user_id"),
             **optional_kwargs
@@ -550,7 +550,7 @@ class AutonomousExadataInfrastructureHelperGen(OCIResourceHelperBase):
 
         kwargs = oci_common_utils.merge_dicts(required_kwargs, optional_kwargs)
 
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_autonomous_exadata_infrastructures, **kwargs
         )
 
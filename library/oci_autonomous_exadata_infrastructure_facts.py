@@ -470,7 +470,7 @@ class AutonomousExadataInfrastructureFactsHelperGen(OCIResourceFactsHelperBase):
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_autonomous_exadata_infrastructures,
             compartment_id=self.module.params.get("compartment_id"),
             **optional_kwargs
@@ -131,7 +131,7 @@ class AutonomousExadataInfrastructureShapeFactsHelperGen(OCIResourceFactsHelperB
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_autonomous_exadata_infrastructure_shapes,
             availability_domain=self.module.params.get("availability_domain"),
             compartment_id=self.module.params.get("compartment_id"),
@@ -555,7 +555,7 @@ class AutoScalingConfigurationHelperGen(OCIResourceHelperBase):
 
         kwargs = oci_common_utils.merge_dicts(required_kwargs, optional_kwargs)
 
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_auto_scaling_configurations, **kwargs
         )
 
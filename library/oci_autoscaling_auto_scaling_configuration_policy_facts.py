@@ -268,7 +268,7 @@ class AutoScalingConfigurationPolicyFactsHelperGen(OCIResourceFactsHelperBase):
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_auto_scaling_policies,
             auto_scaling_configuration_id=self.module.params.get(
                 "auto_scaling_configuration_id"
@@ -239,7 +239,7 @@ class BudgetAlertRuleFactsHelperGen(OCIResourceFactsHelperBase):
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_alert_rules,
             budget_id=self.module.params.get("budget_id"),
             **optional_kwargs
@@ -226,7 +226,9 @@ class CpeHelperGen(OCIResourceHelperBase):
 
         kwargs = oci_common_utils.merge_dicts(required_kwargs, optional_kwargs)
 
-        return oci_common_utils.list_all_resources(self.client.list_cpes, **kwargs)
+        return oci_common_utils.list_all_resources_generator(
+            self.client.list_cpes, **kwargs
+        )
 
     def get_create_model_class(self):
         return CreateCpeDetails
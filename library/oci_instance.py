@@ -46,6 +46,20 @@ options:
                 required: true
     compartment_id:
         description: The OCID of the compartment. Required when I(state=present).
+    count:
+        description: The number of instances to launch with I(state=present), as a fleet of uniquely named instances.
+                     The instance names are generated from I(name) and a suffix from 1 to I(count). If I(name)
+                     contains a printf like format, such as "web-%02d", it is used to generate the names, otherwise
+                     the names are <name>-<suffix>. A I(vnic) I(hostname_label) is suffixed the same way. Instances
+                     of the compartment are matched by name only, so only the missing instances are launched. The
+                     instances are launched concurrently and waited on together. I(count) is mutually exclusive with
+                     I(exact_count), I(instance_id) and I(volume_details).
+        type: int
+    exact_count:
+        description: Like I(count), but also terminates the instances of the fleet with a name suffix above
+                     I(exact_count), so that exactly I(exact_count) instances remain. Use it to scale the fleet in and
+                     out. I(exact_count) is mutually exclusive with I(count), I(instance_id) and I(volume_details).
+        type: int
     extended_metadata:
         description: Additional metadata key/value pairs that you provide. They serve a similar purpose and
                      functionality from fields in the I(metadata) object. They are distinguished from I(metadata)
@@ -251,6 +265,20 @@ EXAMPLES = """
         hostname_label: "myinstance1"
         subnet_id: "ocid1.subnet.oc1.phx.xxxxxEXAMPLExxxxx...5iddusmpqpaoa"
 
+- name: Launch a fleet of 10 instances named web-01 to web-10, with the hostnames web-01 to web-10
+  oci_instance:
+     name: web-%02d
+     exact_count: 10
+     availability_domain: "BnQb:PHX-AD-1"
+     compartment_id: "ocid1.compartment.oc1..xxxxxEXAMPLExxxxx...vm62xq"
+     shape: "VM.Standard2.1"
+     source_details:
+        source_type: image
+        image_id: ocid1.image.oc1.phx.xxxxxEXAMPLExxxxx
+     vnic:
+        hostname_label: "web-%02d"
+        subnet_id: "ocid1.subnet.oc1.phx.xxxxxEXAMPLExxxxx...5iddusmpqpaoa"
+
 - name: Update an instance's name
   oci_instance:
      name: myinstance1-new-name
@@ -301,6 +329,13 @@ EXAMPLES = """
 """
 
 RETURN = """
+instances:
+    description: Details of the OCI compute instances of the fleet, in the order of their names. Each instance has the
+                 same attributes as I(instance).
+    returned: When I(count) or I(exact_count) is specified
+    type: list
+    sample: [{"display_name": "web-01", "id": "ocid1.instance.oc1.phx.xxxxxEXAMPLExxxxx",
+              "lifecycle_state": "RUNNING", "primary_private_ip": "10.0.0.2", "primary_public_ip": null}]
 instance:
     description: Details of the OCI compute instance launched, updated or terminated as a result of the current operation
     returned: On successful operation (create, update and terminate) on a single Compute instance
@@ -607,8 +642,15 @@ instance:
             }]
 """
 
+from functools import partial
+
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.oracle import oci_utils, oci_compute_utils
+from ansible.module_utils.oracle import (
+    oci_utils,
+    oci_common_utils,
+    oci_compute_utils,
+    oci_wait_utils,
+)
 from ansible.module_utils.oracle.oci_utils import check_mode
 
 from ansible.module_utils import six
@@ -632,6 +674,18 @@ except ImportError:
     HAS_OCI_PY_SDK = False
 
 RESOURCE_NAME = "instance"
+# The maximum number of instances of a fleet launched or terminated at a time.
+FLEET_PARALLELISM = 10
+# The attributes of the launch details in the fingerprint of a requested instance, see get_launch_fingerprint.
+FINGERPRINT_ATTRIBUTES = [
+    "availability_domain",
+    "fault_domain",
+    "shape",
+    "source_details",
+    "metadata",
+    "extended_metadata",
+]
+_SCALAR_TYPES = six.string_types + six.integer_types + (float,)
 
 
 def detach_volume(compute_client, module, volume_attachment_id):
@@ -1320,6 +1374,104 @@ def _get_exclude_attributes(module):
     return exclude_attributes
 
 
+def _get_scalar_items(value):
+    if isinstance(value, dict):
+        items = six.iteritems(value)
+    elif hasattr(value, "attribute_map"):
+        items = ((attr, getattr(value, attr)) for attr in value.attribute_map)
+    else:
+        return []
+    return [(key, item) for key, item in items if isinstance(item, _SCALAR_TYPES)]
+
+
+def get_launch_fingerprint(module, launch_instance_details):
+    """
+    Return the fingerprint of the requested instance, a list of the attribute paths in FINGERPRINT_ATTRIBUTES and their
+    scalar values in launch_instance_details. Nested values, like the image of source_details or the keys of
+    metadata, have a path of two attributes.
+    """
+    key_by = module.params.get("key_by")
+    fingerprint = []
+    for attr in FINGERPRINT_ATTRIBUTES:
+        # The existing instances are only matched on the key_by attributes if the user specified them.
+        if key_by is not None and attr not in key_by:
+            continue
+        value = getattr(launch_instance_details, attr)
+        if isinstance(value, _SCALAR_TYPES):
+            fingerprint.append(((attr,), value))
+        else:
+            fingerprint.extend(
+                ((attr, key), item) for key, item in _get_scalar_items(value)
+            )
+    return fingerprint
+
+
+def _get_instance_attr_value(value, attr, missing):
+    if isinstance(value, dict):
+        return value.get(attr, missing)
+    if attr in getattr(value, "attribute_map", {}):
+        return getattr(value, attr)
+    return missing
+
+
+def may_match_launch_fingerprint(instance, fingerprint):
+    """
+    Whether the existing instance may match the requested instance with fingerprint. Like the full comparison, an
+    instance is ruled out when it has a different value at one of the paths, and values it does not have are not
+    compared. The instances which may match still need the full comparison.
+    """
+    missing = object()
+    for path, expected_value in fingerprint:
+        value = instance
+        for attr in path:
+            value = _get_instance_attr_value(value, attr, missing)
+            if value is missing:
+                break
+        if value is missing:
+            continue
+        if (value is None or isinstance(value, _SCALAR_TYPES)) and (
+            value != expected_value
+        ):
+            return False
+    return True
+
+
+def get_candidate_instances(compute_client, module):
+    """
+    Generate the existing instances which may match the requested instance, the latest first. The service filters the
+    instances by name and availability domain when they are matched on, and the remaining ones are checked against the
+    fingerprint of the request, so that only the likely matches are compared in full by check_and_create_resource.
+    """
+    key_by = module.params.get("key_by")
+    kwargs_list = {
+        "compartment_id": module.params["compartment_id"],
+        "sort_by": "TIMECREATED",
+    }
+    for attr, param in [
+        ("display_name", "name"),
+        ("availability_domain", "availability_domain"),
+    ]:
+        # Like check_and_create_resource, only narrow the listing by the attributes which are matched on.
+        if module.params[param] and (key_by is None or attr in key_by):
+            kwargs_list[attr] = module.params[param]
+    fingerprint = get_launch_fingerprint(module, get_launch_instance_details(module))
+    debug("Fingerprint of the requested instance: {0}".format(fingerprint))
+    try:
+        instances = oci_utils.list_all_resources_generator(
+            compute_client.list_instances, **kwargs_list
+        )
+    except ServiceError as ex:
+        module.fail_json(msg=ex.message)
+    # The terminated instances are listed for a while after they are terminated. list_instances only filters by a
+    # single lifecycle state, so they are skipped here.
+    return (
+        instance
+        for instance in instances
+        if instance.lifecycle_state not in ["TERMINATING", "TERMINATED"]
+        and may_match_launch_fingerprint(instance, fingerprint)
+    )
+
+
 def create_one_instance(compute_client, module):
     # is_pv_encryption_in_transit_enabled is a top level param on LaunchInstanceDetails but it gets returned
     # inside Instance.LaunchOptions so we need to propagate the value so that the existing resource matching
@@ -1337,6 +1489,11 @@ def create_one_instance(compute_client, module):
         kwargs_list={"compartment_id": module.params["compartment_id"]},
         module=module,
         model=LaunchInstanceDetails(),
+        existing_resources=(
+            None
+            if module.params.get("force_create")
+            else get_candidate_instances(compute_client, module)
+        ),
         exclude_attributes=_get_exclude_attributes(module),
         default_attribute_values={
             "ipxe_script": None,
@@ -1373,6 +1530,213 @@ def _generate_name_for_instance(name_prefix, suffix):
         return None
 
 
+def get_fleet_launch_instance_details(module, suffix):
+    lid = get_launch_instance_details(module)
+    lid.display_name = _generate_name_for_instance(module.params["name"], suffix)
+    cvd = get_vnic_details(module)
+    # The hostname of the VNIC must be unique in the subnet.
+    if cvd.hostname_label:
+        cvd.hostname_label = _generate_name_for_instance(cvd.hostname_label, suffix)
+    lid.create_vnic_details = cvd
+    return lid
+
+
+# The functions below run in the worker threads of ensure_instance_fleet. They raise errors instead of calling
+# module.fail_json, as the SystemExit of fail_json would kill the worker thread and hang the pool.
+def launch_fleet_instance(compute_client, launch_instance_details):
+    debug("Provisioning " + str(launch_instance_details))
+    # call_with_backoff retries the launch when the service is throttling or a limit is exceeded.
+    return oci_utils.call_with_backoff(
+        compute_client.launch_instance, launch_instance_details=launch_instance_details
+    )
+
+
+def terminate_fleet_instance(compute_client, preserve_boot_volume, instance):
+    debug("Terminating instance {0}".format(instance.display_name))
+    oci_utils.call_with_backoff(
+        compute_client.terminate_instance,
+        instance_id=instance.id,
+        preserve_boot_volume=preserve_boot_volume,
+    )
+    return oci_utils.call_with_backoff(
+        compute_client.get_instance, instance_id=instance.id
+    )
+
+
+def wait_for_fleet_instances(
+    compute_client, module, responses, states, succeed_on_not_found=False
+):
+    """Wait until all the instances of responses reach one of states and return their last get responses."""
+    waiter = oci_wait_utils.MultiResourceWaiter(
+        lambda response: response.data.lifecycle_state in states,
+        max_wait_seconds=module.params.get(
+            "wait_timeout", oci_utils.MAX_WAIT_TIMEOUT_IN_SECONDS
+        ),
+        resource_type=RESOURCE_NAME,
+        list_fn=partial(
+            oci_utils.list_all_resources,
+            compute_client.list_instances,
+            compartment_id=module.params["compartment_id"],
+        ),
+        succeed_on_not_found=succeed_on_not_found,
+        parallelism=FLEET_PARALLELISM,
+    )
+    for response in responses:
+        waiter.add(
+            response.data.id,
+            compute_client,
+            response,
+            fetch_fn=partial(
+                oci_utils.call_with_backoff,
+                compute_client.get_instance,
+                instance_id=response.data.id,
+            ),
+        )
+    results = waiter.wait()
+    return [results[response.data.id] for response in responses]
+
+
+@check_mode
+def add_fleet_instance_attachment_info(compute_client, instance):
+    instance["volume_attachments"] = oci_compute_utils.get_volume_attachments(
+        compute_client, instance
+    )
+    instance["boot_volume_attachment"] = oci_compute_utils.get_boot_volume_attachment(
+        compute_client, instance
+    )
+
+
+def add_fleet_instance_info(compute_client, network_client, instance):
+    instance = to_dict(instance)
+    add_fleet_instance_attachment_info(compute_client, instance)
+    primary_public_ip, primary_private_ip = oci_compute_utils.get_primary_ips(
+        compute_client, network_client, instance
+    )
+    instance["primary_public_ip"] = primary_public_ip
+    instance["primary_private_ip"] = primary_private_ip
+    return instance
+
+
+def ensure_instance_fleet(compute_client, network_client, module):
+    """
+    Launch the missing instances of the fleet of I(count) or I(exact_count) instances, and with I(exact_count) terminate
+    the surplus instances. The instances are matched by the names generated from I(name).
+    """
+    if module.params["state"] != "present":
+        module.fail_json(
+            msg="count and exact_count are only supported with state=present."
+        )
+    if not module.params["name"]:
+        module.fail_json(msg="name is required with count or exact_count.")
+    if (module.params["vnic"] or {}).get("private_ip"):
+        module.fail_json(
+            msg="vnic private_ip cannot be specified with count or exact_count."
+        )
+    # The names of all the instances of the fleet are generated from these, so check their format once.
+    for option, name_format in [
+        ("name", module.params["name"]),
+        ("vnic hostname_label", (module.params["vnic"] or {}).get("hostname_label")),
+    ]:
+        if name_format:
+            try:
+                name_format % 1
+            except TypeError:
+                pass
+            except ValueError as ex:
+                module.fail_json(
+                    msg="Invalid format in {0} {1}: {2}".format(
+                        option, name_format, str(ex)
+                    )
+                )
+    exact_count = module.params["exact_count"]
+    count = exact_count if exact_count is not None else module.params["count"]
+    if count < 0:
+        module.fail_json(msg="count and exact_count must not be negative.")
+
+    try:
+        existing_instances = [
+            instance
+            for instance in oci_utils.list_all_resources(
+                compute_client.list_instances,
+                compartment_id=module.params["compartment_id"],
+            )
+            if instance.lifecycle_state not in ["TERMINATING", "TERMINATED"]
+        ]
+        instances_by_name = dict(
+            (instance.display_name, instance) for instance in existing_instances
+        )
+        names = [
+            _generate_name_for_instance(module.params["name"], suffix)
+            for suffix in range(1, count + 1)
+        ]
+        missing_suffixes = [
+            suffix
+            for suffix, name in enumerate(names, 1)
+            if name not in instances_by_name
+        ]
+        surplus_instances = []
+        if exact_count is not None:
+            # The suffixes of the surplus instances are above exact_count, and there are no more surplus instances
+            # than instances in the compartment.
+            surplus_names = set(
+                _generate_name_for_instance(module.params["name"], suffix)
+                for suffix in range(count + 1, count + len(existing_instances) + 1)
+            )
+            surplus_instances = [
+                instance
+                for instance in existing_instances
+                if instance.display_name in surplus_names
+            ]
+
+        launch_responses = oci_common_utils.map_in_pool(
+            partial(launch_fleet_instance, compute_client),
+            [
+                get_fleet_launch_instance_details(module, suffix)
+                for suffix in missing_suffixes
+            ],
+            FLEET_PARALLELISM,
+        )
+        terminate_responses = oci_common_utils.map_in_pool(
+            partial(
+                terminate_fleet_instance,
+                compute_client,
+                module.params["preserve_boot_volume"],
+            ),
+            surplus_instances,
+            FLEET_PARALLELISM,
+        )
+        if module.params.get("wait", True):
+            launch_responses = wait_for_fleet_instances(
+                compute_client,
+                module,
+                launch_responses,
+                module.params.get("wait_until") or oci_utils.DEFAULT_READY_STATES,
+            )
+            wait_for_fleet_instances(
+                compute_client,
+                module,
+                terminate_responses,
+                ["TERMINATED"],
+                succeed_on_not_found=True,
+            )
+        for response in launch_responses:
+            instances_by_name[response.data.display_name] = response.data
+
+        instances = oci_common_utils.map_in_pool(
+            partial(add_fleet_instance_info, compute_client, network_client),
+            [instances_by_name[name] for name in names],
+            FLEET_PARALLELISM,
+        )
+    except ServiceError as ex:
+        module.fail_json(msg=ex.message)
+    except MaximumWaitTimeExceeded as ex:
+        module.fail_json(msg=str(ex))
+
+    return dict(
+        changed=bool(missing_suffixes or surplus_instances), instances=instances
+    )
+
+
 def main():
     my_logger = oci_utils.get_logger("oci_instance")
     set_logger(my_logger)
@@ -1409,6 +1773,8 @@ def main():
             ),
             volume_details=dict(type="dict", required=False),
             source_details=dict(type="dict", required=False),
+            count=dict(type="int", required=False),
+            exact_count=dict(type="int", required=False),
             vnic=dict(type="dict", aliases=["create_vnic_details"]),
             is_pv_encryption_in_transit_enabled=dict(type="bool"),
         )
@@ -1422,6 +1788,11 @@ def main():
             ["boot_volume_details", "image_id"],
             ["vnic", "instance_id"],
             ["source_details", "image_id"],
+            ["count", "exact_count"],
+            ["count", "instance_id"],
+            ["exact_count", "instance_id"],
+            ["count", "volume_details"],
+            ["exact_count", "volume_details"],
         ],
     )
 
@@ -1438,7 +1809,15 @@ def main():
 
     id = module.params["instance_id"]
     try:
-        if id is not None:
+        if (
+            module.params["count"] is not None
+            or module.params["exact_count"] is not None
+        ):
+            debug("ensure the fleet of instances")
+            module.exit_json(
+                **ensure_instance_fleet(compute_client, network_client, module)
+            )
+        elif id is not None:
             inst = None
 
             # Attempt to get the instance
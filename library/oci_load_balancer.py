@@ -22,6 +22,10 @@ short_description: Create, update and delete load balancers in OCI Load Balancin
 description:
     - Creates OCI Load Balancers
     - Update OCI Load Balancers, if present, with a new display name
+    - Update the backend sets, certificates, hostnames, path route sets and listeners of OCI Load Balancers, if present,
+      to the specified configuration. Only the ones that differ are created or updated, with one work request each,
+      and a backend set is updated with all its backends in a single work request. Configurations that are not
+      specified are left unchanged.
     - Delete OCI Load Balancers, if present.
 version_added: "2.5"
 options:
@@ -264,6 +268,22 @@ EXAMPLES = """
     load_balancer_id: "ocid1.loadbalancer.oc1.iad.xxxxxEXAMPLExxxxx"
     name: "ansible_lb_updated"
     state: 'present'
+# Update the backends of a backend set of a Load Balancer, with a single work request
+- name: Update the backends of backend set backend1 of a Load Balancer
+  oci_load_balancer:
+    load_balancer_id: "ocid1.loadbalancer.oc1.iad.xxxxxEXAMPLExxxxx"
+    backend_sets:
+      'backend1':
+        backends:
+          - ip_address: '10.159.34.21'
+            port: 8080
+          - ip_address: '10.159.34.22'
+            port: 8080
+        health_checker:
+          protocol: 'HTTP'
+          url_path: '/healthcheck'
+        policy: 'ROUND_ROBIN'
+    state: 'present'
 # Deleted Load Balancer
 - name: Update Load Balancer
   oci_load_balancer:
@@ -612,6 +632,24 @@ def update_load_balancer(lb_client, module, load_balancer):
             )
         )
     result = dict(load_balancer=to_dict(load_balancer), changed=False)
+    configuration_changes = oci_lb_utils.get_lb_configuration_changes(
+        lb_client, module, load_balancer
+    )
+    if configuration_changes:
+        get_logger().info(
+            "Updating the configuration of load balancer %s", load_balancer.id
+        )
+        oci_lb_utils.apply_lb_configuration_changes(
+            lb_client, module, configuration_changes
+        )
+        result = dict(
+            load_balancer=to_dict(
+                oci_utils.call_with_backoff(
+                    lb_client.get_load_balancer, load_balancer_id=load_balancer.id
+                ).data
+            ),
+            changed=True,
+        )
     name = module.params["display_name"]
     defined_tags = module.params["defined_tags"]
     freeform_tags = module.params["freeform_tags"]
@@ -46,8 +46,17 @@ options:
         default: "application/octet-stream"
     dest:
         description: The destination file path when downloading an object. Use with I(state=present) to download an
-                     object. This option is mutually exclusive with I(src).
+                     object. This option is mutually exclusive with I(src). The object is not downloaded when
+                     I(dest) already has the same content as the object.
         required: false
+    atomic_download:
+        description: Use I(atomic_download=True) to download the object to a temporary file in the directory of
+                     I(dest), and rename it to I(dest) once the download completes. This ensures that I(dest) never
+                     holds a partially downloaded object. Use I(atomic_download=False) to write the object directly
+                     to I(dest).
+        required: false
+        default: True
+        type: bool
     force:
         description: Force overwriting existing local file when downloading or existing remote object when uploading.
         required: false
@@ -61,7 +70,8 @@ options:
     object_name:
         description: Name of the object. For naming convention, refer
                      U(https://docs.us-phoenix-1.oraclecloud.com/Content/Object/Tasks/managingobjects.htm#namerequirements).
-        required: true
+                     Required unless I(src_dir) or I(dest_dir) is specified.
+        required: false
         aliases: [ 'name', 'object' ]
     opc_client_request_id:
         description: The client request ID for tracing.
@@ -74,6 +84,36 @@ options:
         description: The source file path when uploading an object. Use with I(state=present) to upload
                      an object. This option is mutually exclusive with I(dest).
         required: false
+    src_dir:
+        description: The source directory when syncing a directory to the bucket. Each file under I(src_dir) is
+                     uploaded as the object named I(prefix) followed by the path of the file relative to I(src_dir).
+                     The bucket is listed once, and only the files that are not in the bucket with the same content
+                     are uploaded. Use with I(state=present). This option is mutually exclusive with I(src), I(dest)
+                     and I(dest_dir).
+        required: false
+    dest_dir:
+        description: The destination directory when syncing the objects of the bucket to a local directory. Each
+                     object whose name starts with I(prefix) is downloaded to the path given by the rest of its name,
+                     relative to I(dest_dir). The bucket is listed once, and only the objects that are not in
+                     I(dest_dir) with the same content are downloaded. Use with I(state=present). This option is
+                     mutually exclusive with I(src), I(dest) and I(src_dir).
+        required: false
+    prefix:
+        description: The prefix of the names of the objects synced with I(src_dir) or I(dest_dir). Include the
+                     trailing "/" to sync with a folder of the bucket.
+        required: false
+    delete:
+        description: Use I(delete=True) with I(src_dir) to delete the objects under I(prefix) that have no
+                     corresponding file in I(src_dir), or with I(dest_dir) to delete the files in I(dest_dir) that have
+                     no corresponding object under I(prefix).
+        required: false
+        default: False
+        type: bool
+    parallel_transfer_count:
+        description: The maximum number of files transferred concurrently with I(src_dir) or I(dest_dir).
+        required: false
+        default: 10
+        type: int
     upload_id:
         description: The upload ID for a multipart upload. Use with I(state=abort_multipart_upload) to abort
                      an in-progress multipart upload, and delete all the parts that have been uploaded.
@@ -89,6 +129,21 @@ options:
                      when I(multipart_upload=True).
         required: false
         default: True
+    parallel_downloads:
+        description: Use I(parallel_downloads=True) to download an object larger than I(download_part_size_in_mbs)
+                     in parts, with concurrent range requests. An interrupted part is resumed from where it stopped.
+                     Disable parallel download feature with I(parallel_downloads=False).
+        required: false
+        default: True
+    download_part_size_in_mbs:
+        description: The size in MiB of each part when downloading an object with I(parallel_downloads=True).
+        required: false
+        default: 64
+    parallel_download_count:
+        description: The maximum number of parts downloaded concurrently when downloading an object with
+                     I(parallel_downloads=True).
+        required: false
+        default: 8
     state:
         description: The final state of the object after the task.
                      Use I(state=absent) with I(object) to delete a specific object.
@@ -129,6 +184,15 @@ EXAMPLES = """
     object: key.txt
     dest: /usr/local/new_file.txt
 
+- name: Get/download a large object in parts of 128 MiB, with up to 16 concurrent range requests
+  oci_object:
+    namespace: mynamespace
+    bucket: mybucket
+    object: backup.tar.gz
+    dest: /usr/local/backup.tar.gz
+    download_part_size_in_mbs: 128
+    parallel_download_count: 16
+
 - name: Avoid overwriting an existing file when downloading an object. The task would fail if the local file pointed
         to by I(dest) already exists
   oci_object:
@@ -138,6 +202,21 @@ EXAMPLES = """
     dest: /usr/local/myfile.txt
     force: false
 
+- name: Sync a local directory to a folder of the bucket, deleting the objects of the folder that have no local file
+  oci_object:
+    namespace: mynamespace
+    bucket: mybucket
+    src_dir: /usr/local/site
+    prefix: site/
+    delete: True
+
+- name: Sync a folder of the bucket to a local directory
+  oci_object:
+    namespace: mynamespace
+    bucket: mybucket
+    prefix: site/
+    dest_dir: /usr/local/site
+
 - name: Abort multipart upload
   oci_object:
     namespace: mynamespace
@@ -177,23 +256,45 @@ object:
             "opc-meta-author": "RC",
             "opc-request-id": "79bcd894-8a9d-fbfe-3717-fd92d518d0a1"
         }
+transferred:
+    description: Names of the objects uploaded from I(src_dir) or downloaded to I(dest_dir)
+    returned: When I(src_dir) or I(dest_dir) is specified
+    type: list
+    sample: ["site/index.html", "site/css/main.css"]
+deleted:
+    description: Names of the objects deleted with I(src_dir), or paths of the files deleted with I(dest_dir), when
+                 I(delete=True)
+    returned: When I(src_dir) or I(dest_dir) is specified
+    type: list
+    sample: ["site/old.html"]
 """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_bytes
-from ansible.module_utils.oracle import oci_utils
+from ansible.module_utils.oracle import oci_utils, oci_common_utils
 import base64
+import hashlib
 import os
+import tempfile
+import time
+from functools import partial
 
 try:
     from oci.object_storage.object_storage_client import ObjectStorageClient
     from oci.exceptions import ServiceError
     from oci.object_storage import UploadManager
+    from oci.object_storage.transfer.constants import DEFAULT_PART_SIZE
 
     HAS_OCI_PY_SDK = True
 except ImportError:
     HAS_OCI_PY_SDK = False
 
+MEBIBYTE = 1024 * 1024
+# Size of the chunks in which local files and objects are streamed.
+CHUNK_SIZE = MEBIBYTE
+# Maximum number of attempts to download a part of an object when downloading in parts.
+DOWNLOAD_PART_MAX_ATTEMPTS = 5
+
 
 def delete_object(object_storage_client, module):
     namespace = module.params["namespace_name"]
@@ -218,50 +319,240 @@ def delete_object(object_storage_client, module):
     return result
 
 
+def get_file_md5(file_path, part_size=None):
+    """Get the base-64 encoded MD5 hash of the file, reading it once in chunks.
+
+    With part_size, get the checksum the service reports in opc-multipart-md5 for the file uploaded in parts of
+    part_size bytes instead: the MD5 hash of the concatenated MD5 digests of the parts, followed by a hyphen and the
+    number of parts.
+    """
+    with open(to_bytes(file_path), "rb") as file_obj:
+        if part_size is None:
+            file_md5 = hashlib.md5()
+            for chunk in iter(partial(file_obj.read, CHUNK_SIZE), b""):
+                file_md5.update(chunk)
+            return base64.b64encode(file_md5.digest()).decode("ascii")
+
+        part_digests = []
+        while True:
+            part_md5 = hashlib.md5()
+            part_length = 0
+            while part_length < part_size:
+                chunk = file_obj.read(min(CHUNK_SIZE, part_size - part_length))
+                if not chunk:
+                    break
+                part_md5.update(chunk)
+                part_length += len(chunk)
+            if part_length == 0:
+                break
+            part_digests.append(part_md5.digest())
+            if part_length < part_size:
+                break
+
+    multipart_md5 = hashlib.md5(b"".join(part_digests)).digest()
+    return "{0}-{1}".format(
+        base64.b64encode(multipart_md5).decode("ascii"), len(part_digests)
+    )
+
+
+def is_file_same_as_object(file_path, object_headers):
+    """Check whether the local file has the same content as the object with the given response headers."""
+    if not os.path.isfile(to_bytes(file_path)):
+        return False
+    # Compare the sizes first to avoid computing the checksum of a file which is known to differ.
+    content_length = object_headers.get("Content-Length", None)
+    if content_length is not None and int(content_length) != os.path.getsize(
+        to_bytes(file_path)
+    ):
+        return False
+    # Objects uploaded in parts have no Content-MD5. Their checksum is derived from the MD5 hashes of the parts, so
+    # compute it with the part size used by UploadManager.
+    multipart_md5 = object_headers.get("opc-multipart-md5", None)
+    if multipart_md5 is not None:
+        return get_file_md5(file_path, DEFAULT_PART_SIZE) == multipart_md5
+    return get_file_md5(file_path) == object_headers.get("Content-MD5", None)
+
+
+def write_object_to_file(response, file_obj):
+    """Stream the body of a get_object response to file_obj in chunks, without holding the object in memory."""
+    for chunk in response.data.raw.stream(CHUNK_SIZE, decode_content=False):
+        file_obj.write(chunk)
+
+
+def check_object_part_response(response, start, end):
+    """Check that a get_object response has the requested byte range, so that a server ignoring the Range header
+    cannot write the object at the wrong offset."""
+    content_range = response.headers.get("Content-Range", "")
+    if response.status != 206 or not content_range.startswith(
+        "bytes {0}-{1}/".format(start, end)
+    ):
+        raise IOError(
+            "Requested bytes {0}-{1} of the object, received status {2} with Content-Range '{3}'.".format(
+                start, end, response.status, content_range
+            )
+        )
+
+
+def download_object_part(
+    object_storage_client, module, object_name, file_path, etag, part
+):
+    """Download the byte range part=(start, end) of the object into file_path at the same offset.
+
+    An interrupted part is resumed from the last byte written to the file, after a backoff, up to
+    DOWNLOAD_PART_MAX_ATTEMPTS attempts. Every request is conditional on the ETag of the object, so that all the parts
+    come from the same version of the object.
+    """
+    start, end = part
+    attempt = 0
+    while True:
+        try:
+            response = oci_utils.call_with_backoff(
+                object_storage_client.get_object,
+                namespace_name=module.params["namespace_name"],
+                bucket_name=module.params["bucket_name"],
+                object_name=object_name,
+                if_match=etag,
+                range="bytes={0}-{1}".format(start, end),
+            )
+            check_object_part_response(response, start, end)
+            with open(to_bytes(file_path), "r+b") as dest_file:
+                dest_file.seek(start)
+                for chunk in response.data.raw.stream(CHUNK_SIZE, decode_content=False):
+                    if start + len(chunk) > end + 1:
+                        raise IOError(
+                            "Received more than the requested bytes {0}-{1} of the object.".format(
+                                part[0], end
+                            )
+                        )
+                    dest_file.write(chunk)
+                    start += len(chunk)
+            if start <= end:
+                raise IOError(
+                    "The download of bytes {0}-{1} of the object stopped at byte {2}.".format(
+                        part[0], end, start
+                    )
+                )
+            return
+        except ServiceError:
+            raise
+        except Exception:
+            attempt += 1
+            if attempt >= DOWNLOAD_PART_MAX_ATTEMPTS:
+                raise
+            time.sleep(2**attempt)
+
+
+def download_object_in_parts(
+    object_storage_client, module, object_name, file_path, object_size, etag
+):
+    part_size = module.params["download_part_size_in_mbs"] * MEBIBYTE
+    parts = [
+        (start, min(start + part_size, object_size) - 1)
+        for start in range(0, object_size, part_size)
+    ]
+
+    # Preallocate the file so that each part can be written at its offset independently.
+    with open(to_bytes(file_path), "wb") as dest_file:
+        dest_file.truncate(object_size)
+
+    oci_common_utils.map_in_pool(
+        partial(
+            download_object_part,
+            object_storage_client,
+            module,
+            object_name,
+            file_path,
+            etag,
+        ),
+        parts,
+        module.params["parallel_download_count"],
+    )
+
+
+def download_object(
+    object_storage_client, module, object_name, file_path, object_headers=None
+):
+    """Download the object to file_path and return the headers of the object.
+
+    Objects larger than download_part_size_in_mbs are downloaded with concurrent range requests when
+    parallel_downloads is enabled. This needs the Content-Length and ETag of the object in object_headers.
+    """
+    if object_headers is not None and module.params["parallel_downloads"]:
+        object_size = int(object_headers.get("Content-Length", 0))
+        if object_size > module.params["download_part_size_in_mbs"] * MEBIBYTE:
+            download_object_in_parts(
+                object_storage_client,
+                module,
+                object_name,
+                file_path,
+                object_size,
+                object_headers.get("ETag"),
+            )
+            return dict(object_headers)
+
+    response = oci_utils.call_with_backoff(
+        object_storage_client.get_object,
+        namespace_name=module.params["namespace_name"],
+        bucket_name=module.params["bucket_name"],
+        object_name=object_name,
+    )
+    with open(to_bytes(file_path), "wb") as dest_file:
+        write_object_to_file(response, dest_file)
+    return dict(response.headers)
+
+
+def download_object_to_dest(
+    object_storage_client, module, object_name, dest, object_headers=None
+):
+    """Download the object to dest, through a temporary file in the same directory with atomic_download."""
+    if not module.params["atomic_download"]:
+        return download_object(
+            object_storage_client, module, object_name, dest, object_headers
+        )
+
+    dest_dir = os.path.dirname(os.path.abspath(to_bytes(dest)))
+    fd, tmp_dest = tempfile.mkstemp(
+        prefix=b".oci_object_", suffix=b".tmp", dir=dest_dir
+    )
+    os.close(fd)
+    module.add_cleanup_file(tmp_dest)
+    headers = download_object(
+        object_storage_client, module, object_name, tmp_dest, object_headers
+    )
+    module.atomic_move(tmp_dest, to_bytes(dest))
+    return headers
+
+
 def get_object(object_storage_client, module):
-    namespace = module.params["namespace_name"]
-    bucket = module.params["bucket_name"]
-    obj = module.params["object_name"]
     dest = module.params["dest"]
 
     result = dict()
 
+    # Check if the file exists with the same checksum before downloading the object. The object details are also
+    # used to decide whether to download the object in parts.
+    remote_object = head_object(object_storage_client, module)
+    if remote_object is not None and is_file_same_as_object(
+        dest, remote_object.headers
+    ):
+        result["changed"] = False
+        return result
+
     try:
-        response = oci_utils.call_with_backoff(
-            object_storage_client.get_object,
-            namespace_name=namespace,
-            bucket_name=bucket,
-            object_name=obj,
+        result["object"] = download_object_to_dest(
+            object_storage_client,
+            module,
+            module.params["object_name"],
+            dest,
+            remote_object.headers if remote_object is not None else None,
         )
     except ServiceError as ex:
         module.fail_json(msg=ex.message)
-
-    # create dest file if it does not exist
-    try:
-        with open(dest, "a"):
-            pass
-    except IOError as ioex:
+    except (IOError, OSError) as ioex:
         module.fail_json(
-            msg="Error opening/creating the dest file: {0}".format(str(ioex))
+            msg="Error writing the object to the dest file: {0}".format(str(ioex))
         )
 
-    # Check if file exists with the same checksum. Get md5 hexdigest of the file content, convert it to binary and then
-    #  get base-64 encoded MD5 hash.
-    dest_md5 = base64.b64encode(base64.b16decode(module.md5(dest), True)).decode(
-        "ascii"
-    )
-    if os.path.isfile(to_bytes(dest)) and (
-        dest_md5 == response.headers.get("Content-MD5", None)
-        or dest_md5 == response.headers.get("opc-multipart-md5", None)
-    ):
-        changed = False
-    else:
-        with open(to_bytes(dest), "wb") as dest_file:
-            dest_file.write(response.data.content)
-            changed = True
-            result["object"] = dict(response.headers)
-
-    result["changed"] = changed
+    result["changed"] = True
 
     return result
 
@@ -305,14 +596,9 @@ def put_object(object_storage_client, module):
     # Check if the object exists with same checksum.
     remote_object = head_object(object_storage_client, module)
 
-    src_md5 = base64.b64encode(base64.b16decode(module.md5(src), True)).decode("ascii")
-
     # ENHANCEMENT_OVER_SDK: This is a EoU enhancement to make it easier for an Ansible user to provide
     # content for their object
-    if remote_object is not None and (
-        src_md5 == remote_object.headers.get("Content-MD5", None)
-        or src_md5 == remote_object.headers.get("opc-multipart-md5", None)
-    ):
+    if remote_object is not None and is_file_same_as_object(src, remote_object.headers):
         changed = False
     elif module.params.get("multipart_upload"):
         # Note: If the file size is less than 128 MB, UploadManager will automatically chose the upload strategy
@@ -403,15 +689,202 @@ def src_is_valid(module, src):
     return True
 
 
+def get_local_manifest(dir_path):
+    """Map the path of each file under dir_path, relative to dir_path and separated with "/", to the path of the file."""
+    manifest = dict()
+    for root, dirs, files in os.walk(dir_path):
+        for file_name in files:
+            file_path = os.path.join(root, file_name)
+            relative_path = os.path.relpath(file_path, dir_path)
+            manifest[relative_path.replace(os.sep, "/")] = file_path
+    return manifest
+
+
+def get_remote_manifest(object_storage_client, module):
+    """Map the name of each object under prefix, relative to prefix, to its summary. The bucket is listed once."""
+    prefix = module.params["prefix"] or ""
+    list_kwargs = dict(fields="name,size,md5,etag")
+    if prefix:
+        list_kwargs["prefix"] = prefix
+    objects = oci_utils.list_all_resources(
+        object_storage_client.list_objects,
+        namespace_name=module.params["namespace_name"],
+        bucket_name=module.params["bucket_name"],
+        **list_kwargs
+    ).objects
+    # Skip the zero-byte objects that represent folders.
+    return dict(
+        (obj.name[len(prefix) :], obj) for obj in objects if not obj.name.endswith("/")
+    )
+
+
+def get_object_summary_headers(object_summary):
+    """Get the headers of an object, as returned by head_object, from its summary in a list_objects response."""
+    headers = {"Content-Length": object_summary.size, "ETag": object_summary.etag}
+    # The md5 of an object uploaded in parts is its multipart checksum, which ends with "-<number of parts>".
+    if object_summary.md5 is not None and "-" in object_summary.md5:
+        headers["opc-multipart-md5"] = object_summary.md5
+    else:
+        headers["Content-MD5"] = object_summary.md5
+    return headers
+
+
+def upload_file(object_storage_client, module, file_path, object_name):
+    namespace = module.params["namespace_name"]
+    bucket = module.params["bucket_name"]
+
+    if module.params.get("multipart_upload"):
+        upload_manager = UploadManager(
+            object_storage_client,
+            allow_parallel_uploads=module.params.get("parallel_uploads"),
+        )
+        return oci_utils.call_with_backoff(
+            upload_manager.upload_file,
+            namespace_name=namespace,
+            bucket_name=bucket,
+            object_name=object_name,
+            file_path=file_path,
+        )
+
+    with open(to_bytes(file_path), "rb") as src_file:
+        return oci_utils.call_with_backoff(
+            object_storage_client.put_object,
+            namespace_name=namespace,
+            bucket_name=bucket,
+            object_name=object_name,
+            put_object_body=src_file,
+        )
+
+
+def sync_upload_file(object_storage_client, module, transfer):
+    """Upload a file of src_dir, unless the object exists with the same content. Return whether it was uploaded."""
+    object_name, file_path, object_summary = transfer
+    if object_summary is not None and (
+        not module.params["force"]
+        or is_file_same_as_object(file_path, get_object_summary_headers(object_summary))
+    ):
+        return False
+    upload_file(object_storage_client, module, file_path, object_name)
+    return True
+
+
+def sync_download_file(object_storage_client, module, transfer):
+    """Download an object to dest_dir, unless the file exists with the same content. Return whether it was
+    downloaded."""
+    object_name, file_path, object_summary = transfer
+    object_headers = get_object_summary_headers(object_summary)
+    if os.path.exists(to_bytes(file_path)) and (
+        not module.params["force"] or is_file_same_as_object(file_path, object_headers)
+    ):
+        return False
+    file_dir = os.path.dirname(to_bytes(file_path))
+    try:
+        os.makedirs(file_dir)
+    except OSError:
+        # The directory may have been created by another transfer.
+        if not os.path.isdir(file_dir):
+            raise
+    download_object_to_dest(
+        object_storage_client, module, object_name, file_path, object_headers
+    )
+    return True
+
+
+def sync_directory(object_storage_client, module):
+    """Sync src_dir to the objects under prefix, or the objects under prefix to dest_dir.
+
+    The bucket is listed once and compared with the files in the directory, and only the files that differ are
+    transferred, with at most parallel_transfer_count transfers at a time. With delete, the objects or files which
+    are not in the source are deleted.
+    """
+    src_dir = module.params["src_dir"]
+    dest_dir = module.params["dest_dir"]
+    prefix = module.params["prefix"] or ""
+    pool_size = module.params["parallel_transfer_count"]
+
+    result = dict(changed=False, transferred=[], deleted=[])
+
+    try:
+        remote_manifest = get_remote_manifest(object_storage_client, module)
+        if src_dir is not None:
+            local_manifest = get_local_manifest(src_dir)
+            transfers = [
+                (prefix + name, file_path, remote_manifest.get(name))
+                for name, file_path in sorted(local_manifest.items())
+            ]
+            transferred = oci_common_utils.map_in_pool(
+                partial(sync_upload_file, object_storage_client, module),
+                transfers,
+                pool_size,
+            )
+            extra = sorted(
+                prefix + name for name in remote_manifest if name not in local_manifest
+            )
+            if module.params["delete"]:
+                oci_common_utils.map_in_pool(
+                    lambda object_name: oci_utils.call_with_backoff(
+                        object_storage_client.delete_object,
+                        namespace_name=module.params["namespace_name"],
+                        bucket_name=module.params["bucket_name"],
+                        object_name=object_name,
+                    ),
+                    extra,
+                    pool_size,
+                )
+        else:
+            for name in remote_manifest:
+                if any(part in ("", ".", "..") for part in name.split("/")):
+                    module.fail_json(
+                        msg="Object {0} cannot be downloaded to a path in {1}.".format(
+                            prefix + name, dest_dir
+                        )
+                    )
+            local_manifest = get_local_manifest(dest_dir)
+            transfers = [
+                (prefix + name, os.path.join(dest_dir, *name.split("/")), summary)
+                for name, summary in sorted(remote_manifest.items())
+            ]
+            transferred = oci_common_utils.map_in_pool(
+                partial(sync_download_file, object_storage_client, module),
+                transfers,
+                pool_size,
+            )
+            extra = sorted(
+                file_path
+                for name, file_path in local_manifest.items()
+                if name not in remote_manifest
+            )
+            if module.params["delete"]:
+                for file_path in extra:
+                    os.remove(to_bytes(file_path))
+    except ServiceError as ex:
+        module.fail_json(msg=ex.message)
+    except (IOError, OSError) as ioex:
+        module.fail_json(msg="Error syncing the directory: {0}".format(str(ioex)))
+
+    result["transferred"] = [
+        transfer[0] for transfer, done in zip(transfers, transferred) if done
+    ]
+    if module.params["delete"]:
+        result["deleted"] = extra
+    result["changed"] = bool(result["transferred"] or result["deleted"])
+    return result
+
+
 def main():
     module_args = oci_utils.get_common_arg_spec()
     module_args.update(
         dict(
             namespace_name=dict(type="str", required=True, aliases=["namespace"]),
             bucket_name=dict(type="str", required=True, aliases=["bucket"]),
-            object_name=dict(type="str", required=True, aliases=["object", "name"]),
+            object_name=dict(type="str", required=False, aliases=["object", "name"]),
             src=dict(type="str", required=False),
             dest=dict(type="str", required=False),
+            src_dir=dict(type="str", required=False),
+            dest_dir=dict(type="str", required=False),
+            prefix=dict(type="str", required=False),
+            delete=dict(type="bool", required=False, default=False),
+            parallel_transfer_count=dict(type="int", required=False, default=10),
             state=dict(
                 type="str",
                 required=False,
@@ -433,18 +906,26 @@ def main():
             opc_meta=dict(type=dict, required=False, aliases=["metadata"]),
             multipart_upload=dict(type=bool, required=False, default=True),
             parallel_uploads=dict(type=bool, required=False, default=True),
+            atomic_download=dict(type="bool", required=False, default=True),
+            parallel_downloads=dict(type="bool", required=False, default=True),
+            download_part_size_in_mbs=dict(type="int", required=False, default=64),
+            parallel_download_count=dict(type="int", required=False, default=8),
         )
     )
 
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False,
-        mutually_exclusive=[("src", "dest")],
+        mutually_exclusive=[("src", "dest", "src_dir", "dest_dir")],
     )
 
     if not HAS_OCI_PY_SDK:
         module.fail_json(msg="oci python sdk required for this module")
 
+    for option in ["download_part_size_in_mbs", "parallel_download_count"]:
+        if module.params[option] < 1:
+            module.fail_json(msg="{0} must be a positive integer.".format(option))
+
     object_storage_client = oci_utils.create_service_client(module, ObjectStorageClient)
 
     state = module.params["state"]
@@ -452,9 +933,24 @@ def main():
     dest = module.params["dest"]
     force = module.params["force"]
     obj = module.params["object_name"]
+    src_dir = module.params["src_dir"]
+    dest_dir = module.params["dest_dir"]
     result = dict(changed=False)
 
-    if state == "present" and dest is not None:
+    if obj is None and (state != "present" or (src_dir is None and dest_dir is None)):
+        module.fail_json(
+            msg="object_name is required unless src_dir or dest_dir is specified."
+        )
+
+    if state == "present" and src_dir is not None:
+        if not os.path.isdir(to_bytes(src_dir)):
+            module.fail_json(msg="The source path %s must be a directory." % src_dir)
+        result = sync_directory(object_storage_client, module)
+
+    elif state == "present" and dest_dir is not None:
+        result = sync_directory(object_storage_client, module)
+
+    elif state == "present" and dest is not None:
         if force is True or not os.path.isfile(to_bytes(dest)):
             result = get_object(object_storage_client, module)
         else:
@@ -482,7 +978,7 @@ def main():
         result = abort_multipart_upload(object_storage_client, module)
 
     else:
-        module.fail_json(msg="Missing either src or dest option.")
+        module.fail_json(msg="Missing either src, dest, src_dir or dest_dir option.")
 
     module.exit_json(**result)
 
@@ -43,6 +43,38 @@ options:
     text:
         description: The text to search for. Required when free text search is desired, I(type="FreeText").
         required: false
+    max_results:
+        description: The maximum number of resources to return. The search stops fetching pages once this many
+                     resources are found. By default, all the matching resources are returned.
+        required: false
+        type: int
+    page_size:
+        description: The number of resources fetched with each search request, between 1 and 1000. The resources are
+                     also processed in batches of this size.
+        required: false
+        type: int
+        default: 500
+    hydrate:
+        description: When set to C(true), the full details of each found resource are fetched with its C(get) call and
+                     returned in I(resource_details). The resource types that can be hydrated are AutonomousDatabase,
+                     BootVolume, Compartment, DbSystem, FileSystem, Group, Image, Instance, LoadBalancer, Policy,
+                     RouteTable, SecurityList, Subnet, User, Vcn, Volume and VolumeBackup. I(resource_details) is
+                     null for the other resource types and for the resources deleted since the search.
+        required: false
+        type: bool
+        default: false
+    hydration_parallelism:
+        description: The maximum number of concurrent C(get) calls when I(hydrate=true).
+        required: false
+        type: int
+        default: 10
+    dest:
+        description: The path of a file to write the found resources to, one JSON document per line, instead of
+                     returning them in I(search_resources). Use this for searches returning many resources, the
+                     resources are then written out batch by batch and not held in memory. The file is replaced
+                     only once the search completes.
+        required: false
+        type: path
 author: "Sivakumar Thyagarajan (@sivakumart)"
 extends_documentation_fragment: [ oracle ]
 """
@@ -58,12 +90,25 @@ EXAMPLES = """
   oci_search_resources_facts:
     type: "Structured"
     query: "query user resources where displayName = 'jane'"
+
+- name: Find the first 100 running instances, with their full details
+  oci_search_resources_facts:
+    type: "Structured"
+    query: "query instance resources where lifeCycleState = 'RUNNING'"
+    max_results: 100
+    hydrate: true
+
+- name: Write all the resources in the tenancy to a file, one JSON document per line
+  oci_search_resources_facts:
+    type: "Structured"
+    query: "query all resources"
+    dest: /tmp/all_resources.json
 """
 
 RETURN = """
 search_resources:
     description: A resource that exists in the user's cloud network.
-    returned: On successful operation
+    returned: On successful operation, when I(dest) is not specified
     type: complex
     contains:
         resource_type:
@@ -113,6 +158,10 @@ search_resources:
                             values are wrapped with .. tags. All values are HTML-encoded (except tags).
                 type: string
                 returned: always
+        resource_details:
+            description: The full details of the resource, as returned by its C(get) call.
+            type: complex
+            returned: When I(hydrate=true)
     sample:  [
                 {
                   "resourceType": "User",
@@ -151,10 +200,26 @@ search_resources:
               }
             }
         ]
+search_resources_count:
+    description: The number of resources found.
+    returned: On successful operation
+    type: int
+    sample: 2
+dest:
+    description: The path of the file the found resources were written to.
+    returned: When I(dest) is specified
+    type: string
+    sample: /tmp/all_resources.json
 """
 
+import json
+import os
+import tempfile
+from functools import partial
+from itertools import islice
+
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.oracle import oci_utils
+from ansible.module_utils.oracle import oci_utils, oci_common_utils
 
 try:
     from oci.resource_search.resource_search_client import ResourceSearchClient
@@ -162,12 +227,150 @@ try:
         FreeTextSearchDetails,
         StructuredSearchDetails,
     )
+    from oci.core import BlockstorageClient, ComputeClient, VirtualNetworkClient
+    from oci.database import DatabaseClient
+    from oci.exceptions import ServiceError
+    from oci.file_storage import FileStorageClient
+    from oci.identity import IdentityClient
+    from oci.load_balancer import LoadBalancerClient
 
     HAS_OCI_PY_SDK = True
 except ImportError:
     HAS_OCI_PY_SDK = False
 
 
+def get_hydration_functions():
+    """Map the resource types that can be hydrated to the client class and the name of their get function."""
+    return {
+        "AutonomousDatabase": (DatabaseClient, "get_autonomous_database"),
+        "BootVolume": (BlockstorageClient, "get_boot_volume"),
+        "Compartment": (IdentityClient, "get_compartment"),
+        "DbSystem": (DatabaseClient, "get_db_system"),
+        "FileSystem": (FileStorageClient, "get_file_system"),
+        "Group": (IdentityClient, "get_group"),
+        "Image": (ComputeClient, "get_image"),
+        "Instance": (ComputeClient, "get_instance"),
+        "LoadBalancer": (LoadBalancerClient, "get_load_balancer"),
+        "Policy": (IdentityClient, "get_policy"),
+        "RouteTable": (VirtualNetworkClient, "get_route_table"),
+        "SecurityList": (VirtualNetworkClient, "get_security_list"),
+        "Subnet": (VirtualNetworkClient, "get_subnet"),
+        "User": (IdentityClient, "get_user"),
+        "Vcn": (VirtualNetworkClient, "get_vcn"),
+        "Volume": (BlockstorageClient, "get_volume"),
+        "VolumeBackup": (BlockstorageClient, "get_volume_backup"),
+    }
+
+
+def get_search_details(module):
+    matching_context_type = module.params.get("matching_context_type")
+    if module.params["type"] == "FreeText":
+        ftsd = FreeTextSearchDetails()
+        ftsd.type = "FreeText"
+        if matching_context_type is not None:
+            ftsd.matching_context_type = matching_context_type
+        ftsd.text = module.params["text"]
+        return ftsd
+    ssd = StructuredSearchDetails()
+    if matching_context_type is not None:
+        ssd.type = "Structured"
+    ssd.matching_context_type = matching_context_type
+    ssd.query = module.params["query"]
+    return ssd
+
+
+def get_batches(iterable, batch_size):
+    """Generate lists of up to batch_size consecutive items of iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def add_hydration_clients(module, hydration_clients, resource_summaries):
+    """
+    Add to hydration_clients, keyed by client class, the clients needed to hydrate resource_summaries. The clients
+    are created before the hydration threads start, as create_service_client may fail the module and fail_json in a
+    thread pool worker hangs the pool.
+    """
+    hydration_functions = get_hydration_functions()
+    for resource_summary in resource_summaries:
+        client_class, get_fn_name = hydration_functions.get(
+            resource_summary.resource_type, (None, None)
+        )
+        if client_class is not None and client_class not in hydration_clients:
+            hydration_clients[client_class] = oci_utils.create_service_client(
+                module, client_class
+            )
+
+
+def get_resource_details(hydration_clients, resource_summary):
+    """Get the full details of a found resource, or None if its type cannot be hydrated or it no longer exists."""
+    hydration_function = get_hydration_functions().get(resource_summary.resource_type)
+    if hydration_function is None:
+        return None
+    client_class, get_fn_name = hydration_function
+    client = hydration_clients[client_class]
+    try:
+        return oci_utils.call_with_backoff(
+            partial(getattr(client, get_fn_name), resource_summary.identifier)
+        ).data
+    except ServiceError as ex:
+        if ex.status == 404:
+            return None
+        raise
+
+
+def get_search_result_batches(module, resource_search_client):
+    """
+    Generate the found resources, as dicts, in batches of page_size. The pages are fetched while the batches are
+    consumed, so only one batch is held in memory at a time.
+    """
+    page_size = module.params["page_size"]
+    max_results = module.params["max_results"]
+    resource_summaries = oci_utils.list_all_resources_generator(
+        resource_search_client.search_resources,
+        search_details=get_search_details(module),
+        limit=min(page_size, max_results or page_size),
+    )
+    if max_results is not None:
+        resource_summaries = islice(resource_summaries, max_results)
+    hydration_clients = {}
+    for batch in get_batches(resource_summaries, page_size):
+        results = oci_utils.to_dict(batch)
+        if module.params["hydrate"]:
+            add_hydration_clients(module, hydration_clients, batch)
+            resource_details = oci_common_utils.map_in_pool(
+                partial(get_resource_details, hydration_clients),
+                batch,
+                module.params["hydration_parallelism"],
+            )
+            for result, details in zip(results, resource_details):
+                result["resource_details"] = oci_utils.to_dict(details)
+        yield results
+
+
+def write_search_results(module, resource_search_client, dest):
+    """Write the found resources to dest, one JSON document per line, and return the number of resources written."""
+    dest_dir = os.path.dirname(os.path.abspath(dest))
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir)
+    count = 0
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            for batch in get_search_result_batches(module, resource_search_client):
+                for result in batch:
+                    tmp_file.write(json.dumps(result, default=str))
+                    tmp_file.write("\n")
+                count += len(batch)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    module.atomic_move(tmp_path, dest)
+    return count
+
+
 def main():
     module_args = oci_utils.get_common_arg_spec()
     module_args.update(
@@ -181,6 +384,11 @@ def main():
             ),
             query=dict(type="str", required=False),
             text=dict(type="str", required=False),
+            max_results=dict(type="int", required=False),
+            page_size=dict(type="int", required=False, default=500),
+            hydrate=dict(type="bool", required=False, default=False),
+            hydration_parallelism=dict(type="int", required=False, default=10),
+            dest=dict(type="path", required=False),
         )
     )
 
@@ -193,33 +401,31 @@ def main():
     if not HAS_OCI_PY_SDK:
         module.fail_json(msg="oci python sdk required for this module.")
 
+    for option in ["max_results", "page_size", "hydration_parallelism"]:
+        if module.params[option] is not None and module.params[option] < 1:
+            module.fail_json(msg="{0} must be a positive integer.".format(option))
+
     result = dict(changed=False)
 
     resource_search_client = oci_utils.create_service_client(
         module, ResourceSearchClient
     )
-    matching_context_type = module.params.get("matching_context_type")
 
-    search_details = None
-    if module.params["type"] == "FreeText":
-        ftsd = FreeTextSearchDetails()
-        ftsd.type = "FreeText"
-        if matching_context_type is not None:
-            ftsd.matching_context_type = matching_context_type
-        ftsd.text = module.params["text"]
-        search_details = ftsd
-    else:
-        ssd = StructuredSearchDetails()
-        if matching_context_type is not None:
-            ssd.type = "Structured"
-        ssd.matching_context_type = matching_context_type
-        ssd.query = module.params["query"]
-        search_details = ssd
-
-    res_coll = oci_utils.call_with_backoff(
-        resource_search_client.search_resources, search_details=search_details
-    ).data
-    result["search_resources"] = oci_utils.to_dict(res_coll.items)
+    dest = module.params["dest"]
+    try:
+        if dest:
+            result["search_resources_count"] = write_search_results(
+                module, resource_search_client, dest
+            )
+            result["dest"] = dest
+        else:
+            search_resources = []
+            for batch in get_search_result_batches(module, resource_search_client):
+                search_resources.extend(batch)
+            result["search_resources"] = search_resources
+            result["search_resources_count"] = len(search_resources)
+    except ServiceError as ex:
+        module.fail_json(msg=ex.message)
     module.exit_json(**result)
 
 
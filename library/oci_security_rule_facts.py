@@ -365,7 +365,7 @@ class SecurityRuleFactsHelperGen(OCIResourceFactsHelperBase):
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_network_security_group_security_rules,
             network_security_group_id=self.module.params.get(
                 "network_security_group_id"
@@ -156,7 +156,7 @@ class VolumeBackupPolicyFactsHelperGen(OCIResourceFactsHelperBase):
             for param in optional_list_method_params
             if self.module.params.get(param) is not None
         )
-        return oci_common_utils.list_all_resources(
+        return oci_common_utils.list_all_resources_generator(
             self.client.list_volume_backup_policies, **optional_kwargs
         )
 
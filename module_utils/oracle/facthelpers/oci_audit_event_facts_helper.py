@@ -0,0 +1,85 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+from datetime import timedelta
+
+from ansible.module_utils.oracle import oci_common_utils
+
+try:
+    import dateutil.parser
+    from oci.util import to_dict
+
+    HAS_OCI_PY_SDK = True
+
+except ImportError:
+    HAS_OCI_PY_SDK = False
+
+
+def get_time_slices(start_time, end_time, slice_in_minutes):
+    """Split [start_time, end_time) into consecutive intervals of at most slice_in_minutes minutes."""
+    time_slices = []
+    slice_start = start_time
+    while slice_start < end_time:
+        slice_end = min(slice_start + timedelta(minutes=slice_in_minutes), end_time)
+        time_slices.append((slice_start, slice_end))
+        slice_start = slice_end
+    return time_slices
+
+
+class AuditEventFactsHelperCustom:
+    # The audit events of a long time range are listed page by page, one request at a time. So split the time range
+    # into slices, list up to parallel_fetch_count slices concurrently, and generate the events of the slices in order.
+    # Only parallel_fetch_count slices are held in memory at a time.
+    def list_resources(self):
+        start_time = dateutil.parser.parse(self.module.params.get("start_time"))
+        end_time = dateutil.parser.parse(self.module.params.get("end_time"))
+        time_slices = get_time_slices(
+            start_time, end_time, self.module.params.get("time_slice_in_minutes")
+        )
+        parallel_fetch_count = self.module.params.get("parallel_fetch_count")
+        for i in range(0, len(time_slices), parallel_fetch_count):
+            for events in oci_common_utils.map_in_pool(
+                self.list_events_in_time_slice,
+                time_slices[i : i + parallel_fetch_count],
+                parallel_fetch_count,
+            ):
+                for event in events:
+                    yield event
+
+    def list_events_in_time_slice(self, time_slice):
+        slice_start, slice_end = time_slice
+        events = list(
+            oci_common_utils.list_all_resources_generator(
+                self.client.list_events,
+                compartment_id=self.module.params.get("compartment_id"),
+                start_time=slice_start,
+                end_time=slice_end,
+            )
+        )
+        return sorted(events, key=lambda event: event.event_time)
+
+    def write_list_to_file(self, dest):
+        """Write the listed events to dest, one JSON document per line, and return the number of events written."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)))
+        count = 0
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                for event in self.list_resources():
+                    tmp_file.write(json.dumps(to_dict(event), default=str))
+                    tmp_file.write("\n")
+                    count += 1
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.module.atomic_move(tmp_path, dest)
+        return count
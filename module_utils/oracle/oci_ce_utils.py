@@ -4,7 +4,7 @@
 # Apache License v2.0
 # See LICENSE.TXT for details.
 
-from ansible.module_utils.oracle import oci_utils
+from ansible.module_utils.oracle import oci_utils, oci_wait_utils
 from ansible.module_utils.oracle.oci_resource_utils import (
     convert_input_data_to_model_class,
 )
@@ -50,22 +50,24 @@ def get_logger():
 def wait_on_work_request(client, response, module):
     try:
         if module.params.get("wait", None):
-            wait_response = oci.wait_until(
+            wait_response = oci_wait_utils.wait_until(
                 client,
                 response,
                 evaluate_response=lambda r: r.data.status == "SUCCEEDED",
                 max_wait_seconds=module.params.get(
                     "wait_timeout", MAX_WAIT_TIMEOUT_IN_SECONDS
                 ),
+                resource_type=oci_wait_utils.WORK_REQUEST_RESOURCE_TYPE,
             )
         else:
-            wait_response = oci.wait_until(
+            wait_response = oci_wait_utils.wait_until(
                 client,
                 response,
                 evaluate_response=lambda r: r.data.status == "ACCEPTED",
                 max_wait_seconds=module.params.get(
                     "wait_timeout", MAX_WAIT_TIMEOUT_IN_SECONDS
                 ),
+                resource_type=oci_wait_utils.WORK_REQUEST_RESOURCE_TYPE,
             )
     except MaximumWaitTimeExceeded as ex:
         module.fail_json(msg=str(ex))
@@ -75,20 +77,27 @@ def wait_on_work_request(client, response, module):
 
 
 def wait_on_resource(
-    client, module, get_fn, kwargs_get, states, evaluate_response=None
+    client,
+    module,
+    get_fn,
+    kwargs_get,
+    states,
+    evaluate_response=None,
+    resource_type=None,
 ):
     try:
         if evaluate_response:
-            wait_response = oci.wait_until(
+            wait_response = oci_wait_utils.wait_until(
                 client,
                 get_fn(**kwargs_get),
                 evaluate_response=evaluate_response,
                 max_wait_seconds=module.params.get(
                     "wait_timeout", MAX_WAIT_TIMEOUT_IN_SECONDS
                 ),
+                resource_type=resource_type,
             )
         else:
-            wait_response = oci.wait_until(
+            wait_response = oci_wait_utils.wait_until(
                 client,
                 get_fn(**kwargs_get),
                 evaluate_response=lambda r: not hasattr(r.data, "lifecycle_state")
@@ -96,6 +105,7 @@ def wait_on_resource(
                 max_wait_seconds=module.params.get(
                     "wait_timeout", MAX_WAIT_TIMEOUT_IN_SECONDS
                 ),
+                resource_type=resource_type,
             )
         return wait_response.data
     except MaximumWaitTimeExceeded as ex:
@@ -347,6 +357,7 @@ def create_and_wait(
                         get_fn,
                         {get_param: resource_affected["identifier"]},
                         states,
+                        resource_type=resource_type,
                     )
                 )
                 result[resource_type] = to_dict(resource)
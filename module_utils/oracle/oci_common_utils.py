@@ -7,6 +7,8 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
+from multiprocessing.pool import ThreadPool
+
 from ansible.module_utils import six
 
 try:
@@ -20,6 +22,10 @@ except ImportError:
 
 __version__ = "1.19.0"
 MAX_WAIT_TIMEOUT_IN_SECONDS = 2000
+
+# The retry strategy used by call_with_backoff, see _get_retry_strategy.
+_retry_strategy = None
+
 DEAD_STATES = [
     "TERMINATING",
     "TERMINATED",
@@ -74,6 +80,15 @@ ANY_OPERATION_KEY = "ANY"
 
 
 def _get_retry_strategy():
+    """Return the retry strategy for call_with_backoff. It is built once per process, as the strategy keeps no state
+    between calls."""
+    global _retry_strategy
+    if _retry_strategy is None:
+        _retry_strategy = _build_retry_strategy()
+    return _retry_strategy
+
+
+def _build_retry_strategy():
     retry_strategy_builder = RetryStrategyBuilder(
         max_attempts_check=True,
         max_attempts=3,
@@ -168,6 +183,86 @@ def list_all_resources(target_fn, **kwargs):
     return filter_response_data(response.data, filter_params)
 
 
+def get_response_data_items(response_data):
+    """Get the list of resources in the data of a list response."""
+    if isinstance(response_data, oci.dns.models.RecordCollection) or isinstance(
+        response_data, oci.dns.models.RRSet
+    ):
+        return response_data.items
+    if isinstance(response_data, oci.object_storage.models.ListObjects):
+        return response_data.objects
+    if isinstance(response_data, list):
+        return response_data
+    return response_data.items
+
+
+def list_all_resources_generator(target_fn, **kwargs):
+    """
+    Return a generator of all resources returned by target_fn, which fetches the pages lazily while it is consumed,
+    so that callers which stop at the first match, like the idempotency checks, make fewer calls and do not hold all
+    the pages in memory. The first page is fetched by this call, so that it raises the same errors as
+    list_all_resources. If a `display_name` or `name` is provided as a kwarg, then only resources matching the
+    specified name are returned. Unlike list_all_resources, object storage objects are generated as the object
+    summaries rather than in a ListObjects.
+    :param target_fn: The target OCI SDK paged function to call
+    :param kwargs: All arguments that the OCI SDK paged function expects
+    :return: Generator of all objects returned by target_fn
+    :raises ServiceError: When the Service returned an Error response
+    """
+    filter_params = None
+    try:
+        response = call_with_backoff(target_fn, **kwargs)
+    except ValueError as ex:
+        if "unknown kwargs" not in str(ex):
+            raise
+        if "display_name" in kwargs:
+            if kwargs["display_name"]:
+                filter_params = {"display_name": kwargs["display_name"]}
+            del kwargs["display_name"]
+        elif "name" in kwargs:
+            if kwargs["name"]:
+                filter_params = {"name": kwargs["name"]}
+            del kwargs["name"]
+        response = call_with_backoff(target_fn, **kwargs)
+    return _generate_all_resources(target_fn, kwargs, response, filter_params)
+
+
+def _generate_all_resources(target_fn, kwargs, response, filter_params):
+    while True:
+        for resource in filter_resources(
+            get_response_data_items(response.data), filter_params
+        ):
+            yield resource
+        if isinstance(response.data, oci.object_storage.models.ListObjects):
+            if response.data.next_start_with is None:
+                return
+            kwargs["start"] = response.data.next_start_with
+        else:
+            if not response.has_next_page:
+                return
+            kwargs["page"] = response.next_page
+        response = call_with_backoff(target_fn, **kwargs)
+
+
+def map_in_pool(fn, items, pool_size):
+    """
+    Apply fn to each of items with at most pool_size threads, like the builtin map.
+    :param fn: The function to apply
+    :param items: List of arguments to fn
+    :param pool_size: The maximum number of threads
+    :return: List of the results of fn, in the order of items
+    :raises: The first exception raised by fn, once all the calls are done
+    """
+    if not items:
+        return []
+    pool = ThreadPool(min(len(items), pool_size))
+    try:
+        return pool.map(fn, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
 def is_dict_subset(
     source_dict, target_dict, attrs=None, ignore_attr_if_not_in_target=False
 ):
@@ -232,6 +327,45 @@ def is_in_list(l, element):
     return False
 
 
+def _get_resource_attr_value(resource, attr, missing=None):
+    """Get the value of attr in a resource model or dict, or missing if the resource does not have attr."""
+    if isinstance(resource, dict):
+        return resource.get(attr, missing)
+    if attr in getattr(resource, "attribute_map", {}):
+        return getattr(resource, attr)
+    return missing
+
+
+def filter_resources_by_scalar_attrs(resources, expected_values):
+    """
+    Generate the resources which may match expected_values, a dict of attribute names to values, in their original
+    order. This is a cheap prefilter which reads the attributes of the resource models directly, without converting
+    them to dicts. Only the attributes with scalar expected values are compared, and a resource is ruled out only
+    if it has a scalar value for one of them which differs from the expected value. The resources returned still
+    need a full comparison.
+    """
+    scalar_types = six.string_types + six.integer_types + (float,)
+    missing = object()
+    expected_values = dict(
+        (attr, value)
+        for attr, value in six.iteritems(expected_values)
+        if isinstance(value, scalar_types)
+    )
+
+    def may_match(resource):
+        for attr, expected_value in six.iteritems(expected_values):
+            value = _get_resource_attr_value(resource, attr, missing)
+            if value is missing:
+                continue
+            if (value is None or isinstance(value, scalar_types)) and (
+                value != expected_value
+            ):
+                return False
+        return True
+
+    return (resource for resource in resources if may_match(resource))
+
+
 def are_dicts_equal(
     source_dict, target_dict, attrs=None, ignore_attr_if_not_in_target=False
 ):
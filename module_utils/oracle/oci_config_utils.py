@@ -5,7 +5,10 @@
 # See LICENSE.TXT for details.
 
 from ansible.module_utils.oracle import oci_common_utils
+import json
 import os
+import tempfile
+import time
 
 try:
 
@@ -26,6 +29,18 @@ except ImportError:
 agent_name = "Oracle-Ansible/"
 inventory_agent_name = "Oracle-Ansible-Inv/"
 
+# Per-process caches of the parsed config files, the signers and the clients. A module often creates several clients
+# with the same options, which then read the config file, load the private key and validate the configuration once.
+_config_file_cache = {}
+_signer_cache = {}
+_client_cache = {}
+
+# The home region of a tenancy never changes, so it is cached on disk across module invocations. The cache can be
+# moved with OCI_IDENTITY_HOME_REGION_CACHE_FILE, disabled by setting OCI_IDENTITY_HOME_REGION_CACHE_TTL to 0 and
+# refreshed by setting OCI_IDENTITY_REFRESH_HOME_REGION_CACHE.
+DEFAULT_HOME_REGION_CACHE_FILE = "~/.oci/oci_ansible_home_regions.json"
+DEFAULT_HOME_REGION_CACHE_TTL_IN_SECONDS = 7 * 24 * 60 * 60
+
 
 def get_oci_config(module, service_client_class=None):
     """Return the OCI configuration to use for all OCI API calls. The effective OCI configuration is derived by merging
@@ -53,9 +68,7 @@ def get_oci_config(module, service_client_class=None):
         else:
             config_profile = "DEFAULT"
     try:
-        config = oci.config.from_file(
-            file_location=config_file, profile_name=config_profile
-        )
+        config = _get_config_from_file(config_file, config_profile)
     except (
         ConfigFileNotFound,
         InvalidConfig,
@@ -116,6 +129,30 @@ def get_oci_config(module, service_client_class=None):
     return config
 
 
+def _get_config_from_file(config_file, config_profile):
+    """Return a copy of the config profile read from config_file, which is only read once per process."""
+    cache_key = (config_file, config_profile)
+    if cache_key not in _config_file_cache:
+        _config_file_cache[cache_key] = oci.config.from_file(
+            file_location=config_file, profile_name=config_profile
+        )
+    return dict(_config_file_cache[cache_key])
+
+
+def _get_config_cache_key(module, config):
+    """Return a key identifying the effective config and auth type, or None if the config can not be hashed."""
+    try:
+        cache_key = (
+            frozenset(config.items()),
+            _is_instance_principal_auth(module),
+            _is_delegation_token_auth(module),
+        )
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
 def set_db_test_flag(service_client):
     # This flag helps in quickly testing the Database
     if service_client == DatabaseClient and os.environ.get("OCI_DB_MOCK") is not None:
@@ -134,14 +171,27 @@ def create_service_client(module, service_client_class):
     config = get_oci_config(module, service_client_class)
     kwargs = {}
 
-    if _is_instance_principal_auth(module):
-        kwargs["signer"] = _create_instance_principal_signer(module)
+    # Redirect calls to home region for IAM service.
+    do_not_redirect = module.params.get(
+        "do_not_redirect_to_home_region", False
+    ) or os.environ.get("OCI_IDENTITY_DO_NOT_REDIRECT_TO_HOME_REGION")
 
-    if _is_delegation_token_auth(module):
-        delegation_token_location = config.get("delegation_token_file")
-        kwargs["signer"] = _create_instance_principal_signer(
-            module, delegation_token_location
-        )
+    config_cache_key = _get_config_cache_key(module, config)
+    client_cache_key = (config_cache_key, service_client_class, bool(do_not_redirect))
+    if config_cache_key is not None and client_cache_key in _client_cache:
+        return _client_cache[client_cache_key]
+
+    if config_cache_key is not None and config_cache_key in _signer_cache:
+        kwargs["signer"] = _signer_cache[config_cache_key]
+    else:
+        if _is_instance_principal_auth(module):
+            kwargs["signer"] = _create_instance_principal_signer(module)
+
+        if _is_delegation_token_auth(module):
+            delegation_token_location = config.get("delegation_token_file")
+            kwargs["signer"] = _create_instance_principal_signer(
+                module, delegation_token_location
+            )
 
     # XXX: Validate configuration -- this may be redundant, as all Client constructors perform a validation
     try:
@@ -154,10 +204,10 @@ def create_service_client(module, service_client_class):
     # Create service client class (optionally with signer)
     client = service_client_class(config, **kwargs)
 
-    # Redirect calls to home region for IAM service.
-    do_not_redirect = module.params.get(
-        "do_not_redirect_to_home_region", False
-    ) or os.environ.get("OCI_IDENTITY_DO_NOT_REDIRECT_TO_HOME_REGION")
+    if config_cache_key is not None:
+        # Share the signer, which holds the loaded private key or the instance principal token, with the clients
+        # created later with the same config.
+        _signer_cache.setdefault(config_cache_key, client.base_client.signer)
 
     if service_client_class == IdentityClient and not do_not_redirect:
 
@@ -172,25 +222,104 @@ def create_service_client(module, service_client_class):
                 msg="Could not identify tenancy OCID from config or local metadata service"
             )
 
-        region_subscriptions = oci_common_utils.call_with_backoff(
-            client.list_region_subscriptions, tenancy_id=tenancy_id
-        ).data
+        home_region = _get_cached_home_region(tenancy_id)
+        if home_region is None:
+            region_subscriptions = oci_common_utils.call_with_backoff(
+                client.list_region_subscriptions, tenancy_id=tenancy_id
+            ).data
 
-        # Replace the region for the client with the home region.
-        home_regions = [
-            rs.region_name for rs in region_subscriptions if rs.is_home_region is True
-        ]
-        if len(home_regions) == 0:
-            module.fail_json(msg="Could not identify home region for this tenancy")
+            home_regions = [
+                rs.region_name
+                for rs in region_subscriptions
+                if rs.is_home_region is True
+            ]
+            if len(home_regions) == 0:
+                module.fail_json(msg="Could not identify home region for this tenancy")
 
-        home_region = home_regions[0]
+            home_region = home_regions[0]
+            _cache_home_region(tenancy_id, home_region)
 
+        # Replace the region for the client with the home region.
         client.base_client.set_region(home_region)
         set_db_test_flag(client)
 
+    if config_cache_key is not None:
+        _client_cache[client_cache_key] = client
+
     return client
 
 
+def _get_home_region_cache_file():
+    return os.path.expanduser(
+        os.environ.get(
+            "OCI_IDENTITY_HOME_REGION_CACHE_FILE", DEFAULT_HOME_REGION_CACHE_FILE
+        )
+    )
+
+
+def _get_home_region_cache_ttl():
+    try:
+        return int(
+            os.environ.get(
+                "OCI_IDENTITY_HOME_REGION_CACHE_TTL",
+                DEFAULT_HOME_REGION_CACHE_TTL_IN_SECONDS,
+            )
+        )
+    except ValueError:
+        return DEFAULT_HOME_REGION_CACHE_TTL_IN_SECONDS
+
+
+def _read_home_region_cache():
+    try:
+        with open(_get_home_region_cache_file(), "r") as cache_file:
+            home_regions = json.load(cache_file)
+    except (IOError, OSError, ValueError):
+        return {}
+    return home_regions if isinstance(home_regions, dict) else {}
+
+
+def _get_cached_home_region(tenancy_id):
+    """Return the home region of the tenancy from the on-disk cache, or None if it is not cached or has expired."""
+    if _get_home_region_cache_ttl() <= 0 or os.environ.get(
+        "OCI_IDENTITY_REFRESH_HOME_REGION_CACHE"
+    ):
+        return None
+    cached = _read_home_region_cache().get(tenancy_id)
+    if not isinstance(cached, dict) or not cached.get("region"):
+        return None
+    # The cache may have been edited or written by something else, so a time which is not a number is a cache miss.
+    try:
+        cached_time = float(cached.get("time"))
+    except (TypeError, ValueError):
+        return None
+    if time.time() - cached_time > _get_home_region_cache_ttl():
+        return None
+    return cached["region"]
+
+
+def _cache_home_region(tenancy_id, home_region):
+    """Save the home region of the tenancy in the on-disk cache. The cache is best effort, so errors are ignored."""
+    if _get_home_region_cache_ttl() <= 0:
+        return
+    cache_file_path = _get_home_region_cache_file()
+    home_regions = _read_home_region_cache()
+    home_regions[tenancy_id] = dict(region=home_region, time=time.time())
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(cache_file_path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        # Write to a temporary file, only accessible by the user, and rename it so that concurrent module invocations
+        # never read a partially written cache.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(home_regions, tmp_file)
+        os.rename(tmp_path, cache_file_path)
+    except (IOError, OSError):
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def _create_instance_principal_signer(module, delegation_token_location=None):
     signer = None
     try:
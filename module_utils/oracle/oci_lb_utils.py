@@ -7,6 +7,7 @@
 from ansible.module_utils.oracle import oci_utils
 from ansible.module_utils import six
 from ansible.module_utils.facts.utils import get_file_content
+from ansible.module_utils.parsing.convert_bool import boolean
 
 try:
     import oci
@@ -18,12 +19,25 @@ try:
         SSLConfigurationDetails,
         CertificateDetails,
         ListenerDetails,
+        Listener,
         ConnectionConfiguration,
         PathRouteSetDetails,
         PathRoute,
         PathMatchType,
         HostnameDetails,
+        Hostname,
+        BackendSet,
+        Certificate,
+        PathRouteSet,
         CreateCertificateDetails,
+        CreateBackendSetDetails,
+        UpdateBackendSetDetails,
+        CreateListenerDetails,
+        UpdateListenerDetails,
+        CreateHostnameDetails,
+        UpdateHostnameDetails,
+        CreatePathRouteSetDetails,
+        UpdatePathRouteSetDetails,
     )
     from oci.util import to_dict
     from oci.exceptions import ServiceError, ClientError, MaximumWaitTimeExceeded
@@ -162,6 +176,260 @@ def get_work_request_response(lb_client, work_request_id, states, module):
     return response
 
 
+def is_lb_configuration_subset(desired, existing):
+    """
+    Check whether every value set in the desired configuration is the same in the existing configuration. Both are
+    compared as returned by to_dict. Lists must have the same elements in any order, and the dicts in existing may
+    have more keys, like the name of a backend.
+    """
+    if isinstance(desired, dict):
+        if not isinstance(existing, dict):
+            return False
+        return all(
+            value is None or is_lb_configuration_subset(value, existing.get(key))
+            for key, value in six.iteritems(desired)
+        )
+    if isinstance(desired, list):
+        if not isinstance(existing, list) or len(desired) != len(existing):
+            return False
+        unmatched = list(existing)
+        for desired_element in desired:
+            for index, existing_element in enumerate(unmatched):
+                if is_lb_configuration_subset(desired_element, existing_element):
+                    del unmatched[index]
+                    break
+            else:
+                return False
+        return True
+    return desired == existing
+
+
+def _to_swagger_type(value, swagger_type):
+    """
+    Convert a value of the module params to swagger_type, the type of the attribute of the SDK model it is compared
+    with. The nested options of the module are not typed, so a port given as '8080' is converted to the int 8080.
+    Values which cannot be converted are left as they are.
+    """
+    if value is None:
+        return None
+    if swagger_type.startswith("list[") and isinstance(value, list):
+        return [_to_swagger_type(element, swagger_type[5:-1]) for element in value]
+    if hasattr(value, "swagger_types"):
+        model_class = getattr(oci.load_balancer.models, swagger_type, None)
+        if model_class is not None:
+            normalize_lb_model(value, model_class)
+        return value
+    try:
+        if swagger_type == "int" and not isinstance(value, bool):
+            return int(value)
+        if swagger_type == "float":
+            return float(value)
+        if swagger_type == "bool":
+            return boolean(value)
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+def normalize_lb_model(details, model_class):
+    """
+    Convert, in place, the attributes of details, built from the module params, to the swagger_types of
+    model_class, the SDK model returned for the same resource, so that the two compare equal when their values are
+    the same.
+    """
+    swagger_types = model_class().swagger_types
+    for attribute in details.attribute_map:
+        if attribute in swagger_types:
+            details.__setattr__(
+                attribute,
+                _to_swagger_type(getattr(details, attribute), swagger_types[attribute]),
+            )
+    return details
+
+
+def _get_details(details_class, *sources):
+    """Build details_class from the attributes of sources, the non-None attributes of later sources taking
+    precedence."""
+    details = details_class()
+    for attribute in details.attribute_map:
+        for source in sources:
+            value = getattr(source, attribute, None)
+            if value is not None:
+                details.__setattr__(attribute, value)
+    return details
+
+
+def _get_sub_resource_changes(
+    resource_type,
+    model_class,
+    desired_resources,
+    existing_resources,
+    create_fn,
+    create_details_class,
+    update_fn,
+    update_details_class,
+    lb_id,
+    name_param,
+):
+    changes = []
+    for name, desired in six.iteritems(desired_resources or {}):
+        existing = (existing_resources or {}).get(name)
+        normalize_lb_model(desired, model_class)
+        if existing is None:
+            create_details = _get_details(create_details_class, desired)
+            if "name" in create_details.attribute_map:
+                create_details.name = name
+            changes.append(
+                (
+                    resource_type,
+                    name,
+                    create_fn,
+                    {
+                        "create_" + resource_type + "_details": create_details,
+                        "load_balancer_id": lb_id,
+                    },
+                )
+            )
+        elif update_fn is not None and not is_lb_configuration_subset(
+            to_dict(desired), to_dict(existing)
+        ):
+            changes.append(
+                (
+                    resource_type,
+                    name,
+                    update_fn,
+                    {
+                        "update_"
+                        + resource_type
+                        + "_details": _get_details(
+                            update_details_class, existing, desired
+                        ),
+                        "load_balancer_id": lb_id,
+                        name_param: name,
+                    },
+                )
+            )
+    return changes
+
+
+def get_lb_configuration_changes(lb_client, module, load_balancer):
+    """
+    Compute the create and update calls which bring the backend sets, certificates, hostnames, path route sets and
+    listeners of an existing load balancer to the configuration in the module params. Configurations that are not
+    in the params are left as they are. The calls are grouped in tiers, each tier depending on the resources
+    created or updated by the previous tiers: certificates, then backend sets, then hostnames and path route sets,
+    and listeners last. A backend set is updated with all its backends at once.
+    :return: List of tiers, each a list of (resource_type, name, function, kwargs_function)
+    """
+    lb_id = load_balancer.id
+    # Certificates cannot be updated, only missing certificates are created.
+    certificates = dict(
+        (certificate.certificate_name, certificate)
+        for certificate in six.itervalues(
+            create_certificates(module.params.get("certificates")) or {}
+        )
+    )
+    backend_sets = create_backend_sets(module.params.get("backend_sets"))
+    for name, backend_set in six.iteritems(backend_sets or {}):
+        existing_backend_set = (load_balancer.backend_sets or {}).get(name)
+        # Backends are replaced as a whole, keep the existing ones when no backends are specified.
+        if backend_set.backends is None and existing_backend_set is not None:
+            backend_set.backends = oci_utils.get_hashed_object_list(
+                BackendDetails, existing_backend_set.backends
+            )
+    hostnames = dict(
+        (hostname.name, hostname)
+        for hostname in six.itervalues(
+            create_hostnames(module.params.get("hostnames")) or {}
+        )
+    )
+    tiers = [
+        _get_sub_resource_changes(
+            "certificate",
+            Certificate,
+            certificates,
+            load_balancer.certificates,
+            lb_client.create_certificate,
+            CreateCertificateDetails,
+            None,
+            None,
+            lb_id,
+            "certificate_name",
+        ),
+        _get_sub_resource_changes(
+            "backend_set",
+            BackendSet,
+            backend_sets,
+            load_balancer.backend_sets,
+            lb_client.create_backend_set,
+            CreateBackendSetDetails,
+            lb_client.update_backend_set,
+            UpdateBackendSetDetails,
+            lb_id,
+            "backend_set_name",
+        ),
+        _get_sub_resource_changes(
+            "hostname",
+            Hostname,
+            hostnames,
+            load_balancer.hostnames,
+            lb_client.create_hostname,
+            CreateHostnameDetails,
+            lb_client.update_hostname,
+            UpdateHostnameDetails,
+            lb_id,
+            "name",
+        )
+        + _get_sub_resource_changes(
+            "path_route_set",
+            PathRouteSet,
+            create_path_route_sets(module.params.get("path_route_sets")),
+            load_balancer.path_route_sets,
+            lb_client.create_path_route_set,
+            CreatePathRouteSetDetails,
+            lb_client.update_path_route_set,
+            UpdatePathRouteSetDetails,
+            lb_id,
+            "path_route_set_name",
+        ),
+        _get_sub_resource_changes(
+            "listener",
+            Listener,
+            create_listeners(module.params.get("listeners")),
+            load_balancer.listeners,
+            lb_client.create_listener,
+            CreateListenerDetails,
+            lb_client.update_listener,
+            UpdateListenerDetails,
+            lb_id,
+            "listener_name",
+        ),
+    ]
+    return [tier for tier in tiers if tier]
+
+
+def apply_lb_configuration_changes(lb_client, module, tiers):
+    """
+    Submit the calls returned by get_lb_configuration_changes. The load balancing service runs the work requests of
+    a load balancer one after the other, so all the calls of a tier are submitted before waiting for their work
+    requests, and a wait is only needed before a tier that depends on the previous one. The work requests of the
+    last tier are waited for only if I(wait) is set.
+    """
+    for index, tier in enumerate(tiers):
+        work_request_ids = []
+        for resource_type, name, function, kwargs_function in tier:
+            logger.info("Creating or updating %s %s", resource_type, name)
+            response = oci_utils.call_with_backoff(function, **kwargs_function)
+            work_request_ids.append(response.headers.get("opc-work-request-id"))
+        if index < len(tiers) - 1 or module.params.get("wait", None):
+            for work_request_id in work_request_ids:
+                response = get_work_request_response(
+                    lb_client, work_request_id, DEFAULT_COMPLETED_STATES, module
+                )
+                if response.data.lifecycle_state == "FAILED":
+                    module.fail_json(msg=response.data.error_details)
+
+
 def get_backend_name(module):
     return module.params["ip_address"] + ":" + str(module.params["port"])
 
@@ -103,8 +103,8 @@ class OCIResourceFactsHelperBase:
         return to_dict(resource)
 
     def list(self):
-        resources = self.list_resources()
-        return to_dict(resources)
+        # list_resources may generate the resources page by page, so convert them one at a time.
+        return [to_dict(resource) for resource in self.list_resources()]
 
 
 class OCIActionsHelperBase:
@@ -316,14 +316,27 @@ class OCIResourceHelperBase:
 
     def get_matching_resource(self):
         create_model = self.get_create_model()
+        create_model_dict = to_dict(create_model)
         attributes_to_consider = self.get_attributes_to_consider(create_model)
-        for resource in self.list_resources():
-            if not self._is_resource_active(resource):
-                continue
-            resource_dict = to_dict(resource)
+        # Rule out the resources which differ in a scalar attribute first, so that only the remaining candidates
+        # are converted to dicts and compared in full. The resources are consumed lazily, so listing stops at the
+        # first match when list_resources generates them page by page.
+        candidates = oci_common_utils.filter_resources_by_scalar_attrs(
+            (
+                resource
+                for resource in self.list_resources()
+                if self._is_resource_active(resource)
+            ),
+            dict(
+                (attr, create_model_dict.get(attr))
+                for attr in attributes_to_consider
+                if attr in create_model_dict
+            ),
+        )
+        for resource in candidates:
             if oci_common_utils.is_dict_subset(
-                source_dict=to_dict(create_model),
-                target_dict=resource_dict,
+                source_dict=create_model_dict,
+                target_dict=to_dict(resource),
                 attrs=attributes_to_consider,
             ):
                 return resource
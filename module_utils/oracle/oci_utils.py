@@ -9,6 +9,7 @@ import logging
 import logging.config
 import os
 import tempfile
+import threading
 from datetime import datetime
 from operator import eq
 
@@ -34,14 +35,35 @@ from ansible.module_utils._text import to_bytes
 
 # Moved the __version__ to oci_common_utils. But import here as it is used in some places.
 from ansible.module_utils.oracle.oci_common_utils import __version__  # noqa: F401
+from ansible.module_utils.oracle.oci_common_utils import (
+    filter_resources_by_scalar_attrs,
+    list_all_resources_generator,
+    map_in_pool,
+)
 
 from ansible.module_utils.oracle.oci_config_utils import (
     get_oci_config,
     create_service_client,
 )
+from ansible.module_utils.oracle import oci_wait_utils
 
 MAX_WAIT_TIMEOUT_IN_SECONDS = 2000
 
+# The retry strategy used by call_with_backoff, see _get_retry_strategy.
+_retry_strategy = None
+
+# Logging is configured once per process, by the first call to setup_logging.
+_logging_setup_lock = threading.Lock()
+_logging_setup_done = False
+
+# The attachments found by the tenancy wide scans of get_attached_instances_info, see _get_tenancy_attachments.
+_tenancy_attachments = {}
+_tenancy_attachments_lock = threading.Lock()
+ATTACHMENT_SCAN_PARALLELISM = 10
+# Arguments of the list attachments calls which get_attached_instances_info filters on after the tenancy wide scan,
+# so that one scan serves all the volumes looked up.
+_ATTACHMENT_FILTER_ARGS = ["volume_id", "boot_volume_id", "instance_id"]
+
 # If a resource is in one of these states it would be considered inactive
 DEAD_STATES = [
     "TERMINATING",
@@ -214,8 +236,13 @@ def list_all_resources(target_fn, **kwargs):
     return filter_response_data(response.data, filter_params)
 
 
-def _debug(s):
-    get_logger("oci_utils").debug(s)
+def _debug(s, *args):
+    """Log a debug message. The message is formatted with args using str.format only if debug logging is enabled,
+    so that args which are expensive to format, like resource dicts, cost nothing otherwise.
+    """
+    logger = get_logger("oci_utils")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(s.format(*args) if args else s)
 
 
 def get_logger(module_name):
@@ -228,7 +255,18 @@ def setup_logging(
     default_level="INFO",
     default_log_path=tempfile.gettempdir(),
 ):
-    """Setup logging configuration"""
+    """Setup logging configuration, once per process. Later calls return the configured logging module."""
+    global _logging_setup_done
+    if _logging_setup_done:
+        return logging
+    with _logging_setup_lock:
+        if not _logging_setup_done:
+            _configure_logging(default_config_file, default_level, default_log_path)
+            _logging_setup_done = True
+    return logging
+
+
+def _configure_logging(default_config_file, default_level, default_log_path):
     env_config_file = "LOG_CONFIG"
     env_log_path = "LOG_PATH"
     env_log_level = "LOG_LEVEL"
@@ -255,7 +293,6 @@ def setup_logging(
         log_file_path = os.path.join(log_path, "oci_ansible_module.log")
 
         logging.basicConfig(filename=log_file_path, filemode="a", level=log_level)
-    return logging
 
 
 def check_and_update_attributes(
@@ -502,14 +539,14 @@ def add_tags_to_model_class(model, freeform_tags, defined_tags):
     """
     try:
         if freeform_tags is not None:
-            _debug("Model {0} set freeform tags to {1}".format(model, freeform_tags))
+            _debug("Model {0} set freeform tags to {1}", model, freeform_tags)
             model.__setattr__("freeform_tags", freeform_tags)
 
         if defined_tags is not None:
-            _debug("Model {0} set defined tags to {1}".format(model, defined_tags))
+            _debug("Model {0} set defined tags to {1}", model, defined_tags)
             model.__setattr__("defined_tags", defined_tags)
     except AttributeError as ae:
-        _debug("Model {0} doesn't support tags. Error {1}".format(model, ae))
+        _debug("Model {0} doesn't support tags. Error {1}", model, ae)
 
     return model
 
@@ -560,7 +597,7 @@ def check_and_create_resource(
     """
 
     if module.params.get("force_create", None):
-        _debug("Force creating {0}".format(resource_type))
+        _debug("Force creating {0}", resource_type)
         result = call_with_backoff(create_fn, **kwargs_create)
         return result
 
@@ -570,72 +607,94 @@ def check_and_create_resource(
         exclude_attributes = {}
     if default_attribute_values is None:
         default_attribute_values = {}
+
+    attributes_to_consider = _get_attributes_to_consider(
+        exclude_attributes,
+        model,
+        module,
+        exclude_attributes_even_when_user_provides_value=exclude_attributes_even_when_user_provides_value,
+    )
+    # The user provided values of the attributes to consider, keyed by the attribute names in the get model. They are
+    # used to narrow down the resources before the full comparison.
+    user_provided_values = dict()
+    for attr in attributes_to_consider:
+        user_provided_value = _get_user_provided_value(module, attr)
+        if user_provided_value is not None:
+            get_model_attr = (create_model_attr_to_get_model_mapping or {}).get(attr)
+            user_provided_values[get_model_attr or attr] = user_provided_value
+
     try:
         if existing_resources is None:
             if supports_sort_by_time_created:
                 kwargs_list["sort_by"] = "TIMECREATED"
-            existing_resources = list_all_resources(list_fn, **kwargs_list)
+            # A resource can only match if it has the display name the user provided, so let the service filter by it.
+            # The results are filtered after listing if list_fn doesn't support display_name.
+            if (
+                "display_name" in user_provided_values
+                and "display_name" not in kwargs_list
+            ):
+                kwargs_list["display_name"] = user_provided_values["display_name"]
+            # The pages are fetched lazily, so listing stops at the first (latest) matching resource.
+            existing_resources = list_all_resources_generator(list_fn, **kwargs_list)
     except ValueError:
         # list_fn doesn't support sort_by, so remove the sort_by key in kwargs_list and retry
         kwargs_list.pop("sort_by", None)
         try:
-            existing_resources = list_all_resources(list_fn, **kwargs_list)
+            existing_resources = list_all_resources_generator(list_fn, **kwargs_list)
         # Handle errors like 404 due to bad arguments to the list_all_resources call.
         except ServiceError as ex:
             module.fail_json(msg=ex.message)
     except ServiceError as ex:
         module.fail_json(msg=ex.message)
 
-    try:
-        if get_resource_from_summary_fn:
-            get_resource_from_summary_fn_kwargs = (
-                get_resource_from_summary_fn_kwargs or {}
-            )
-            existing_resources = [
-                get_resource_from_summary_fn(
-                    existing_resource, **get_resource_from_summary_fn_kwargs
-                )
-                for existing_resource in existing_resources
-            ]
-    except Exception as ex:
-        module.fail_json(msg=str(ex))
+    if get_resource_from_summary_fn:
+        existing_resources = _get_resources_from_summaries(
+            existing_resources,
+            module,
+            get_resource_from_summary_fn,
+            get_resource_from_summary_fn_kwargs or {},
+        )
 
     result = dict()
 
-    attributes_to_consider = _get_attributes_to_consider(
-        exclude_attributes,
-        model,
-        module,
-        exclude_attributes_even_when_user_provides_value=exclude_attributes_even_when_user_provides_value,
-    )
     if "defined_tags" not in default_attribute_values:
         default_attribute_values["defined_tags"] = {}
     resource_matched = None
-    _debug(
-        "Trying to find a match within {0} existing resources".format(
-            len(existing_resources)
-        )
+    candidate_resources = filter_resources_by_scalar_attrs(
+        (
+            resource
+            for resource in existing_resources
+            if _is_resource_active(resource, dead_states)
+        ),
+        user_provided_values,
     )
+    _debug("Trying to find a match within the existing resources")
 
-    for resource in existing_resources:
-        if _is_resource_active(resource, dead_states):
+    try:
+        for resource in candidate_resources:
+            resource_dict = to_dict(resource)
             _debug(
                 "Comparing user specified values {0} against an existing resource's "
-                "values {1}".format(module.params, to_dict(resource))
+                "values {1}",
+                module.params,
+                resource_dict,
             )
             if does_existing_resource_match_user_inputs(
-                to_dict(resource),
+                resource_dict,
                 module,
                 attributes_to_consider,
                 exclude_attributes,
                 default_attribute_values,
                 create_model_attr_to_get_model_mapping=create_model_attr_to_get_model_mapping,
             ):
-                resource_matched = to_dict(resource)
+                resource_matched = resource_dict
                 break
+    # Handle errors while fetching the next pages of the existing resources.
+    except ServiceError as ex:
+        module.fail_json(msg=ex.message)
 
     if resource_matched:
-        _debug("Resource with same attributes found: {0}.".format(resource_matched))
+        _debug("Resource with same attributes found: {0}.", resource_matched)
         result[resource_type] = resource_matched
         result["changed"] = False
     else:
@@ -645,6 +704,23 @@ def check_and_create_resource(
     return result
 
 
+def _get_resources_from_summaries(
+    resource_summaries,
+    module,
+    get_resource_from_summary_fn,
+    get_resource_from_summary_fn_kwargs,
+):
+    """Generate the full resources from the resource summaries, getting each one only when it is needed."""
+    for resource_summary in resource_summaries:
+        try:
+            resource = get_resource_from_summary_fn(
+                resource_summary, **get_resource_from_summary_fn_kwargs
+            )
+        except Exception as ex:
+            module.fail_json(msg=str(ex))
+        yield resource
+
+
 def _get_attributes_to_consider(
     exclude_attributes,
     model,
@@ -675,7 +751,7 @@ def _get_attributes_to_consider(
             for exclude_attr in exclude_attributes_even_when_user_provides_value:
                 if exclude_attr in attributes_to_consider:
                     attributes_to_consider.remove(exclude_attr)
-    _debug("attributes to consider: {0}".format(attributes_to_consider))
+    _debug("attributes to consider: {0}", attributes_to_consider)
     return attributes_to_consider
 
 
@@ -751,7 +827,7 @@ def create_resource(resource_type, create_fn, kwargs_create, module):
     result = dict(changed=False)
     try:
         resource = to_dict(call_with_backoff(create_fn, **kwargs_create).data)
-        _debug("Created {0}, {1}".format(resource_type, resource))
+        _debug("Created {0}, {1}", resource_type, resource)
         result["changed"] = True
         result[resource_type] = resource
         return result
@@ -806,9 +882,10 @@ def does_existing_resource_match_user_inputs(
                 if not res[0]:
                     _debug(
                         "Mismatch on attribute '{0}'. User provided value is {1} & existing resource's value"
-                        "is {2}.".format(
-                            attr, user_provided_value_for_attr, resources_value_for_attr
-                        )
+                        "is {2}.",
+                        attr,
+                        user_provided_value_for_attr,
+                        resources_value_for_attr,
                     )
                     return False
             else:
@@ -831,11 +908,10 @@ def does_existing_resource_match_user_inputs(
                         if existing_resource[attr] != default_attribute_value:
                             _debug(
                                 "Mismatch on attribute '{0}'. User provided value is {1} & existing resource's value "
-                                "is {2}.".format(
-                                    attr,
-                                    user_provided_value_for_attr,
-                                    resources_value_for_attr,
-                                )
+                                "is {2}.",
+                                attr,
+                                user_provided_value_for_attr,
+                                resources_value_for_attr,
                             )
                             return False
                     # Check if attr has a value that is not default. For example, a custom `security_list_id`
@@ -846,21 +922,20 @@ def does_existing_resource_match_user_inputs(
                     ):
                         _debug(
                             "Mismatch on attribute '{0}'. User provided value is {1} & existing resource's value "
-                            "is {2}. Default attribute value was: {3}".format(
-                                attr,
-                                user_provided_value_for_attr,
-                                resources_value_for_attr,
-                                default_attribute_values.get(attr, None),
-                            )
+                            "is {2}. Default attribute value was: {3}",
+                            attr,
+                            user_provided_value_for_attr,
+                            resources_value_for_attr,
+                            default_attribute_values.get(attr, None),
                         )
                         return False
 
         else:
             _debug(
                 "Attribute {0} is in the create model of resource {1}"
-                "but doesn't exist in the get model of the resource".format(
-                    attr, existing_resource.__class__
-                )
+                "but doesn't exist in the get model of the resource",
+                attr,
+                existing_resource.__class__,
             )
     return True
 
@@ -1096,12 +1171,11 @@ def are_dicts_equal(
             if existing_resource_dict[sub_attr] != user_provided_dict[sub_attr]:
                 _debug(
                     "Failed to match: Existing resource's attr {0} sub-attr {1} value is {2}, while user "
-                    "provided value is {3}".format(
-                        option_name,
-                        sub_attr,
-                        existing_resource_dict[sub_attr],
-                        user_provided_dict.get(sub_attr, None),
-                    )
+                    "provided value is {3}",
+                    option_name,
+                    sub_attr,
+                    existing_resource_dict[sub_attr],
+                    user_provided_dict.get(sub_attr, None),
                 )
                 return False
 
@@ -1126,9 +1200,10 @@ def are_dicts_equal(
                         "Consider as match: Existing resource's attr {0} sub-attr {1} value is {2}, while user did"
                         "not provide a value for it. The module author also has not provided a default value for it"
                         "or marked it for exclusion. So ignoring this attribute during matching and continuing with"
-                        "other checks".format(
-                            option_name, sub_attr, existing_resource_dict[sub_attr]
-                        )
+                        "other checks",
+                        option_name,
+                        sub_attr,
+                        existing_resource_dict[sub_attr],
                     )
 
     return True
@@ -1225,7 +1300,7 @@ def create_and_wait_on_work_request(
         result["changed"] = True
         result[resource_type] = to_dict(response.data)
         work_request_id = get_work_request_id_fn(response)
-        _debug("Work request id: {0}".format(work_request_id))
+        _debug("Work request id: {0}", work_request_id)
         result[resource_type] = wait_for_work_request(
             client,
             module,
@@ -1421,42 +1496,43 @@ def wait_for_resource_lifecycle_state(
     :return: A dictionary containing the resource & the "changed" status. e.g. {"vcn":{x:y}, "changed":True}
     """
     if wait_applicable and module.params.get("wait", None):
-        if resource_type == "compartment":
-            # An immediate attempt to retrieve a compartment after a compartment is created fails with
-            # 'Authorization failed  or requested resource not found', 'status': 404}.
-            # This is because it takes few seconds for the permissions on a compartment to be ready.
-            # Wait for few seconds before attempting a get call on compartment.
-            _debug(
-                "Pausing execution for permission on the newly created compartment to be ready."
-            )
-            time.sleep(15)
+        start_time = time.time()
+        max_wait_seconds = module.params.get(
+            "wait_timeout", MAX_WAIT_TIMEOUT_IN_SECONDS
+        )
         if kwargs_get:
             _debug(
-                "Waiting for resource to reach READY state. get_args: {0}".format(
-                    kwargs_get
-                )
+                "Waiting for resource to reach READY state. get_args: {0}", kwargs_get
             )
             if get_param:
                 kwargs_get[get_param] = resource["id"]
-
-            response_get = call_with_backoff(get_fn, **kwargs_get)
         else:
             _debug(
-                "Waiting for resource with id {0} to reach READY state.".format(
-                    resource["id"]
-                )
+                "Waiting for resource with id {0} to reach READY state.", resource["id"]
             )
-            response_get = call_with_backoff(get_fn, **{get_param: resource["id"]})
+            kwargs_get = {get_param: resource["id"]}
+        if resource_type == "compartment":
+            # An immediate attempt to retrieve a compartment after a compartment is created fails with
+            # 'Authorization failed  or requested resource not found', 'status': 404}.
+            # This is because it takes few seconds for the permissions on a compartment to be ready.
+            # Retry the get call on compartment until it is found.
+            response_get = oci_wait_utils.call_until_found(
+                get_fn,
+                max_wait_seconds=max_wait_seconds,
+                resource_type=resource_type,
+                **kwargs_get
+            )
+        else:
+            response_get = call_with_backoff(get_fn, **kwargs_get)
         if states is None:
             states = module.params.get("wait_until") or DEFAULT_READY_STATES
         resource = to_dict(
-            oci.wait_until(
+            oci_wait_utils.wait_until(
                 client,
                 response_get,
                 evaluate_response=lambda r: r.data.lifecycle_state in states,
-                max_wait_seconds=module.params.get(
-                    "wait_timeout", MAX_WAIT_TIMEOUT_IN_SECONDS
-                ),
+                max_wait_seconds=max(max_wait_seconds - (time.time() - start_time), 0),
+                resource_type=resource_type,
             ).data
         )
     return resource
@@ -1466,9 +1542,8 @@ def wait_on_work_request(client, response, module):
     try:
         if module.params.get("wait", None):
             _debug(
-                "Waiting for work request with id {0} to reach SUCCEEDED state.".format(
-                    response.data.id
-                )
+                "Waiting for work request with id {0} to reach SUCCEEDED state.",
+                response.data.id,
             )
             wait_response = oci.wait_until(
                 client,
@@ -1480,9 +1555,8 @@ def wait_on_work_request(client, response, module):
             )
         else:
             _debug(
-                "Waiting for work request with id {0} to reach ACCEPTED state.".format(
-                    response.data.id
-                )
+                "Waiting for work request with id {0} to reach ACCEPTED state.",
+                response.data.id,
             )
             wait_response = oci.wait_until(
                 client,
@@ -1556,7 +1630,7 @@ def delete_and_wait(
                     result["changed"] = True
                     resource = to_dict(call_with_backoff(get_fn, **kwargs_get).data)
                 else:
-                    _debug("Deleted {0}, {1}".format(resource_type, resource))
+                    _debug("Deleted {0}, {1}", resource_type, resource)
                     result["changed"] = True
 
                     if wait_applicable and module.params.get("wait", None):
@@ -1599,9 +1673,9 @@ def delete_and_wait(
             result[resource_type] = resource
         else:
             _debug(
-                "Resource {0} with {1} already deleted. So returning changed=False".format(
-                    resource_type, kwargs_get
-                )
+                "Resource {0} with {1} already deleted. So returning changed=False",
+                resource_type,
+                kwargs_get,
             )
     except ServiceError as ex:
         # DNS API throws a 400 InvalidParameter when a zone id is provided for zone_name_or_id and if the zone
@@ -1609,9 +1683,9 @@ def delete_and_wait(
         if type(client) == oci.dns.DnsClient:
             if ex.status == 400 and ex.code == "InvalidParameter":
                 _debug(
-                    "Resource {0} with {1} already deleted. So returning changed=False".format(
-                        resource_type, kwargs_get
-                    )
+                    "Resource {0} with {1} already deleted. So returning changed=False",
+                    resource_type,
+                    kwargs_get,
                 )
         elif ex.status != 404:
             module.fail_json(msg=ex.message)
@@ -1683,15 +1757,24 @@ def update_model_with_user_options(curr_model, update_model, module):
                 # Only update if a user has specified a value for an option
                 _debug(
                     "User requested {0} for attribute {1}, whereas the current value is {2}. So adding it "
-                    "to the update model".format(
-                        user_provided_value, attr, curr_value_for_attr
-                    )
+                    "to the update model",
+                    user_provided_value,
+                    attr,
+                    curr_value_for_attr,
                 )
                 setattr(update_model, attr, user_provided_value)
     return update_model
 
 
 def _get_retry_strategy():
+    """Return the shared retry strategy, building it on first use."""
+    global _retry_strategy
+    if _retry_strategy is None:
+        _retry_strategy = _build_retry_strategy()
+    return _retry_strategy
+
+
+def _build_retry_strategy():
     retry_strategy_builder = RetryStrategyBuilder(
         max_attempts_check=True,
         max_attempts=3,
@@ -1878,41 +1961,82 @@ def get_existing_resource(target_fn, module, **kwargs):
     return existing_resource
 
 
+def _list_compartment_attachments(list_attachments_fn, list_attachments_args):
+    try:
+        return list_all_resources(list_attachments_fn, **list_attachments_args)
+    # Pass ServiceError due to authorization issue in accessing volume attachments of a compartment
+    except ServiceError as ex:
+        if ex.status == 404:
+            return []
+        raise
+
+
+def _get_tenancy_attachments(module, list_attachments_fn, scan_args):
+    """
+    Return the attachments listed by list_attachments_fn with scan_args in all the active compartments of the tenancy.
+    The compartments are scanned concurrently, and the result is kept for the other lookups in the same process.
+    """
+    tenancy = get_oci_config(module).get("tenancy")
+    cache_key = (tenancy, list_attachments_fn, tuple(sorted(scan_args.items())))
+    with _tenancy_attachments_lock:
+        if cache_key in _tenancy_attachments:
+            return _tenancy_attachments[cache_key]
+        identity_client = create_service_client(module, IdentityClient)
+        # The root compartment is not in the list of compartments in the subtree.
+        compartment_ids = [tenancy] + [
+            compartment.id
+            for compartment in list_all_resources(
+                identity_client.list_compartments,
+                compartment_id=tenancy,
+                compartment_id_in_subtree=True,
+            )
+            if compartment.lifecycle_state == "ACTIVE"
+        ]
+        attachments = []
+        for compartment_attachments in map_in_pool(
+            lambda compartment_id: _list_compartment_attachments(
+                list_attachments_fn, dict(scan_args, compartment_id=compartment_id)
+            ),
+            compartment_ids,
+            ATTACHMENT_SCAN_PARALLELISM,
+        ):
+            attachments.extend(compartment_attachments)
+        _tenancy_attachments[cache_key] = to_dict(attachments)
+        return _tenancy_attachments[cache_key]
+
+
 def get_attached_instances_info(
     module, lookup_attached_instance, list_attachments_fn, list_attachments_args
 ):
-    config = get_oci_config(module)
-    identity_client = create_service_client(module, IdentityClient)
-
-    volume_attachments = []
-
     if lookup_attached_instance:
-        # Get all the compartments in the tenancy
-        compartments = to_dict(
-            identity_client.list_compartments(
-                config.get("tenancy"), compartment_id_in_subtree=True
-            ).data
+        # List the attachments in all the compartments of the tenancy, and pick the ones matching the filter arguments
+        # in list_attachments_args.
+        filter_args = dict(
+            (key, value)
+            for key, value in six.iteritems(list_attachments_args)
+            if key in _ATTACHMENT_FILTER_ARGS
         )
-        # For each compartment, get the volume attachments for the compartment_id with the other args in
-        # list_attachments_args.
-        for compartment in compartments:
-            list_attachments_args["compartment_id"] = compartment["id"]
-            try:
-                volume_attachments += list_all_resources(
-                    list_attachments_fn, **list_attachments_args
-                )
-
-            # Pass ServiceError due to authorization issue in accessing volume attachments of a compartment
-            except ServiceError as ex:
-                if ex.status == 404:
-                    pass
+        scan_args = dict(
+            (key, value)
+            for key, value in six.iteritems(list_attachments_args)
+            if key not in _ATTACHMENT_FILTER_ARGS and key != "compartment_id"
+        )
+        volume_attachments = [
+            volume_attachment
+            for volume_attachment in _get_tenancy_attachments(
+                module, list_attachments_fn, scan_args
+            )
+            if all(
+                volume_attachment.get(key) == value
+                for key, value in six.iteritems(filter_args)
+            )
+        ]
 
     else:
-        volume_attachments = list_all_resources(
-            list_attachments_fn, **list_attachments_args
+        volume_attachments = to_dict(
+            list_all_resources(list_attachments_fn, **list_attachments_args)
         )
 
-    volume_attachments = to_dict(volume_attachments)
     # volume_attachments has attachments in DETACHING or DETACHED state. Return the volume attachment in ATTACHING or
     # ATTACHED state
     volume_attachments_filtered = []
@@ -8,20 +8,286 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import random
+import time
+
 from ansible.module_utils.oracle import oci_common_utils
 
 try:
     import oci
+    from oci.exceptions import MaximumWaitTimeExceeded, ServiceError
+    from oci.response import Response
     from oci.util import to_dict
+    from oci.waiter import WAIT_RESOURCE_NOT_FOUND
 
     HAS_OCI_PY_SDK = True
 except ImportError:
     HAS_OCI_PY_SDK = False
 
+try:
+    from oci.waiter import MAX_RETRIES_ON_401
+except ImportError:
+    # Older SDKs do not refresh the security tokens of principal signers in their waiters.
+    MAX_RETRIES_ON_401 = 2
+
 LIFECYCLE_STATE_WAITER_KEY = "LIFECYCLE_STATE_WAITER"
 WORK_REQUEST_WAITER_KEY = "WORK_REQUEST_WAITER"
 NONE_WAITER_KEY = "NONE_WAITER_KEY"
 
+WORK_REQUEST_RESOURCE_TYPE = "work_request"
+
+# The initial and the maximum interval, in seconds, between two checks of a resource of the type, roughly scaled to
+# how long the resources of the type take to provision. The interval doubles after each check up to the maximum.
+_POLLING_INTERVALS = {
+    "autonomous_data_warehouse": (15, 60),
+    "autonomous_database": (15, 60),
+    "boot_volume": (2, 15),
+    "boot_volume_attachment": (2, 15),
+    "cluster": (30, 120),
+    "compartment": (1, 8),
+    "data_guard_association": (60, 300),
+    "db_home": (60, 300),
+    "db_system": (60, 300),
+    "instance": (5, 30),
+    "instance_pool": (10, 60),
+    "load_balancer": (10, 60),
+    "node_pool": (30, 120),
+    "vnic_attachment": (2, 15),
+    "volume": (2, 15),
+    "volume_attachment": (2, 15),
+    WORK_REQUEST_RESOURCE_TYPE: (5, 30),
+}
+# Same as the polling of oci.wait_until.
+DEFAULT_POLLING_INTERVALS = (1, 30)
+
+# The maximum number of resources checked concurrently when they cannot be checked with a list call.
+DEFAULT_WAIT_PARALLELISM = 10
+
+
+def get_polling_interval(resource_type, times_checked):
+    """
+    Return the time to wait before the next check of a resource of resource_type which was checked times_checked
+    times. The exponential backoff is jittered, so that the resources waited on by concurrent module invocations are
+    not all checked at the same time.
+    """
+    initial_interval, max_interval = _POLLING_INTERVALS.get(
+        resource_type, DEFAULT_POLLING_INTERVALS
+    )
+    interval = min(initial_interval * 2**times_checked, max_interval)
+    return interval / 2.0 + random.uniform(0, interval / 2.0)
+
+
+def call_until_found(
+    fn,
+    max_wait_seconds=oci_common_utils.MAX_WAIT_TIMEOUT_IN_SECONDS,
+    resource_type=None,
+    **kwargs
+):
+    """
+    Call fn with kwargs, and call it again after the polling interval of the resource type while it fails with a 404.
+    Some resources, like compartments, are not found for a few seconds after they are created.
+    :raises ServiceError: If fn fails with another error, or still fails with a 404 after max_wait_seconds
+    """
+    start_time = time.time()
+    times_checked = 0
+    while True:
+        try:
+            return oci_common_utils.call_with_backoff(fn, **kwargs)
+        except ServiceError as ex:
+            elapsed_seconds = time.time() - start_time
+            if ex.status != 404 or elapsed_seconds >= max_wait_seconds:
+                raise
+        time.sleep(
+            min(
+                get_polling_interval(resource_type, times_checked),
+                max_wait_seconds - elapsed_seconds,
+            )
+        )
+        times_checked += 1
+
+
+def _is_principal_signer_client(client):
+    is_principal_signer_fn = getattr(
+        getattr(client, "base_client", None),
+        "is_instance_principal_or_resource_principal_signer",
+        None,
+    )
+    return is_principal_signer_fn is not None and is_principal_signer_fn()
+
+
+def _get_default_fetch_fn(client, response):
+    # Re-issue the get request of the response, like oci.wait_until.
+    if response.request.method.lower() != "get":
+        raise oci.exceptions.WaitUntilNotSupported(
+            "wait_until is only supported for get operations."
+        )
+    return lambda: oci.retry.DEFAULT_RETRY_STRATEGY.make_retrying_call(
+        client.base_client.request, response.request
+    )
+
+
+class MultiResourceWaiter:
+    """
+    Waits until many resources or work requests satisfy evaluate_response, checking them all in each round rather
+    than one after the other. The resources are checked with a single call of list_fn if given, and otherwise with
+    concurrent get calls. The interval between the rounds is jittered and grows exponentially, starting from and up to
+    the intervals of the resource type.
+    """
+
+    def __init__(
+        self,
+        evaluate_response,
+        max_wait_seconds=oci_common_utils.MAX_WAIT_TIMEOUT_IN_SECONDS,
+        resource_type=None,
+        list_fn=None,
+        succeed_on_not_found=False,
+        parallelism=DEFAULT_WAIT_PARALLELISM,
+    ):
+        """
+        :param evaluate_response: Function of a get response, which returns True once the resource is ready
+        :param max_wait_seconds: The maximum time to wait for all the resources
+        :param resource_type: The type of the resources, which sets the polling intervals. e.g. "instance"
+        :param list_fn: Optional function without arguments, which returns a list of resources including those waited
+                        on, matched by their id. e.g. a partial of list_instances with the compartment_id. Each
+                        resource found ready in the list is then fetched once more with its get call.
+        :param succeed_on_not_found: Whether a resource that is not found anymore is done waiting
+        :param parallelism: The maximum number of concurrent get calls
+        """
+        self.evaluate_response = evaluate_response
+        self.max_wait_seconds = max_wait_seconds
+        self.resource_type = resource_type
+        self.list_fn = list_fn
+        self.succeed_on_not_found = succeed_on_not_found
+        self.parallelism = parallelism
+        self._fetch_fns = dict()
+        self._clients = dict()
+        self._responses = dict()
+        # The keys of the resources whose response only holds their summary, from list_fn.
+        self._summary_keys = set()
+
+    def add(self, key, client, response, fetch_fn=None):
+        """
+        Add a resource to wait on.
+        :param key: The key of the resource in the result of wait
+        :param client: The client used to get the response
+        :param response: The response of a get call of the resource
+        :param fetch_fn: Optional function without arguments which gets the resource. By default, the get request of
+                         response is re-issued.
+        """
+        self._fetch_fns[key] = fetch_fn or _get_default_fetch_fn(client, response)
+        self._clients[key] = client
+        self._responses[key] = response
+
+    def wait(self):
+        """
+        Wait for all the added resources.
+        :return: A dict of the key of each resource to its last get response, or to
+                 oci.waiter.WAIT_RESOURCE_NOT_FOUND for the resources not found if succeed_on_not_found is set
+        :raises MaximumWaitTimeExceeded: If some resources are still not ready after max_wait_seconds
+        """
+        start_time = time.time()
+        pending = set(self._responses)
+        results = dict()
+        times_checked = 0
+        while True:
+            for key in list(pending):
+                if self.evaluate_response(self._responses[key]):
+                    results[key] = self._responses[key]
+                    pending.remove(key)
+            if not pending:
+                return self._get_full_responses(results)
+            elapsed_seconds = time.time() - start_time
+            if elapsed_seconds >= self.max_wait_seconds:
+                raise MaximumWaitTimeExceeded(
+                    "Maximum wait time has been exceeded for {0} of {1} resources.".format(
+                        len(pending), len(self._responses)
+                    )
+                )
+            time.sleep(
+                min(
+                    get_polling_interval(self.resource_type, times_checked),
+                    self.max_wait_seconds - elapsed_seconds,
+                )
+            )
+            times_checked += 1
+            for key in self._refresh(sorted(pending)):
+                results[key] = WAIT_RESOURCE_NOT_FOUND
+                pending.remove(key)
+
+    def _refresh(self, keys):
+        """Update the responses of keys, and return the keys of the resources that were not found."""
+        if self.list_fn is not None:
+            keys_by_id = dict(
+                (getattr(self._responses[key].data, "id", None), key) for key in keys
+            )
+            listed_keys = set()
+            for resource in self.list_fn():
+                key = keys_by_id.get(getattr(resource, "id", None))
+                if key is not None:
+                    self._responses[key] = Response(200, None, resource, None)
+                    self._summary_keys.add(key)
+                    listed_keys.add(key)
+            keys = [key for key in keys if key not in listed_keys]
+        not_found = []
+        for key, response in zip(
+            keys,
+            oci_common_utils.map_in_pool(self._fetch, keys, self.parallelism),
+        ):
+            if response is WAIT_RESOURCE_NOT_FOUND:
+                not_found.append(key)
+            else:
+                self._responses[key] = response
+                self._summary_keys.discard(key)
+        return not_found
+
+    def _fetch(self, key):
+        retry_count_401 = 0
+        while True:
+            try:
+                return self._fetch_fns[key]()
+            except ServiceError as ex:
+                if ex.status == 404 and self.succeed_on_not_found:
+                    return WAIT_RESOURCE_NOT_FOUND
+                # Like oci.wait_until, refresh the security token of an instance or resource principal, which can
+                # expire during a long wait.
+                if (
+                    ex.status == 401
+                    and retry_count_401 < MAX_RETRIES_ON_401
+                    and _is_principal_signer_client(self._clients[key])
+                ):
+                    retry_count_401 += 1
+                    self._clients[key].base_client.signer.refresh_security_token()
+                    continue
+                raise
+
+    def _get_full_responses(self, results):
+        # The resources found ready in a list call only have the attributes of their summary.
+        keys = [key for key in results if key in self._summary_keys]
+        for key, response in zip(
+            keys, oci_common_utils.map_in_pool(self._fetch, keys, self.parallelism)
+        ):
+            results[key] = response
+        return results
+
+
+def wait_until(
+    client,
+    response,
+    evaluate_response,
+    max_wait_seconds=oci_common_utils.MAX_WAIT_TIMEOUT_IN_SECONDS,
+    resource_type=None,
+    succeed_on_not_found=False,
+):
+    """Like oci.wait_until with evaluate_response, but polling at the intervals of the resource type."""
+    waiter = MultiResourceWaiter(
+        evaluate_response,
+        max_wait_seconds=max_wait_seconds,
+        resource_type=resource_type,
+        succeed_on_not_found=succeed_on_not_found,
+    )
+    waiter.add(None, client, response)
+    return waiter.wait()[None]
+
 
 class Waiter:
     """Interface defining wait method"""
@@ -51,16 +317,20 @@ class BaseWaiter(Waiter):
             "Expected to be implemented by the specific waiter classes."
         )
 
+    def get_polling_resource_type(self):
+        return self.resource_helper.resource_type
+
     def wait(self):
         if not self.resource_helper.module.params.get("wait"):
             return self.operation_response
-        wait_response = oci.wait_until(
+        wait_response = wait_until(
             self.client,
             self.get_initial_response(),
             evaluate_response=self.get_evaluate_response_lambda(),
             max_wait_seconds=self.resource_helper.module.params.get(
                 "wait_timeout", oci_common_utils.MAX_WAIT_TIMEOUT_IN_SECONDS
             ),
+            resource_type=self.get_polling_resource_type(),
         )
         return self.get_resource_from_wait_response(wait_response)
 
@@ -146,6 +416,9 @@ class WorkRequestWaiter(BaseWaiter):
             self.operation_response.headers["opc-work-request-id"]
         )
 
+    def get_polling_resource_type(self):
+        return WORK_REQUEST_RESOURCE_TYPE
+
     def get_evaluate_response_lambda(self):
         lowered_wait_for_states = [state.lower() for state in self.wait_for_states]
         return (
@@ -26,12 +26,13 @@ class AutoScalingConfigurationHelperCustom:
         auto_scaling_configuration_summaries = super(
             AutoScalingConfigurationHelperCustom, self
         ).list_resources()
-        auto_scaling_configurations = [
+        # Get the full configurations lazily, so that matching stops fetching them at the first match.
+        auto_scaling_configurations = (
             oci_common_utils.call_with_backoff(
                 self.client.get_auto_scaling_configuration,
                 auto_scaling_configuration_id=auto_scaling_configuration.id,
             ).data
             for auto_scaling_configuration in auto_scaling_configuration_summaries
-        ]
+        )
 
         return auto_scaling_configurations
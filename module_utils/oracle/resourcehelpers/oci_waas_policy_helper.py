@@ -22,11 +22,12 @@ except ImportError:
 
 class WaasPolicyHelperCustom:
     def list_resources(self):
-        return [
+        # Get the full policies lazily, so that matching stops fetching them at the first match.
+        return (
             oci_common_utils.call_with_backoff(
                 self.client.get_waas_policy, waas_policy_id=waas_policy_summary.id
             ).data
             for waas_policy_summary in super(
                 WaasPolicyHelperCustom, self
             ).list_resources()
-        ]
+        )
@@ -0,0 +1,142 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from nose.plugins.skip import SkipTest
+from ansible.module_utils.oracle import oci_common_utils
+from ansible.module_utils.oracle.facthelpers import oci_audit_event_facts_helper
+
+try:
+    from oci.audit.models import AuditEvent
+    from oci.exceptions import ServiceError
+except ImportError:
+    raise SkipTest("test_oci_audit_event_facts.py requires `oci` module")
+
+
+class FakeModule(object):
+    def __init__(self, **kwargs):
+        self.params = kwargs
+
+    def fail_json(self, *args, **kwargs):
+        self.exit_args = args
+        self.exit_kwargs = kwargs
+        raise Exception(kwargs["msg"])
+
+    def exit_json(self, *args, **kwargs):
+        self.exit_args = args
+        self.exit_kwargs = kwargs
+
+    def atomic_move(self, src, dest):
+        os.rename(src, dest)
+
+
+class AuditEventFactsHelper(oci_audit_event_facts_helper.AuditEventFactsHelperCustom):
+    def __init__(self, module, client):
+        self.module = module
+        self.client = client
+
+
+START_TIME = datetime(2020, 1, 1)
+
+
+@pytest.fixture()
+def audit_client(mocker):
+    mock_audit_client = mocker.patch("oci.audit.audit_client.AuditClient")
+    return mock_audit_client.return_value
+
+
+@pytest.fixture()
+def list_all_resources_generator_patch(mocker):
+    return mocker.patch.object(oci_common_utils, "list_all_resources_generator")
+
+
+def get_module(**kwargs):
+    params = {
+        "compartment_id": "ocid1.compartment.oc1..xxxxxEXAMPLExxxxx",
+        "start_time": "2020-01-01T00:00:00Z",
+        "end_time": "2020-01-01T05:30:00Z",
+        "time_slice_in_minutes": 60,
+        "parallel_fetch_count": 2,
+    }
+    params.update(kwargs)
+    return FakeModule(**params)
+
+
+def list_events(target_fn, compartment_id, start_time, end_time):
+    # An event every 10 minutes, listed in reverse order, and the later slices are listed faster.
+    time.sleep((6 - start_time.hour) * 0.01)
+    event_times = []
+    event_time = start_time
+    while event_time < end_time:
+        event_times.append(event_time)
+        event_time += timedelta(minutes=10)
+    return iter(
+        AuditEvent(event_id=event_time.isoformat(), event_time=event_time)
+        for event_time in reversed(event_times)
+    )
+
+
+def test_get_time_slices():
+    get_time_slices = oci_audit_event_facts_helper.get_time_slices
+    assert get_time_slices(START_TIME, START_TIME + timedelta(hours=2), 60) == [
+        (START_TIME, START_TIME + timedelta(hours=1)),
+        (START_TIME + timedelta(hours=1), START_TIME + timedelta(hours=2)),
+    ]
+    # The last slice ends at end_time.
+    assert get_time_slices(START_TIME, START_TIME + timedelta(minutes=150), 60) == [
+        (START_TIME, START_TIME + timedelta(hours=1)),
+        (START_TIME + timedelta(hours=1), START_TIME + timedelta(hours=2)),
+        (START_TIME + timedelta(hours=2), START_TIME + timedelta(minutes=150)),
+    ]
+    assert get_time_slices(START_TIME, START_TIME + timedelta(minutes=30), 60) == [
+        (START_TIME, START_TIME + timedelta(minutes=30))
+    ]
+    assert get_time_slices(START_TIME, START_TIME, 60) == []
+
+
+def test_list_resources_in_order(audit_client, list_all_resources_generator_patch):
+    list_all_resources_generator_patch.side_effect = list_events
+    events = list(AuditEventFactsHelper(get_module(), audit_client).list_resources())
+    event_times = [event.event_time.replace(tzinfo=None) for event in events]
+    assert len(event_times) == 33
+    assert event_times == sorted(event_times)
+    assert len(set(event_times)) == len(event_times)
+    # One listing per slice, the last one being partial.
+    assert [
+        call[1]["end_time"] - call[1]["start_time"]
+        for call in list_all_resources_generator_patch.call_args_list
+    ].count(timedelta(minutes=30)) == 1
+    assert list_all_resources_generator_patch.call_count == 6
+
+
+def test_write_list_to_file(audit_client, tmp_path, list_all_resources_generator_patch):
+    list_all_resources_generator_patch.side_effect = list_events
+    dest = tmp_path / "events.json"
+    helper = AuditEventFactsHelper(get_module(), audit_client)
+    assert helper.write_list_to_file(str(dest)) == 33
+    event_ids = [json.loads(line)["event_id"] for line in dest.read_text().splitlines()]
+    assert event_ids == sorted(event_ids)
+    assert os.listdir(str(tmp_path)) == ["events.json"]
+
+
+def test_write_list_to_file_error(
+    audit_client, tmp_path, list_all_resources_generator_patch
+):
+    list_all_resources_generator_patch.side_effect = ServiceError(
+        500, "InternalServerError", dict(), "Internal Server Error"
+    )
+    dest = tmp_path / "events.json"
+    dest.write_text("previous events")
+    with pytest.raises(ServiceError):
+        AuditEventFactsHelper(get_module(), audit_client).write_list_to_file(str(dest))
+    # The previous file is left untouched and the temporary file is removed.
+    assert dest.read_text() == "previous events"
+    assert os.listdir(str(tmp_path)) == ["events.json"]
@@ -5,8 +5,14 @@
 # See LICENSE.TXT for details.
 
 import pytest
+from nose.plugins.skip import SkipTest
 from ansible.module_utils.oracle import oci_common_utils
 
+try:
+    from oci.core.models import Vcn
+except ImportError:
+    raise SkipTest("test_oci_common_utils.py requires `oci` module")
+
 
 @pytest.fixture
 def is_dict_subset_patch(mocker):
@@ -492,6 +498,47 @@ def test_is_in_list_when_element_is_list(is_list_subset_patch):
     assert is_list_subset_patch.call_count == 0
 
 
+def test_filter_resources_by_scalar_attrs_rules_out_scalar_mismatches():
+    resources = [
+        Vcn(display_name="vcn1", cidr_block="10.0.0.0/16"),
+        Vcn(display_name="vcn2", cidr_block="10.0.0.0/16"),
+        Vcn(display_name="vcn1", cidr_block="10.1.0.0/16"),
+        Vcn(display_name=None, cidr_block="10.0.0.0/16"),
+    ]
+    candidates = list(
+        oci_common_utils.filter_resources_by_scalar_attrs(
+            resources, {"display_name": "vcn1", "cidr_block": "10.0.0.0/16"}
+        )
+    )
+    assert candidates == [resources[0]]
+
+
+def test_filter_resources_by_scalar_attrs_keeps_resources_needing_full_comparison():
+    resources = [
+        Vcn(display_name="vcn1", cidr_blocks=["10.0.0.0/16"]),
+        {"display_name": "vcn1", "cidr_blocks": ["10.0.0.0/16"]},
+        {"display_name": "vcn2"},
+    ]
+    # Non scalar expected values, non scalar resource values and attributes missing in the resource are left to the
+    # full comparison.
+    candidates = list(
+        oci_common_utils.filter_resources_by_scalar_attrs(
+            resources,
+            {
+                "display_name": "vcn1",
+                "defined_tags": {"ns": {"key": "val"}},
+                "cidr_blocks": "10.0.0.0/16",
+                "unknown_attr": "val",
+            },
+        )
+    )
+    assert candidates == resources[:2]
+    assert (
+        list(oci_common_utils.filter_resources_by_scalar_attrs(resources, {}))
+        == resources
+    )
+
+
 def test_merge_dicts():
     d1 = {"key1": "val1"}
     d2 = {"key2": "val2"}
@@ -0,0 +1,83 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import json
+import pytest
+from nose.plugins.skip import SkipTest
+from ansible.module_utils.oracle import oci_config_utils
+
+try:
+    import oci  # noqa: F401
+except ImportError:
+    raise SkipTest("test_oci_config_utils.py requires `oci` module")
+
+
+@pytest.fixture()
+def cache_file(tmp_path, monkeypatch):
+    cache_file = tmp_path / "oci" / "home_regions.json"
+    monkeypatch.setenv("OCI_IDENTITY_HOME_REGION_CACHE_FILE", str(cache_file))
+    monkeypatch.delenv("OCI_IDENTITY_HOME_REGION_CACHE_TTL", raising=False)
+    monkeypatch.delenv("OCI_IDENTITY_REFRESH_HOME_REGION_CACHE", raising=False)
+    return cache_file
+
+
+@pytest.fixture()
+def time_patch(mocker):
+    return mocker.patch.object(oci_config_utils.time, "time", return_value=10000)
+
+
+def test_home_region_cache(cache_file, time_patch):
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") is None
+    oci_config_utils._cache_home_region("ocid1.tenancy.1", "us-ashburn-1")
+    oci_config_utils._cache_home_region("ocid1.tenancy.2", "us-phoenix-1")
+    assert json.loads(cache_file.read_text()) == {
+        "ocid1.tenancy.1": {"region": "us-ashburn-1", "time": 10000},
+        "ocid1.tenancy.2": {"region": "us-phoenix-1", "time": 10000},
+    }
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") == "us-ashburn-1"
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.2") == "us-phoenix-1"
+
+
+def test_home_region_cache_expires(cache_file, time_patch, monkeypatch):
+    oci_config_utils._cache_home_region("ocid1.tenancy.1", "us-ashburn-1")
+    monkeypatch.setenv("OCI_IDENTITY_HOME_REGION_CACHE_TTL", "60")
+    time_patch.return_value = 10060
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") == "us-ashburn-1"
+    time_patch.return_value = 10061
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") is None
+
+
+def test_home_region_cache_disabled(cache_file, time_patch, monkeypatch):
+    monkeypatch.setenv("OCI_IDENTITY_HOME_REGION_CACHE_TTL", "0")
+    oci_config_utils._cache_home_region("ocid1.tenancy.1", "us-ashburn-1")
+    assert not cache_file.exists()
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") is None
+
+
+def test_home_region_cache_refresh(cache_file, time_patch, monkeypatch):
+    oci_config_utils._cache_home_region("ocid1.tenancy.1", "us-ashburn-1")
+    monkeypatch.setenv("OCI_IDENTITY_REFRESH_HOME_REGION_CACHE", "1")
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        json.dumps(["us-ashburn-1"]),
+        json.dumps({"ocid1.tenancy.1": "us-ashburn-1"}),
+        json.dumps({"ocid1.tenancy.1": {"region": "us-ashburn-1"}}),
+        json.dumps({"ocid1.tenancy.1": {"region": "us-ashburn-1", "time": "now"}}),
+        json.dumps({"ocid1.tenancy.1": {"region": "us-ashburn-1", "time": [1]}}),
+    ],
+)
+def test_home_region_cache_invalid_content(cache_file, time_patch, content):
+    cache_file.parent.mkdir()
+    cache_file.write_text(content)
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") is None
+    # An invalid cache is replaced when the home region is cached again.
+    oci_config_utils._cache_home_region("ocid1.tenancy.1", "us-ashburn-1")
+    assert oci_config_utils._get_cached_home_region("ocid1.tenancy.1") == "us-ashburn-1"
@@ -305,3 +305,264 @@ def test_get_launch_instance_details_calls_get_source_details_from_module(
         == module.params["source_details"]["boot_volume_size_in_gbs"]
     )
     get_source_details_from_module_patch.assert_called_once_with(module)
+
+
+def get_fleet_module(**kwargs):
+    module = get_module()
+    del module.params["vnic"]["private_ip"]
+    module.params.update(
+        state="present",
+        count=None,
+        exact_count=None,
+        preserve_boot_volume=False,
+        volume_details=None,
+    )
+    module.params.update(kwargs)
+    return module
+
+
+def get_instance(display_name, lifecycle_state="RUNNING"):
+    return oci.core.models.Instance(
+        id="ocid1.instance." + display_name,
+        display_name=display_name,
+        lifecycle_state=lifecycle_state,
+    )
+
+
+@pytest.fixture()
+def list_all_resources_patch(mocker):
+    return mocker.patch.object(oci_utils, "list_all_resources")
+
+
+@pytest.fixture()
+def wait_for_fleet_instances_patch(mocker):
+    return mocker.patch.object(
+        oci_instance,
+        "wait_for_fleet_instances",
+        side_effect=lambda compute_client, module, responses, states, **kwargs: responses,
+    )
+
+
+@pytest.fixture()
+def add_fleet_instance_info_patch(mocker):
+    return mocker.patch.object(
+        oci_instance,
+        "add_fleet_instance_info",
+        side_effect=lambda compute_client, network_client, instance: to_dict(instance),
+    )
+
+
+def test_ensure_instance_fleet_launches_missing_instances(
+    compute_client,
+    get_call_with_backoff,
+    list_all_resources_patch,
+    wait_for_fleet_instances_patch,
+    add_fleet_instance_info_patch,
+):
+    module = get_fleet_module(count=3)
+    list_all_resources_patch.return_value = [
+        get_instance("myinstance1-2"),
+        get_instance("myinstance1-3", "TERMINATED"),
+    ]
+    get_call_with_backoff.side_effect = (
+        lambda fn, launch_instance_details: get_response(
+            200,
+            None,
+            get_instance(launch_instance_details.display_name, "PROVISIONING"),
+            None,
+        )
+    )
+    result = oci_instance.ensure_instance_fleet(compute_client, None, module)
+    assert result["changed"] is True
+    assert [instance["display_name"] for instance in result["instances"]] == [
+        "myinstance1-1",
+        "myinstance1-2",
+        "myinstance1-3",
+    ]
+    launch_instance_details = sorted(
+        [
+            call[1]["launch_instance_details"]
+            for call in get_call_with_backoff.call_args_list
+        ],
+        key=lambda details: details.display_name,
+    )
+    assert [details.display_name for details in launch_instance_details] == [
+        "myinstance1-1",
+        "myinstance1-3",
+    ]
+    assert [
+        details.create_vnic_details.hostname_label
+        for details in launch_instance_details
+    ] == ["myinstance1-1", "myinstance1-3"]
+    # All the launched instances are waited on together.
+    assert wait_for_fleet_instances_patch.call_count == 2
+    assert len(wait_for_fleet_instances_patch.call_args_list[0][0][2]) == 2
+
+
+def test_ensure_instance_fleet_with_exact_count_terminates_surplus_instances(
+    compute_client,
+    get_call_with_backoff,
+    list_all_resources_patch,
+    wait_for_fleet_instances_patch,
+    add_fleet_instance_info_patch,
+):
+    module = get_fleet_module(name="web-%02d", exact_count=1)
+    list_all_resources_patch.return_value = [
+        get_instance("web-01"),
+        get_instance("web-02"),
+        get_instance("web-03"),
+        get_instance("db-01"),
+    ]
+    result = oci_instance.ensure_instance_fleet(compute_client, None, module)
+    assert result["changed"] is True
+    assert [instance["display_name"] for instance in result["instances"]] == ["web-01"]
+    terminated_instance_ids = sorted(
+        call[1]["instance_id"]
+        for call in get_call_with_backoff.call_args_list
+        if call[0][0] is compute_client.terminate_instance
+    )
+    assert terminated_instance_ids == ["ocid1.instance.web-02", "ocid1.instance.web-03"]
+
+
+def test_ensure_instance_fleet_unchanged(
+    compute_client,
+    get_call_with_backoff,
+    list_all_resources_patch,
+    wait_for_fleet_instances_patch,
+    add_fleet_instance_info_patch,
+):
+    module = get_fleet_module(exact_count=2)
+    list_all_resources_patch.return_value = [
+        get_instance("myinstance1-1"),
+        get_instance("myinstance1-2"),
+    ]
+    result = oci_instance.ensure_instance_fleet(compute_client, None, module)
+    assert result["changed"] is False
+    assert len(result["instances"]) == 2
+    assert get_call_with_backoff.call_count == 0
+
+
+def test_ensure_instance_fleet_fails_with_invalid_name_format(compute_client):
+    module = get_fleet_module(count=2, name="web%")
+    with pytest.raises(Exception) as exc_info:
+        oci_instance.ensure_instance_fleet(compute_client, None, module)
+    assert "Invalid format in name web%" in str(exc_info.value)
+    assert compute_client.launch_instance.call_count == 0
+
+
+def test_ensure_instance_fleet_fails_when_a_launch_fails(
+    compute_client,
+    get_call_with_backoff,
+    list_all_resources_patch,
+    wait_for_fleet_instances_patch,
+    add_fleet_instance_info_patch,
+):
+    module = get_fleet_module(count=3)
+    list_all_resources_patch.return_value = []
+
+    def launch(fn, launch_instance_details):
+        if launch_instance_details.display_name == "myinstance1-2":
+            raise ServiceError(400, "LimitExceeded", dict(), "Limit exceeded")
+        return get_response(
+            200,
+            None,
+            get_instance(launch_instance_details.display_name, "PROVISIONING"),
+            None,
+        )
+
+    get_call_with_backoff.side_effect = launch
+    # The error of the worker thread fails the module, instead of hanging the pool.
+    with pytest.raises(Exception) as exc_info:
+        oci_instance.ensure_instance_fleet(compute_client, None, module)
+    assert "Limit exceeded" in str(exc_info.value)
+    assert get_call_with_backoff.call_count == 3
+    assert wait_for_fleet_instances_patch.call_count == 0
+
+
+def test_ensure_instance_fleet_fails_with_private_ip(compute_client):
+    module = get_fleet_module(count=2)
+    module.params["vnic"]["private_ip"] = "10.0.0.5"
+    with pytest.raises(Exception) as exc_info:
+        oci_instance.ensure_instance_fleet(compute_client, None, module)
+    assert "private_ip" in str(exc_info.value)
+
+
+def get_existing_instance(display_name, image_id, lifecycle_state="RUNNING"):
+    return oci.core.models.Instance(
+        id="ocid1.instance." + display_name,
+        display_name=display_name,
+        availability_domain="BnQb:PHX-AD-1",
+        fault_domain="FAULT-DOMAIN-1",
+        shape="BM.Standard1.36",
+        lifecycle_state=lifecycle_state,
+        metadata={"foo": "bar"},
+        source_details=InstanceSourceViaImageDetails(
+            source_type="image", image_id=image_id
+        ),
+    )
+
+
+def test_get_launch_fingerprint():
+    module = get_module()
+    fingerprint = oci_instance.get_launch_fingerprint(
+        module, oci_instance.get_launch_instance_details(module)
+    )
+    assert (("shape",), "BM.Standard1.36") in fingerprint
+    assert (("source_details", "image_id"), "ocid1.image.oc1.phx....sa7klnoa") in (
+        fingerprint
+    )
+    assert (("metadata", "foo"), "bar") in fingerprint
+
+
+def test_get_launch_fingerprint_with_key_by():
+    module = get_module()
+    module.params["key_by"] = ["display_name", "shape"]
+    fingerprint = oci_instance.get_launch_fingerprint(
+        module, oci_instance.get_launch_instance_details(module)
+    )
+    assert fingerprint == [(("shape",), "BM.Standard1.36")]
+
+
+def test_get_candidate_instances(compute_client, mocker):
+    module = get_module()
+    list_all_resources_generator_patch = mocker.patch.object(
+        oci_utils, "list_all_resources_generator"
+    )
+    list_all_resources_generator_patch.return_value = iter(
+        [
+            get_existing_instance("myinstance1", "ocid1.image.oc1.phx....sa7klnoa"),
+            get_existing_instance("myinstance1", "ocid1.image.other"),
+            get_existing_instance(
+                "myinstance1", "ocid1.image.oc1.phx....sa7klnoa", "TERMINATED"
+            ),
+        ]
+    )
+    candidates = list(oci_instance.get_candidate_instances(compute_client, module))
+    assert len(candidates) == 1
+    assert candidates[0].source_details.image_id == "ocid1.image.oc1.phx....sa7klnoa"
+    list_all_resources_generator_patch.assert_called_once_with(
+        compute_client.list_instances,
+        compartment_id=module.params["compartment_id"],
+        sort_by="TIMECREATED",
+        display_name=module.params["name"],
+        availability_domain=module.params["availability_domain"],
+    )
+
+
+def test_get_candidate_instances_with_key_by(compute_client, mocker):
+    module = get_module()
+    module.params["key_by"] = ["shape"]
+    list_all_resources_generator_patch = mocker.patch.object(
+        oci_utils, "list_all_resources_generator"
+    )
+    list_all_resources_generator_patch.return_value = iter(
+        [get_existing_instance("otherinstance", "ocid1.image.other")]
+    )
+    candidates = list(oci_instance.get_candidate_instances(compute_client, module))
+    # The instance is not matched on its name or availability domain, so the service does not filter by them.
+    assert len(candidates) == 1
+    list_all_resources_generator_patch.assert_called_once_with(
+        compute_client.list_instances,
+        compartment_id=module.params["compartment_id"],
+        sort_by="TIMECREATED",
+    )
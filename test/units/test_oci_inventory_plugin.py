@@ -0,0 +1,108 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import pytest
+from multiprocessing.pool import ThreadPool
+from nose.plugins.skip import SkipTest
+
+try:
+    from oci.core.models import Subnet
+    from ansible.plugins.inventory import oci as oci_inventory_plugin
+except ImportError:
+    raise SkipTest("test_oci_inventory_plugin.py requires `oci` module")
+
+OPTIONS = dict(
+    cache=True,
+    cache_timeout=7200,
+    incremental_refresh=True,
+    incremental_refresh_interval=300,
+    max_thread_count=50,
+    max_thread_count_per_region=None,
+)
+
+INSTANCE_RECORD = dict(
+    id="ocid1.instance.1", region="us-ashburn-1", fingerprint="abc", inventory=dict()
+)
+
+
+@pytest.fixture()
+def time_patch(mocker):
+    return mocker.patch.object(oci_inventory_plugin, "time", return_value=10000)
+
+
+@pytest.fixture()
+def inventory_plugin(mocker):
+    inventory_plugin = oci_inventory_plugin.InventoryModule()
+    mocker.patch.object(inventory_plugin, "_read_config_data")
+    mocker.patch.object(inventory_plugin, "read_config")
+    mocker.patch.object(
+        inventory_plugin, "_get_query_options", return_value=(["us-ashburn-1"], {}, [])
+    )
+    mocker.patch.object(inventory_plugin, "get_cache_key", return_value="oci_key")
+    mocker.patch.object(inventory_plugin, "get_option", side_effect=OPTIONS.get)
+    mocker.patch.object(inventory_plugin, "_populate")
+    mocker.patch.object(inventory_plugin, "_query", return_value=[])
+    inventory_plugin._cache = dict()
+    return inventory_plugin
+
+
+def test_parse_refreshes_incrementally(inventory_plugin, time_patch):
+    inventory_plugin._cache["oci_key"] = dict(
+        time=9000, full_build_time=5000, instance_records=[INSTANCE_RECORD]
+    )
+    inventory_plugin.parse(None, None, "oci.yml")
+    assert inventory_plugin._query.called
+    assert inventory_plugin.instance_records == {"ocid1.instance.1": INSTANCE_RECORD}
+    assert inventory_plugin._cache["oci_key"]["time"] == 10000
+    # An incremental refresh keeps the time of the last full build.
+    assert inventory_plugin._cache["oci_key"]["full_build_time"] == 5000
+
+
+def test_parse_rebuilds_in_full_after_cache_timeout(inventory_plugin, time_patch):
+    # The cache was written by an incremental refresh a minute ago, but the last full build is older than
+    # cache_timeout.
+    inventory_plugin._cache["oci_key"] = dict(
+        time=9940, full_build_time=2000, instance_records=[INSTANCE_RECORD]
+    )
+    inventory_plugin.parse(None, None, "oci.yml")
+    assert inventory_plugin._query.called
+    assert inventory_plugin.instance_records is None
+    assert inventory_plugin._cache["oci_key"]["time"] == 10000
+    assert inventory_plugin._cache["oci_key"]["full_build_time"] == 10000
+
+
+def test_parse_uses_cached_results(inventory_plugin, time_patch):
+    inventory_plugin._cache["oci_key"] = dict(
+        time=9940, full_build_time=5000, instance_records=[INSTANCE_RECORD]
+    )
+    inventory_plugin.parse(None, None, "oci.yml")
+    assert not inventory_plugin._query.called
+    inventory_plugin._populate.assert_called_once_with([dict()], [])
+
+
+def test_get_subnet_lists_each_compartment_once(mocker):
+    inventory_plugin = oci_inventory_plugin.InventoryModule()
+    mocker.patch.object(inventory_plugin, "get_virtual_nw_client_for_region")
+    mocker.patch.object(inventory_plugin, "log")
+    list_all_resources_patch = mocker.patch.object(
+        oci_inventory_plugin.oci_utils,
+        "list_all_resources",
+        side_effect=lambda target_fn, compartment_id: [
+            Subnet(id="ocid1.subnet.{0}".format(i), compartment_id=compartment_id)
+            for i in range(10)
+        ],
+    )
+    lookups = [
+        ("ocid1.subnet.{0}".format(i % 10), "ocid1.compartment.1", region)
+        for i in range(100)
+        for region in ["us-ashburn-1", "us-phoenix-1"]
+    ]
+    subnets = ThreadPool(20).map(
+        lambda lookup: inventory_plugin.get_subnet(*lookup), lookups
+    )
+    assert [subnet.id for subnet in subnets] == [lookup[0] for lookup in lookups]
+    # The subnets of the compartment are listed once for each region.
+    assert list_all_resources_patch.call_count == 2
@@ -0,0 +1,134 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+from nose.plugins.skip import SkipTest
+
+try:
+    import oci  # noqa: F401
+except ImportError:
+    raise SkipTest("test_oci_inventory_script.py requires `oci` module")
+
+# The inventory script is not a package module, so load it from its path.
+_spec = importlib.util.spec_from_file_location(
+    "oci_inventory",
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "inventory-script",
+        "oci_inventory.py",
+    ),
+)
+oci_inventory = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(oci_inventory)
+
+INVENTORY = {
+    "all": {"hosts": ["10.0.0.1", "10.0.0.2"], "vars": {}},
+    "all_hosts": {"hosts": ["10.0.0.1", "10.0.0.2"], "children": []},
+    "_meta": {
+        "hostvars": {
+            "10.0.0.1": {"display_name": "web1", "freeform_tags": {"tier": "web"}},
+            "10.0.0.2": {"display_name": "db1", "freeform_tags": {"tier": "db"}},
+        }
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def environment(tmp_path, monkeypatch):
+    (tmp_path / "key.pem").write_text("")
+    config_file = tmp_path / "config"
+    config_file.write_text(
+        "[DEFAULT]\n"
+        "user=ocid1.user.oc1..xxxxxEXAMPLExxxxx\n"
+        "fingerprint=aa:bb:cc:dd:ee:ff:00:11:22:33:44:55:66:77:88:99\n"
+        "key_file={0}\n"
+        "tenancy=ocid1.tenancy.oc1..xxxxxEXAMPLExxxxx\n"
+        "region=us-phoenix-1\n".format(tmp_path / "key.pem")
+    )
+    monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+    monkeypatch.setenv("OCI_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("OCI_INVENTORY_REGIONS", "us-phoenix-1")
+    monkeypatch.delenv("OCI_INVENTORY_COMPACT_OUTPUT", raising=False)
+    monkeypatch.delenv("OCI_INVENTORY_INCREMENTAL_REFRESH", raising=False)
+
+
+@pytest.fixture()
+def build_inventory_patch(mocker):
+    def build_inventory(self):
+        self.inventory = json.loads(json.dumps(INVENTORY))
+
+    mocker.patch.object(oci_inventory.OCIInventory, "validate_regions")
+    return mocker.patch.object(
+        oci_inventory.OCIInventory,
+        "build_inventory",
+        autospec=True,
+        side_effect=build_inventory,
+    )
+
+
+def run_inventory_script(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["oci_inventory.py"] + list(args))
+    inventory = oci_inventory.OCIInventory()
+    return inventory, capsys.readouterr().out
+
+
+def test_host_read_from_host_index(
+    tmp_path, monkeypatch, capsys, mocker, build_inventory_patch
+):
+    inventory, out = run_inventory_script(monkeypatch, capsys, "--list")
+    assert json.loads(out) == INVENTORY
+    hostvars_cache_file = inventory._get_hostvars_cache_file()
+    assert os.path.isfile(hostvars_cache_file)
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith(".tmp")]
+
+    read_from_cache_patch = mocker.patch.object(
+        oci_inventory.OCIInventory, "read_from_cache"
+    )
+    inventory, out = run_inventory_script(monkeypatch, capsys, "--host", "10.0.0.2")
+    assert json.loads(out) == INVENTORY["_meta"]["hostvars"]["10.0.0.2"]
+    # The host is read from the index, without building or reading the whole inventory.
+    assert build_inventory_patch.call_count == 1
+    assert not read_from_cache_patch.called
+    assert inventory.inventory is None
+
+
+def test_host_not_in_host_index(monkeypatch, capsys, build_inventory_patch):
+    run_inventory_script(monkeypatch, capsys, "--list")
+    inventory, out = run_inventory_script(monkeypatch, capsys, "--host", "10.0.0.3")
+    assert out.strip() == "{}"
+
+
+def test_host_read_from_cache_when_host_index_is_outdated(
+    monkeypatch, capsys, mocker, build_inventory_patch
+):
+    inventory, out = run_inventory_script(monkeypatch, capsys, "--list")
+    cache_file = inventory.params["cache_file"]
+    os.utime(inventory._get_hostvars_cache_file(), (0, 0))
+    read_from_cache_spy = mocker.spy(oci_inventory.OCIInventory, "read_from_cache")
+    inventory, out = run_inventory_script(monkeypatch, capsys, "--host", "10.0.0.1")
+    assert json.loads(out) == INVENTORY["_meta"]["hostvars"]["10.0.0.1"]
+    assert read_from_cache_spy.call_count == 1
+    assert inventory.params["cache_file"] == cache_file
+
+
+def test_compact_output(monkeypatch, capsys, build_inventory_patch):
+    inventory, out = run_inventory_script(monkeypatch, capsys, "--list")
+    inventory, compact_out = run_inventory_script(
+        monkeypatch, capsys, "--list", "--compact-output", "yes"
+    )
+    assert json.loads(compact_out) == json.loads(out) == INVENTORY
+    assert "\n" not in compact_out.strip()
+    assert len(compact_out) < len(out)
+    # The cached inventory is written compactly as well.
+    with open(inventory.params["cache_file"], "r") as cache:
+        assert json.loads(cache.read()) == INVENTORY
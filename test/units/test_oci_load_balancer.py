@@ -13,7 +13,15 @@ from ansible.module_utils.oracle import oci_utils, oci_lb_utils
 try:
     import oci
     from oci.util import to_dict
-    from oci.load_balancer.models import LoadBalancer, WorkRequest
+    from oci.load_balancer.models import (
+        LoadBalancer,
+        WorkRequest,
+        BackendSet,
+        Backend,
+        HealthChecker,
+        Listener,
+        ConnectionConfiguration,
+    )
     from oci.exceptions import ServiceError
 except ImportError:
     raise SkipTest("test_oci_load_balancer.py requires `oci` module")
@@ -71,6 +79,11 @@ def get_existing_resource_patch(mocker):
     return mocker.patch.object(oci_utils, "get_existing_resource")
 
 
+@pytest.fixture()
+def get_work_request_response_patch(mocker):
+    return mocker.patch.object(oci_lb_utils, "get_work_request_response")
+
+
 def setUpModule():
     logging.basicConfig(
         filename="/tmp/oci_ansible_module.log", filemode="a", level=logging.INFO
@@ -130,7 +143,11 @@ def test_create_load_balancer(lb_client, create_or_update_lb_resources_and_wait_
     assert result["load_balancer"]["id"] == load_balancer.id
 
 
-def test_update_load_balancer(lb_client, create_or_update_lb_resources_and_wait_patch):
+def test_update_load_balancer(
+    lb_client,
+    create_or_update_lb_resources_and_wait_patch,
+    get_work_request_response_patch,
+):
     module = get_module(dict())
     load_balancer = LoadBalancer()
     load_balancer.id = "ocid.loadbalancer.cvghs"
@@ -142,6 +159,157 @@ def test_update_load_balancer(lb_client, create_or_update_lb_resources_and_wait_
     assert create_or_update_lb_resources_and_wait_patch.called
 
 
+def get_existing_backend_set(name, backend_ip_addresses):
+    return BackendSet(
+        name=name,
+        policy="LEAST_CONNECTIONS",
+        backends=[
+            Backend(
+                name="{0}:8080".format(ip_address),
+                ip_address=ip_address,
+                port=8080,
+                weight=1,
+                backup=False,
+                drain=False,
+                offline=False,
+            )
+            for ip_address in backend_ip_addresses
+        ],
+        health_checker=HealthChecker(
+            protocol="HTTP",
+            url_path="/healthcheck",
+            port=8080,
+            return_code=200,
+            retries=3,
+            timeout_in_millis=6000,
+            interval_in_millis=30000,
+            response_body_regex="^(500|40[1348])$",
+        ),
+    )
+
+
+def get_existing_listener(name, default_backend_set_name):
+    return Listener(
+        name=name,
+        default_backend_set_name=default_backend_set_name,
+        port=80,
+        protocol="HTTP",
+        hostname_names=[],
+        connection_configuration=ConnectionConfiguration(idle_timeout=1200),
+    )
+
+
+def test_get_lb_configuration_changes_creates_missing_resources_in_tiers(lb_client):
+    module = get_module(dict())
+    load_balancer = get_load_balancer()
+    load_balancer.backend_sets = dict(
+        backend1=get_existing_backend_set("backend1", ["10.159.34.21"])
+    )
+    tiers = oci_lb_utils.get_lb_configuration_changes(lb_client, module, load_balancer)
+    assert [
+        [(resource_type, name) for resource_type, name, fn, kwargs in tier]
+        for tier in tiers
+    ] == [[("backend_set", "backend2")], [("listener", "listerner1")]]
+    assert tiers[0][0][2] == lb_client.create_backend_set
+    create_backend_set_details = tiers[0][0][3]["create_backend_set_details"]
+    assert create_backend_set_details.backends[0].port == 8080
+    assert create_backend_set_details.health_checker.retries == 3
+    create_listener_details = tiers[1][0][3]["create_listener_details"]
+    assert create_listener_details.name == "listerner1"
+    assert create_listener_details.port == 80
+
+
+def test_get_lb_configuration_changes_updates_all_backends_at_once(lb_client):
+    module = get_module(dict())
+    backends = [
+        {"ip_address": "10.159.34.{0}".format(i), "port": "8080"} for i in range(40)
+    ]
+    module.params["backend_sets"]["backend1"]["backends"] = backends
+    module.params["listeners"] = None
+    load_balancer = get_load_balancer()
+    load_balancer.backend_sets = dict(
+        backend1=get_existing_backend_set("backend1", ["10.159.34.0"]),
+        backend2=get_existing_backend_set("backend2", ["10.159.34.22"]),
+    )
+    tiers = oci_lb_utils.get_lb_configuration_changes(lb_client, module, load_balancer)
+    assert len(tiers) == 1 and len(tiers[0]) == 1
+    resource_type, name, fn, kwargs = tiers[0][0]
+    assert fn == lb_client.update_backend_set
+    assert kwargs["backend_set_name"] == "backend1"
+    assert len(kwargs["update_backend_set_details"].backends) == 40
+    assert all(
+        backend.port == 8080
+        for backend in kwargs["update_backend_set_details"].backends
+    )
+
+
+def test_get_lb_configuration_changes_no_changes(lb_client):
+    # The nested options are not typed, the ports of the params are strings and those of the SDK models are ints.
+    module = get_module(dict())
+    load_balancer = get_load_balancer()
+    load_balancer.backend_sets = dict(
+        backend1=get_existing_backend_set("backend1", ["10.159.34.21"]),
+        backend2=get_existing_backend_set("backend2", ["10.159.34.22"]),
+    )
+    load_balancer.listeners = dict(
+        listerner1=get_existing_listener("listerner1", "backend2")
+    )
+    assert (
+        oci_lb_utils.get_lb_configuration_changes(lb_client, module, load_balancer)
+        == []
+    )
+
+
+def test_get_lb_configuration_changes_updates_changed_port(lb_client):
+    module = get_module(dict())
+    module.params["listeners"]["listerner1"]["port"] = "8080"
+    load_balancer = get_load_balancer()
+    load_balancer.backend_sets = dict(
+        backend1=get_existing_backend_set("backend1", ["10.159.34.21"]),
+        backend2=get_existing_backend_set("backend2", ["10.159.34.22"]),
+    )
+    load_balancer.listeners = dict(
+        listerner1=get_existing_listener("listerner1", "backend2")
+    )
+    tiers = oci_lb_utils.get_lb_configuration_changes(lb_client, module, load_balancer)
+    assert len(tiers) == 1 and len(tiers[0]) == 1
+    resource_type, name, fn, kwargs = tiers[0][0]
+    assert fn == lb_client.update_listener
+    assert kwargs["update_listener_details"].port == 8080
+    assert (
+        kwargs["update_listener_details"].connection_configuration.idle_timeout == 1200
+    )
+
+
+def test_apply_lb_configuration_changes_waits_between_tiers(
+    lb_client, get_work_request_response_patch
+):
+    module = get_module(dict(wait=False))
+    get_work_request_response_patch.return_value = get_response(
+        200, None, WorkRequest(lifecycle_state="SUCCEEDED"), None
+    )
+    lb_client.create_backend_set.return_value = get_response(
+        200, {"opc-work-request-id": "wr1"}, None, None
+    )
+    lb_client.create_listener.return_value = get_response(
+        200, {"opc-work-request-id": "wr2"}, None, None
+    )
+    tiers = [
+        [
+            ("backend_set", "backend1", lb_client.create_backend_set, dict()),
+            ("backend_set", "backend2", lb_client.create_backend_set, dict()),
+        ],
+        [("listener", "listener1", lb_client.create_listener, dict())],
+    ]
+    oci_lb_utils.apply_lb_configuration_changes(lb_client, module, tiers)
+    assert lb_client.create_backend_set.call_count == 2
+    assert lb_client.create_listener.call_count == 1
+    assert [call[0][1] for call in get_work_request_response_patch.call_args_list] == [
+        "wr1",
+        "wr1",
+    ]
+
+
 def test_delete_load_balancer(
     lb_client, get_existing_resource_patch, delete_lb_resources_and_wait_patch
 ):
@@ -0,0 +1,508 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import base64
+import hashlib
+import os
+
+import pytest
+from nose.plugins.skip import SkipTest
+from ansible.modules.cloud.oracle import oci_object
+
+try:
+    import oci
+    from oci.object_storage.models import ObjectSummary
+    from oci.exceptions import ServiceError
+except ImportError:
+    raise SkipTest("test_oci_object.py requires `oci` module")
+
+
+class FakeModule(object):
+    def __init__(self, **kwargs):
+        self.params = kwargs
+        self.cleanup_files = []
+
+    def fail_json(self, *args, **kwargs):
+        self.exit_args = args
+        self.exit_kwargs = kwargs
+        raise Exception(kwargs["msg"])
+
+    def exit_json(self, *args, **kwargs):
+        self.exit_args = args
+        self.exit_kwargs = kwargs
+
+    def add_cleanup_file(self, path):
+        self.cleanup_files.append(path)
+
+    def atomic_move(self, src, dest):
+        os.rename(src, dest)
+
+
+CONTENT = b"0123456789abcdefghijklmnopqrstuvwxyz"
+ETAG = "etag-1"
+
+
+@pytest.fixture()
+def object_storage_client(mocker):
+    mock_object_storage_client = mocker.patch(
+        "oci.object_storage.object_storage_client.ObjectStorageClient"
+    )
+    return mock_object_storage_client.return_value
+
+
+@pytest.fixture()
+def sleep_patch(mocker):
+    return mocker.patch.object(oci_object.time, "sleep")
+
+
+@pytest.fixture()
+def part_size_patch(mocker):
+    # Download in parts of download_part_size_in_mbs * 10 bytes.
+    mocker.patch.object(oci_object, "MEBIBYTE", 10)
+
+
+def get_module(**kwargs):
+    params = {
+        "namespace_name": "mynamespace",
+        "bucket_name": "mybucket",
+        "object_name": "myobject",
+        "parallel_downloads": True,
+        "download_part_size_in_mbs": 1,
+        "parallel_download_count": 2,
+        "atomic_download": True,
+    }
+    params.update(kwargs)
+    return FakeModule(**params)
+
+
+def get_response(mocker, status, headers, chunks):
+    data = mocker.Mock()
+    data.raw.stream.return_value = iter(chunks)
+    return oci.Response(status, headers, data, None)
+
+
+def get_range_response(mocker, start, end, stop_at=None):
+    chunk_end = end + 1 if stop_at is None else stop_at
+    return get_response(
+        mocker,
+        206,
+        {"Content-Range": "bytes {0}-{1}/{2}".format(start, end, len(CONTENT))},
+        [CONTENT[start:chunk_end]],
+    )
+
+
+def get_object_headers():
+    return {"Content-Length": str(len(CONTENT)), "ETag": ETAG}
+
+
+def get_requested_range(call):
+    start, end = call[1]["range"][len("bytes=") :].split("-")
+    return int(start), int(end)
+
+
+def test_download_object_to_dest_streams_to_temporary_file(
+    mocker, tmp_path, object_storage_client
+):
+    dest = tmp_path / "myobject"
+    dest.write_bytes(b"previous content")
+    object_storage_client.get_object.return_value = get_response(
+        mocker, 200, {"ETag": ETAG}, [CONTENT[:10], CONTENT[10:20], CONTENT[20:]]
+    )
+    module = get_module()
+    atomic_move_spy = mocker.spy(module, "atomic_move")
+    headers = oci_object.download_object_to_dest(
+        object_storage_client, module, "myobject", str(dest)
+    )
+    assert headers == {"ETag": ETAG}
+    assert dest.read_bytes() == CONTENT
+    # The object is streamed in chunks to a temporary file in the directory of dest, which replaces dest.
+    object_storage_client.get_object.return_value.data.raw.stream.assert_called_once_with(
+        oci_object.CHUNK_SIZE, decode_content=False
+    )
+    tmp_dest = atomic_move_spy.call_args[0][0]
+    assert module.cleanup_files == [tmp_dest]
+    assert os.path.dirname(tmp_dest) == os.fsencode(str(tmp_path))
+    assert os.listdir(str(tmp_path)) == ["myobject"]
+
+
+def test_download_object_to_dest_keeps_dest_on_error(
+    mocker, tmp_path, object_storage_client
+):
+    dest = tmp_path / "myobject"
+    dest.write_bytes(b"previous content")
+
+    def stream(*args, **kwargs):
+        yield CONTENT[:10]
+        raise IOError("Connection reset by peer")
+
+    response = get_response(mocker, 200, {"ETag": ETAG}, [])
+    response.data.raw.stream.side_effect = stream
+    object_storage_client.get_object.return_value = response
+    module = get_module()
+    with pytest.raises(IOError):
+        oci_object.download_object_to_dest(
+            object_storage_client, module, "myobject", str(dest)
+        )
+    # dest is left untouched, and the partial temporary file is removed by the module cleanup.
+    assert dest.read_bytes() == b"previous content"
+    assert len(module.cleanup_files) == 1
+    assert os.path.isfile(module.cleanup_files[0])
+
+
+def test_download_object_to_dest_without_atomic_download(
+    mocker, tmp_path, object_storage_client
+):
+    dest = tmp_path / "myobject"
+    object_storage_client.get_object.return_value = get_response(
+        mocker, 200, {"ETag": ETAG}, [CONTENT]
+    )
+    module = get_module(atomic_download=False)
+    oci_object.download_object_to_dest(
+        object_storage_client, module, "myobject", str(dest)
+    )
+    assert dest.read_bytes() == CONTENT
+    assert module.cleanup_files == []
+
+
+def test_download_object_in_parts(
+    mocker, tmp_path, object_storage_client, part_size_patch
+):
+    object_storage_client.get_object.side_effect = lambda **kwargs: get_range_response(
+        mocker, *get_requested_range(((), kwargs))
+    )
+    dest = tmp_path / "myobject"
+    headers = oci_object.download_object(
+        object_storage_client, get_module(), "myobject", str(dest), get_object_headers()
+    )
+    assert dest.read_bytes() == CONTENT
+    assert headers == get_object_headers()
+    assert sorted(
+        get_requested_range(call)
+        for call in object_storage_client.get_object.call_args_list
+    ) == [(0, 9), (10, 19), (20, 29), (30, 35)]
+    # All the parts are requested from the same version of the object.
+    assert all(
+        call[1]["if_match"] == ETAG
+        for call in object_storage_client.get_object.call_args_list
+    )
+
+
+def test_download_object_part_resumes_short_part(
+    mocker, tmp_path, object_storage_client, sleep_patch
+):
+    object_storage_client.get_object.side_effect = [
+        get_range_response(mocker, 10, 19, stop_at=14),
+        get_range_response(mocker, 14, 19),
+    ]
+    dest = tmp_path / "myobject"
+    dest.write_bytes(b"\0" * len(CONTENT))
+    oci_object.download_object_part(
+        object_storage_client, get_module(), "myobject", str(dest), ETAG, (10, 19)
+    )
+    assert dest.read_bytes()[10:20] == CONTENT[10:20]
+    # The short read counts as a failed attempt, and the part is resumed after a backoff.
+    assert [
+        get_requested_range(call)
+        for call in object_storage_client.get_object.call_args_list
+    ] == [(10, 19), (14, 19)]
+    assert sleep_patch.call_count == 1
+
+
+def test_download_object_part_max_attempts(
+    mocker, tmp_path, object_storage_client, sleep_patch
+):
+    object_storage_client.get_object.side_effect = lambda **kwargs: get_range_response(
+        mocker, 10, 19, stop_at=10
+    )
+    dest = tmp_path / "myobject"
+    dest.write_bytes(b"\0" * len(CONTENT))
+    with pytest.raises(IOError) as exc_info:
+        oci_object.download_object_part(
+            object_storage_client, get_module(), "myobject", str(dest), ETAG, (10, 19)
+        )
+    assert "stopped at byte 10" in str(exc_info.value)
+    assert (
+        object_storage_client.get_object.call_count
+        == oci_object.DOWNLOAD_PART_MAX_ATTEMPTS
+    )
+    assert sleep_patch.call_count == oci_object.DOWNLOAD_PART_MAX_ATTEMPTS - 1
+
+
+@pytest.mark.parametrize(
+    "status,content_range",
+    [(200, None), (206, "bytes 0-35/36"), (206, "bytes 10-35/36")],
+)
+def test_download_object_part_rejects_wrong_range(
+    mocker, tmp_path, object_storage_client, sleep_patch, status, content_range
+):
+    headers = {"Content-Range": content_range} if content_range else {}
+    object_storage_client.get_object.side_effect = lambda **kwargs: get_response(
+        mocker, status, headers, [CONTENT]
+    )
+    dest = tmp_path / "myobject"
+    dest.write_bytes(b"\0" * len(CONTENT))
+    with pytest.raises(IOError):
+        oci_object.download_object_part(
+            object_storage_client, get_module(), "myobject", str(dest), ETAG, (10, 19)
+        )
+    # Nothing is written at the offset of the part.
+    assert dest.read_bytes() == b"\0" * len(CONTENT)
+
+
+def test_download_object_part_does_not_retry_service_error(
+    tmp_path, object_storage_client, sleep_patch
+):
+    object_storage_client.get_object.side_effect = ServiceError(
+        412, "IfMatchFailed", dict(), "The object was modified."
+    )
+    dest = tmp_path / "myobject"
+    dest.write_bytes(b"\0" * len(CONTENT))
+    with pytest.raises(ServiceError):
+        oci_object.download_object_part(
+            object_storage_client, get_module(), "myobject", str(dest), ETAG, (10, 19)
+        )
+    assert object_storage_client.get_object.call_count == 1
+    assert not sleep_patch.called
+
+
+def get_multipart_md5(content, part_size):
+    part_digests = [
+        hashlib.md5(content[start : start + part_size]).digest()
+        for start in range(0, len(content), part_size)
+    ]
+    return "{0}-{1}".format(
+        base64.b64encode(hashlib.md5(b"".join(part_digests)).digest()).decode("ascii"),
+        len(part_digests),
+    )
+
+
+@pytest.mark.parametrize("part_size", [5, 10, 12, 36, 100])
+def test_get_file_md5_multipart(mocker, tmp_path, part_size):
+    # Parts span several chunks, and chunks do not line up with parts.
+    mocker.patch.object(oci_object, "CHUNK_SIZE", 4)
+    file_path = tmp_path / "myfile"
+    file_path.write_bytes(CONTENT)
+    assert oci_object.get_file_md5(str(file_path), part_size) == get_multipart_md5(
+        CONTENT, part_size
+    )
+    assert oci_object.get_file_md5(str(file_path)) == base64.b64encode(
+        hashlib.md5(CONTENT).digest()
+    ).decode("ascii")
+
+
+def test_is_file_same_as_object_multipart(mocker, tmp_path):
+    mocker.patch.object(oci_object, "DEFAULT_PART_SIZE", 10)
+    file_path = tmp_path / "myfile"
+    file_path.write_bytes(CONTENT)
+    headers = {
+        "Content-Length": str(len(CONTENT)),
+        "opc-multipart-md5": get_multipart_md5(CONTENT, 10),
+    }
+    assert get_multipart_md5(CONTENT, 10).endswith("-4")
+    assert oci_object.is_file_same_as_object(str(file_path), headers)
+    # The multipart checksum is not the MD5 hash of the whole file.
+    headers["opc-multipart-md5"] = "{0}-1".format(
+        base64.b64encode(hashlib.md5(CONTENT).digest()).decode("ascii")
+    )
+    assert not oci_object.is_file_same_as_object(str(file_path), headers)
+
+
+def test_is_file_same_as_object_skips_checksum_on_size_mismatch(mocker, tmp_path):
+    get_file_md5_patch = mocker.patch.object(oci_object, "get_file_md5")
+    file_path = tmp_path / "myfile"
+    file_path.write_bytes(CONTENT)
+    headers = {
+        "Content-Length": str(len(CONTENT) + 1),
+        "Content-MD5": base64.b64encode(hashlib.md5(CONTENT).digest()).decode("ascii"),
+    }
+    assert not oci_object.is_file_same_as_object(str(file_path), headers)
+    assert not get_file_md5_patch.called
+    assert not oci_object.is_file_same_as_object(str(tmp_path / "missing"), headers)
+
+
+def test_get_object_unchanged_with_multipart_md5(
+    mocker, tmp_path, object_storage_client
+):
+    mocker.patch.object(oci_object, "DEFAULT_PART_SIZE", 10)
+    dest = tmp_path / "myobject"
+    dest.write_bytes(CONTENT)
+    object_storage_client.head_object.return_value = oci.Response(
+        200,
+        {
+            "Content-Length": str(len(CONTENT)),
+            "opc-multipart-md5": get_multipart_md5(CONTENT, 10),
+            "ETag": ETAG,
+        },
+        None,
+        None,
+    )
+    result = oci_object.get_object(object_storage_client, get_module(dest=str(dest)))
+    assert result["changed"] is False
+    assert not object_storage_client.get_object.called
+
+
+def get_md5(content):
+    return base64.b64encode(hashlib.md5(content).digest()).decode("ascii")
+
+
+def get_sync_module(**kwargs):
+    params = {
+        "src_dir": None,
+        "dest_dir": None,
+        "prefix": "backup/",
+        "parallel_transfer_count": 2,
+        "force": True,
+        "delete": False,
+        "multipart_upload": False,
+    }
+    params.update(kwargs)
+    return get_module(object_name=None, **params)
+
+
+@pytest.fixture()
+def list_all_resources_patch(mocker):
+    objects = [
+        ObjectSummary(
+            name="backup/" + name, size=len(content), md5=get_md5(content), etag=ETAG
+        )
+        for name, content in [
+            ("same.txt", b"same"),
+            ("changed.txt", b"old content"),
+            ("sub/same.txt", b"nested"),
+            ("extra.txt", b"extra"),
+        ]
+    ]
+    # Folders are represented by zero-byte objects, which are not synced.
+    objects.append(
+        ObjectSummary(name="backup/sub/", size=0, md5=get_md5(b""), etag=ETAG)
+    )
+    return mocker.patch.object(
+        oci_object.oci_utils,
+        "list_all_resources",
+        return_value=mocker.Mock(objects=objects),
+    )
+
+
+@pytest.fixture()
+def sync_dir(tmp_path):
+    sync_dir = tmp_path / "sync"
+    (sync_dir / "sub").mkdir(parents=True)
+    (sync_dir / "same.txt").write_bytes(b"same")
+    (sync_dir / "changed.txt").write_bytes(b"new content")
+    (sync_dir / "sub" / "same.txt").write_bytes(b"nested")
+    (sync_dir / "sub" / "new.txt").write_bytes(b"new")
+    return sync_dir
+
+
+@pytest.mark.parametrize(
+    "force,transferred",
+    [
+        (True, ["backup/changed.txt", "backup/sub/new.txt"]),
+        (False, ["backup/sub/new.txt"]),
+    ],
+)
+def test_sync_directory_upload(
+    mocker,
+    object_storage_client,
+    list_all_resources_patch,
+    sync_dir,
+    force,
+    transferred,
+):
+    upload_file_patch = mocker.patch.object(oci_object, "upload_file")
+    module = get_sync_module(src_dir=str(sync_dir), force=force)
+    result = oci_object.sync_directory(object_storage_client, module)
+    # The bucket is listed once, and only the files which differ from their object are uploaded.
+    assert list_all_resources_patch.call_count == 1
+    assert list_all_resources_patch.call_args[1]["prefix"] == "backup/"
+    assert (
+        sorted(call[0][3] for call in upload_file_patch.call_args_list) == transferred
+    )
+    assert result == dict(changed=True, transferred=transferred, deleted=[])
+    assert not object_storage_client.delete_object.called
+
+
+def test_sync_directory_upload_delete(
+    mocker, object_storage_client, list_all_resources_patch, sync_dir
+):
+    mocker.patch.object(oci_object, "upload_file")
+    module = get_sync_module(src_dir=str(sync_dir), delete=True)
+    result = oci_object.sync_directory(object_storage_client, module)
+    assert result["deleted"] == ["backup/extra.txt"]
+    assert [
+        call[1]["object_name"]
+        for call in object_storage_client.delete_object.call_args_list
+    ] == ["backup/extra.txt"]
+
+
+def test_sync_directory_upload_unchanged(
+    mocker, object_storage_client, list_all_resources_patch, tmp_path
+):
+    upload_file_patch = mocker.patch.object(oci_object, "upload_file")
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "same.txt").write_bytes(b"same")
+    module = get_sync_module(src_dir=str(src_dir))
+    result = oci_object.sync_directory(object_storage_client, module)
+    assert result == dict(changed=False, transferred=[], deleted=[])
+    assert not upload_file_patch.called
+
+
+def test_sync_directory_download(
+    mocker, object_storage_client, list_all_resources_patch, sync_dir
+):
+    def download_object_to_dest(
+        object_storage_client, module, object_name, dest, object_headers
+    ):
+        with open(dest, "wb") as dest_file:
+            dest_file.write(object_name.encode("utf-8"))
+
+    download_patch = mocker.patch.object(
+        oci_object, "download_object_to_dest", side_effect=download_object_to_dest
+    )
+    module = get_sync_module(dest_dir=str(sync_dir), delete=True)
+    result = oci_object.sync_directory(object_storage_client, module)
+    # The objects which differ from their file, or have no file, are downloaded to their path in dest_dir.
+    assert sorted(call[0][2] for call in download_patch.call_args_list) == [
+        "backup/changed.txt",
+        "backup/extra.txt",
+    ]
+    assert (sync_dir / "changed.txt").read_bytes() == b"backup/changed.txt"
+    assert (sync_dir / "same.txt").read_bytes() == b"same"
+    # The files which have no object are deleted.
+    assert not (sync_dir / "sub" / "new.txt").exists()
+    assert result == dict(
+        changed=True,
+        transferred=["backup/changed.txt", "backup/extra.txt"],
+        deleted=[str(sync_dir / "sub" / "new.txt")],
+    )
+
+
+def test_sync_directory_download_creates_directories(
+    mocker, object_storage_client, list_all_resources_patch, tmp_path
+):
+    download_patch = mocker.patch.object(oci_object, "download_object_to_dest")
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+    module = get_sync_module(dest_dir=str(dest_dir))
+    result = oci_object.sync_directory(object_storage_client, module)
+    assert len(result["transferred"]) == 4
+    assert download_patch.call_count == 4
+    assert (dest_dir / "sub").is_dir()
+
+
+def test_sync_directory_download_rejects_path_outside_dest_dir(
+    mocker, object_storage_client, list_all_resources_patch, tmp_path
+):
+    download_patch = mocker.patch.object(oci_object, "download_object_to_dest")
+    list_all_resources_patch.return_value.objects.append(
+        ObjectSummary(name="backup/../escape.txt", size=1, md5=get_md5(b"x"), etag=ETAG)
+    )
+    module = get_sync_module(dest_dir=str(tmp_path))
+    with pytest.raises(Exception) as exc_info:
+        oci_object.sync_directory(object_storage_client, module)
+    assert "cannot be downloaded" in str(exc_info.value)
+    assert not download_patch.called
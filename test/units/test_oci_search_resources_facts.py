@@ -0,0 +1,184 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import pytest
+from nose.plugins.skip import SkipTest
+from ansible.modules.cloud.oracle import oci_search_resources_facts
+from ansible.module_utils.oracle import oci_utils, oci_common_utils
+
+try:
+    import oci
+    from oci.core import ComputeClient, VirtualNetworkClient
+    from oci.core.models import Instance, Vcn
+    from oci.resource_search.models import ResourceSummary
+    from oci.exceptions import ServiceError
+except ImportError:
+    raise SkipTest("test_oci_search_resources_facts.py requires `oci` module")
+
+
+class FakeModule(object):
+    def __init__(self, **kwargs):
+        self.params = kwargs
+
+    def fail_json(self, *args, **kwargs):
+        self.exit_args = args
+        self.exit_kwargs = kwargs
+        raise Exception(kwargs["msg"])
+
+    def exit_json(self, *args, **kwargs):
+        self.exit_args = args
+        self.exit_kwargs = kwargs
+
+
+@pytest.fixture()
+def resource_search_client(mocker):
+    mock_resource_search_client = mocker.patch(
+        "oci.resource_search.resource_search_client.ResourceSearchClient"
+    )
+    return mock_resource_search_client.return_value
+
+
+@pytest.fixture()
+def list_all_resources_generator_patch(mocker):
+    return mocker.patch.object(oci_utils, "list_all_resources_generator")
+
+
+@pytest.fixture()
+def create_service_client_patch(mocker):
+    return mocker.patch.object(oci_utils, "create_service_client")
+
+
+def get_module(**kwargs):
+    params = {
+        "type": "Structured",
+        "matching_context_type": "NONE",
+        "query": "query all resources",
+        "text": None,
+        "max_results": None,
+        "page_size": 500,
+        "hydrate": False,
+        "hydration_parallelism": 10,
+        "dest": None,
+    }
+    params.update(kwargs)
+    return FakeModule(**params)
+
+
+def get_resource_summaries(count, resource_type="Instance"):
+    return [
+        ResourceSummary(
+            resource_type=resource_type,
+            identifier="ocid1.{0}.{1}".format(resource_type.lower(), i),
+        )
+        for i in range(count)
+    ]
+
+
+def get_response(data):
+    return oci.Response(200, None, data, None)
+
+
+def test_get_search_result_batches(
+    resource_search_client, list_all_resources_generator_patch
+):
+    module = get_module(page_size=2)
+    list_all_resources_generator_patch.return_value = iter(get_resource_summaries(5))
+    batches = list(
+        oci_search_resources_facts.get_search_result_batches(
+            module, resource_search_client
+        )
+    )
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [result["identifier"] for batch in batches for result in batch] == [
+        "ocid1.instance.{0}".format(i) for i in range(5)
+    ]
+    assert list_all_resources_generator_patch.call_args[1]["limit"] == 2
+
+
+def test_get_search_result_batches_max_results(
+    resource_search_client, list_all_resources_generator_patch
+):
+    module = get_module(page_size=500, max_results=3)
+    resource_summaries = iter(get_resource_summaries(10))
+    list_all_resources_generator_patch.return_value = resource_summaries
+    batches = list(
+        oci_search_resources_facts.get_search_result_batches(
+            module, resource_search_client
+        )
+    )
+    assert [len(batch) for batch in batches] == [3]
+    # Only a page of max_results is requested, and the results after max_results are not fetched.
+    assert list_all_resources_generator_patch.call_args[1]["limit"] == 3
+    assert len(list(resource_summaries)) == 7
+
+
+def test_get_search_result_batches_hydrate(
+    mocker,
+    resource_search_client,
+    list_all_resources_generator_patch,
+    create_service_client_patch,
+):
+    module = get_module(page_size=2, hydrate=True)
+    list_all_resources_generator_patch.return_value = iter(
+        get_resource_summaries(3)
+        + get_resource_summaries(1, "Vcn")
+        + get_resource_summaries(1, "Tag")
+    )
+    compute_client = mocker.Mock()
+    virtual_network_client = mocker.Mock()
+    clients = {
+        ComputeClient: compute_client,
+        VirtualNetworkClient: virtual_network_client,
+    }
+    create_service_client_patch.side_effect = lambda module, client_class: clients[
+        client_class
+    ]
+
+    def get_instance(instance_id):
+        if instance_id == "ocid1.instance.1":
+            raise ServiceError(404, "NotAuthorizedOrNotFound", dict(), "")
+        return get_response(Instance(id=instance_id))
+
+    compute_client.get_instance.side_effect = get_instance
+    virtual_network_client.get_vcn.side_effect = lambda vcn_id: get_response(
+        Vcn(id=vcn_id)
+    )
+    results = [
+        result
+        for batch in oci_search_resources_facts.get_search_result_batches(
+            module, resource_search_client
+        )
+        for result in batch
+    ]
+    # One client is created for each client class, before the hydration threads start.
+    assert [call[0][1] for call in create_service_client_patch.call_args_list] == [
+        ComputeClient,
+        VirtualNetworkClient,
+    ]
+    assert [
+        result["resource_details"] and result["resource_details"]["id"]
+        for result in results
+    ] == ["ocid1.instance.0", None, "ocid1.instance.2", "ocid1.vcn.0", None]
+
+
+def test_get_search_result_batches_hydrate_fails_outside_the_pool(
+    mocker,
+    resource_search_client,
+    list_all_resources_generator_patch,
+    create_service_client_patch,
+):
+    module = get_module(hydrate=True)
+    list_all_resources_generator_patch.return_value = iter(get_resource_summaries(3))
+    create_service_client_patch.side_effect = Exception("Invalid config")
+    map_in_pool_patch = mocker.patch.object(oci_common_utils, "map_in_pool")
+    with pytest.raises(Exception) as exc_info:
+        list(
+            oci_search_resources_facts.get_search_result_batches(
+                module, resource_search_client
+            )
+        )
+    assert "Invalid config" in str(exc_info.value)
+    assert not map_in_pool_patch.called
@@ -0,0 +1,211 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import pytest
+from nose.plugins.skip import SkipTest
+from ansible.module_utils.oracle import oci_utils
+
+try:
+    from oci.core.models import VolumeAttachment, BootVolumeAttachment
+    from oci.identity.models import Compartment
+    from oci.exceptions import ServiceError
+except ImportError:
+    raise SkipTest("test_oci_utils.py requires `oci` module")
+
+
+@pytest.fixture(autouse=True)
+def tenancy_attachments_patch(mocker):
+    return mocker.patch.object(oci_utils, "_tenancy_attachments", dict())
+
+
+@pytest.fixture()
+def get_oci_config_patch(mocker):
+    return mocker.patch.object(
+        oci_utils, "get_oci_config", return_value=dict(tenancy="ocid1.tenancy.1")
+    )
+
+
+@pytest.fixture()
+def create_service_client_patch(mocker):
+    return mocker.patch.object(oci_utils, "create_service_client")
+
+
+@pytest.fixture()
+def list_all_resources_patch(mocker):
+    return mocker.patch.object(oci_utils, "list_all_resources")
+
+
+def get_volume_attachment(compartment_id, volume_id, lifecycle_state="ATTACHED"):
+    return VolumeAttachment(
+        compartment_id=compartment_id,
+        volume_id=volume_id,
+        lifecycle_state=lifecycle_state,
+    )
+
+
+def list_attachments_fn():
+    pass
+
+
+def list_resources(compartments, attachments_by_compartment):
+    def side_effect(target_fn, **kwargs):
+        if target_fn is list_attachments_fn:
+            if kwargs["compartment_id"] not in attachments_by_compartment:
+                raise ServiceError(404, "NotAuthorizedOrNotFound", dict(), "")
+            return attachments_by_compartment[kwargs["compartment_id"]]
+        return compartments
+
+    return side_effect
+
+
+def test_get_attached_instances_info_scans_all_compartments(
+    get_oci_config_patch, create_service_client_patch, list_all_resources_patch
+):
+    list_all_resources_patch.side_effect = list_resources(
+        [
+            Compartment(id="ocid1.compartment.1", lifecycle_state="ACTIVE"),
+            Compartment(id="ocid1.compartment.2", lifecycle_state="ACTIVE"),
+            Compartment(id="ocid1.compartment.3", lifecycle_state="DELETED"),
+        ],
+        {
+            "ocid1.tenancy.1": [],
+            "ocid1.compartment.1": [
+                get_volume_attachment("ocid1.compartment.1", "ocid1.volume.1"),
+                get_volume_attachment("ocid1.compartment.1", "ocid1.volume.2"),
+            ],
+            "ocid1.compartment.2": [
+                get_volume_attachment(
+                    "ocid1.compartment.2", "ocid1.volume.1", "DETACHED"
+                ),
+            ],
+        },
+    )
+    result = oci_utils.get_attached_instances_info(
+        None,
+        True,
+        list_attachments_fn,
+        dict(volume_id="ocid1.volume.1", compartment_id="ocid1.compartment.1"),
+    )
+    assert len(result) == 1
+    assert result[0]["volume_id"] == "ocid1.volume.1"
+    assert result[0]["lifecycle_state"] == "ATTACHED"
+    scanned_compartment_ids = [
+        call[1]["compartment_id"]
+        for call in list_all_resources_patch.call_args_list
+        if call[0][0] is list_attachments_fn
+    ]
+    # The root compartment is scanned, the deleted compartment is not, and the volume is not a filter of the scan.
+    assert sorted(scanned_compartment_ids) == [
+        "ocid1.compartment.1",
+        "ocid1.compartment.2",
+        "ocid1.tenancy.1",
+    ]
+    assert all(
+        "volume_id" not in call[1] for call in list_all_resources_patch.call_args_list
+    )
+
+
+def test_get_attached_instances_info_reuses_tenancy_scan(
+    get_oci_config_patch, create_service_client_patch, list_all_resources_patch
+):
+    list_all_resources_patch.side_effect = list_resources(
+        [Compartment(id="ocid1.compartment.1", lifecycle_state="ACTIVE")],
+        {
+            "ocid1.compartment.1": [
+                get_volume_attachment("ocid1.compartment.1", "ocid1.volume.1"),
+                get_volume_attachment("ocid1.compartment.1", "ocid1.volume.2"),
+            ]
+        },
+    )
+    for volume_id in ["ocid1.volume.1", "ocid1.volume.2"]:
+        result = oci_utils.get_attached_instances_info(
+            None,
+            True,
+            list_attachments_fn,
+            dict(volume_id=volume_id, compartment_id="ocid1.compartment.1"),
+        )
+        assert result[0]["volume_id"] == volume_id
+    assert (
+        oci_utils.get_attached_instances_info(
+            None,
+            True,
+            list_attachments_fn,
+            dict(volume_id="ocid1.volume.3", compartment_id="ocid1.compartment.1"),
+        )
+        is None
+    )
+    # One call to list the compartments, and one for each of the two compartments.
+    assert list_all_resources_patch.call_count == 3
+
+
+def test_get_attached_instances_info_finds_boot_volume_in_other_compartment(
+    get_oci_config_patch, create_service_client_patch, list_all_resources_patch
+):
+    # The boot volume modules pass the compartment and availability domain of the boot volume, but the instance
+    # attached to it may live in any compartment of the tenancy.
+    list_all_resources_patch.side_effect = list_resources(
+        [Compartment(id="ocid1.compartment.2", lifecycle_state="ACTIVE")],
+        {
+            "ocid1.tenancy.1": [],
+            "ocid1.compartment.2": [
+                BootVolumeAttachment(
+                    compartment_id="ocid1.compartment.2",
+                    boot_volume_id="ocid1.bootvolume.1",
+                    instance_id="ocid1.instance.1",
+                    lifecycle_state="ATTACHED",
+                )
+            ],
+        },
+    )
+    result = oci_utils.get_attached_instances_info(
+        None,
+        True,
+        list_attachments_fn,
+        {
+            "boot_volume_id": "ocid1.bootvolume.1",
+            "availability_domain": "IwGV:US-ASHBURN-AD-1",
+            "compartment_id": "ocid1.compartment.1",
+        },
+    )
+    assert len(result) == 1
+    assert result[0]["instance_id"] == "ocid1.instance.1"
+    for call in list_all_resources_patch.call_args_list:
+        if call[0][0] is list_attachments_fn:
+            assert call[1]["availability_domain"] == "IwGV:US-ASHBURN-AD-1"
+            assert "boot_volume_id" not in call[1]
+
+
+def test_get_attached_instances_info_raises_other_errors(
+    get_oci_config_patch, create_service_client_patch, list_all_resources_patch
+):
+    def side_effect(target_fn, **kwargs):
+        if target_fn is list_attachments_fn:
+            raise ServiceError(500, "InternalServerError", dict(), "")
+        return []
+
+    list_all_resources_patch.side_effect = side_effect
+    with pytest.raises(ServiceError):
+        oci_utils.get_attached_instances_info(
+            None,
+            True,
+            list_attachments_fn,
+            dict(volume_id="ocid1.volume.1", compartment_id="ocid1.compartment.1"),
+        )
+
+
+def test_get_attached_instances_info_without_lookup(list_all_resources_patch):
+    list_all_resources_patch.return_value = [
+        get_volume_attachment("ocid1.compartment.1", "ocid1.volume.1", "DETACHED")
+    ]
+    assert (
+        oci_utils.get_attached_instances_info(
+            None,
+            False,
+            list_attachments_fn,
+            dict(volume_id="ocid1.volume.1", compartment_id="ocid1.compartment.1"),
+        )
+        is None
+    )
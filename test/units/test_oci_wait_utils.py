@@ -0,0 +1,212 @@
+# Copyright (c) 2020 Oracle and/or its affiliates.
+# This software is made available to you under the terms of the GPL 3.0 license or the Apache 2.0 license.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# Apache License v2.0
+# See LICENSE.TXT for details.
+
+import pytest
+from nose.plugins.skip import SkipTest
+from ansible.module_utils.oracle import oci_wait_utils
+
+try:
+    import oci
+    from oci.core.models import Instance
+    from oci.exceptions import ServiceError, MaximumWaitTimeExceeded
+    from oci.waiter import WAIT_RESOURCE_NOT_FOUND
+except ImportError:
+    raise SkipTest("test_oci_wait_utils.py requires `oci` module")
+
+
+@pytest.fixture()
+def sleep_patch(mocker):
+    return mocker.patch.object(oci_wait_utils.time, "sleep")
+
+
+def get_response(instance_id, lifecycle_state):
+    return oci.Response(
+        200, None, Instance(id=instance_id, lifecycle_state=lifecycle_state), None
+    )
+
+
+def get_fetch_fn(instance_id, lifecycle_states):
+    # Return a fetch function which returns the instance in each of lifecycle_states in turn.
+    responses = [get_response(instance_id, state) for state in lifecycle_states]
+    fetch_fn = lambda: responses.pop(0) if len(responses) > 1 else responses[0]
+    return fetch_fn
+
+
+def is_running(response):
+    return response.data.lifecycle_state == "RUNNING"
+
+
+def test_get_polling_interval_grows_up_to_the_maximum():
+    initial_interval, max_interval = oci_wait_utils._POLLING_INTERVALS["instance"]
+    for times_checked in range(10):
+        interval = min(initial_interval * 2**times_checked, max_interval)
+        polling_interval = oci_wait_utils.get_polling_interval(
+            "instance", times_checked
+        )
+        assert interval / 2.0 <= polling_interval <= interval
+
+
+def test_get_polling_interval_unknown_resource_type():
+    assert oci_wait_utils.get_polling_interval("unknown", 0) <= 1
+
+
+def test_multi_resource_waiter_waits_for_all_resources(sleep_patch):
+    waiter = oci_wait_utils.MultiResourceWaiter(is_running, resource_type="instance")
+    waiter.add(
+        "instance1",
+        None,
+        get_response("ocid1.instance.1", "PROVISIONING"),
+        get_fetch_fn("ocid1.instance.1", ["RUNNING"]),
+    )
+    waiter.add(
+        "instance2",
+        None,
+        get_response("ocid1.instance.2", "PROVISIONING"),
+        get_fetch_fn("ocid1.instance.2", ["PROVISIONING", "PROVISIONING", "RUNNING"]),
+    )
+    results = waiter.wait()
+    assert results["instance1"].data.id == "ocid1.instance.1"
+    assert results["instance2"].data.lifecycle_state == "RUNNING"
+    # The resources are checked in rounds, not one after the other.
+    assert sleep_patch.call_count == 3
+
+
+def test_multi_resource_waiter_checks_resources_with_list_fn(mocker, sleep_patch):
+    list_fn = mocker.Mock(
+        side_effect=[
+            [
+                Instance(id="ocid1.instance.1", lifecycle_state="RUNNING"),
+                Instance(id="ocid1.instance.2", lifecycle_state="PROVISIONING"),
+            ],
+            [
+                Instance(id="ocid1.instance.1", lifecycle_state="RUNNING"),
+                Instance(id="ocid1.instance.2", lifecycle_state="RUNNING"),
+            ],
+        ]
+    )
+    fetch_fn = mocker.Mock(return_value=get_response("ocid1.instance.1", "RUNNING"))
+    waiter = oci_wait_utils.MultiResourceWaiter(
+        is_running, resource_type="instance", list_fn=list_fn
+    )
+    waiter.add(
+        "instance1", None, get_response("ocid1.instance.1", "PROVISIONING"), fetch_fn
+    )
+    waiter.add(
+        "instance2", None, get_response("ocid1.instance.2", "PROVISIONING"), fetch_fn
+    )
+    waiter.wait()
+    assert list_fn.call_count == 2
+    # Each resource is only fetched once it is found ready in the list.
+    assert fetch_fn.call_count == 2
+
+
+def test_multi_resource_waiter_succeed_on_not_found(sleep_patch):
+    def fetch_fn():
+        raise ServiceError(404, "NotAuthorizedOrNotFound", dict(), "Not found")
+
+    waiter = oci_wait_utils.MultiResourceWaiter(
+        lambda r: r.data.lifecycle_state == "TERMINATED", succeed_on_not_found=True
+    )
+    waiter.add(
+        "instance1", None, get_response("ocid1.instance.1", "TERMINATING"), fetch_fn
+    )
+    assert waiter.wait()["instance1"] is WAIT_RESOURCE_NOT_FOUND
+
+
+def test_multi_resource_waiter_raises_when_not_found(sleep_patch):
+    def fetch_fn():
+        raise ServiceError(404, "NotAuthorizedOrNotFound", dict(), "Not found")
+
+    waiter = oci_wait_utils.MultiResourceWaiter(is_running)
+    waiter.add(
+        "instance1", None, get_response("ocid1.instance.1", "TERMINATING"), fetch_fn
+    )
+    with pytest.raises(ServiceError):
+        waiter.wait()
+
+
+def test_multi_resource_waiter_max_wait_time_exceeded(sleep_patch):
+    waiter = oci_wait_utils.MultiResourceWaiter(is_running, max_wait_seconds=0)
+    waiter.add(
+        "instance1",
+        None,
+        get_response("ocid1.instance.1", "PROVISIONING"),
+        get_fetch_fn("ocid1.instance.1", ["PROVISIONING"]),
+    )
+    with pytest.raises(MaximumWaitTimeExceeded):
+        waiter.wait()
+
+
+def test_call_until_found_retries_while_not_found(mocker, sleep_patch):
+    fn = mocker.Mock(
+        side_effect=[
+            ServiceError(404, "NotAuthorizedOrNotFound", dict(), "Not found"),
+            ServiceError(404, "NotAuthorizedOrNotFound", dict(), "Not found"),
+            get_response("ocid1.compartment.1", "ACTIVE"),
+        ]
+    )
+    response = oci_wait_utils.call_until_found(
+        fn, resource_type="compartment", compartment_id="ocid1.compartment.1"
+    )
+    assert response.data.id == "ocid1.compartment.1"
+    assert fn.call_count == 3
+    # Much less than the fixed 15 seconds wait it replaces.
+    assert sum(call[0][0] for call in sleep_patch.call_args_list) <= 3
+
+
+def test_call_until_found_raises_other_errors(mocker, sleep_patch):
+    fn = mocker.Mock(
+        side_effect=ServiceError(500, "InternalServerError", dict(), "Error")
+    )
+    with pytest.raises(ServiceError):
+        oci_wait_utils.call_until_found(fn, compartment_id="ocid1.compartment.1")
+    assert fn.call_count == 1
+    assert sleep_patch.call_count == 0
+
+
+def test_call_until_found_max_wait_time_exceeded(mocker, sleep_patch):
+    fn = mocker.Mock(
+        side_effect=ServiceError(404, "NotAuthorizedOrNotFound", dict(), "Not found")
+    )
+    with pytest.raises(ServiceError):
+        oci_wait_utils.call_until_found(fn, max_wait_seconds=0)
+
+
+def test_multi_resource_waiter_refreshes_security_token_on_401(mocker, sleep_patch):
+    client = mocker.Mock()
+    client.base_client.is_instance_principal_or_resource_principal_signer.return_value = (
+        True
+    )
+    fetch_fn = mocker.Mock(
+        side_effect=[
+            ServiceError(401, "NotAuthenticated", dict(), "Not authenticated"),
+            get_response("ocid1.instance.1", "RUNNING"),
+        ]
+    )
+    waiter = oci_wait_utils.MultiResourceWaiter(is_running)
+    waiter.add(
+        "instance1", client, get_response("ocid1.instance.1", "PROVISIONING"), fetch_fn
+    )
+    assert waiter.wait()["instance1"].data.lifecycle_state == "RUNNING"
+    assert client.base_client.signer.refresh_security_token.call_count == 1
+    assert fetch_fn.call_count == 2
+
+
+def test_multi_resource_waiter_raises_401_without_principal_signer(mocker, sleep_patch):
+    client = mocker.Mock()
+    client.base_client.is_instance_principal_or_resource_principal_signer.return_value = (
+        False
+    )
+    fetch_fn = mocker.Mock(
+        side_effect=ServiceError(401, "NotAuthenticated", dict(), "Not authenticated")
+    )
+    waiter = oci_wait_utils.MultiResourceWaiter(is_running)
+    waiter.add(
+        "instance1", client, get_response("ocid1.instance.1", "PROVISIONING"), fetch_fn
+    )
+    with pytest.raises(ServiceError):
+        waiter.wait()
+    assert client.base_client.signer.refresh_security_token.call_count == 0